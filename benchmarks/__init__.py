@@ -0,0 +1,4 @@
+"""Offline benchmark suite for GDAL MCP tools on synthetic data.
+
+Run ``python -m benchmarks run --help`` for usage.
+"""
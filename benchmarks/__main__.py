@@ -0,0 +1,80 @@
+"""Command line entry point: ``python -m benchmarks``."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import typer
+
+from benchmarks.suite import DEFAULT_THRESHOLD, PRESETS, CaseResult, compare, run_suite
+
+app = typer.Typer(add_completion=False, no_args_is_help=True)
+
+
+def _report(rows: list[dict], threshold: float) -> int:
+    regressions = [row for row in rows if row["status"] in ("regression", "error")]
+    for row in rows:
+        ratio = f"{row['ratio']:.2f}x" if row["ratio"] is not None else "-"
+        typer.echo(f"{row['status']:<12} {ratio:>7}  {row['case']}")
+    typer.echo(
+        f"{len(regressions)} regression(s) beyond {threshold:.0%} across {len(rows)} case(s)"
+    )
+    return 1 if regressions else 0
+
+
+@app.command(help="Generate synthetic inputs, time every tool and write JSON results")
+def run(
+    preset: str = typer.Option("smoke", help=f"Input sizes: {', '.join(PRESETS)}"),
+    data_dir: str = typer.Option(
+        ".bench-data", help="Directory for generated inputs (reused between runs)"
+    ),
+    output: str = typer.Option("bench-results.json", help="Results JSON file"),
+    repeat: int = typer.Option(3, min=1, help="Timed runs per case"),
+    only: str = typer.Option(
+        "", help="Comma-separated case prefixes to run (e.g. 'raster_,vector_buffer')"
+    ),
+    baseline: str = typer.Option("", help="Baseline results JSON to compare with"),
+    threshold: float = typer.Option(DEFAULT_THRESHOLD, help="Allowed median slowdown"),
+    save_baseline: bool = typer.Option(False, help="Also write the results to --baseline"),
+) -> None:
+    """Run the suite and optionally fail on regressions against a baseline."""
+    if preset not in PRESETS:
+        raise typer.BadParameter(f"preset must be one of: {', '.join(PRESETS)}")
+
+    def progress(result: CaseResult) -> None:
+        timing = f"{result.median:.3f}s" if result.median is not None else result.error
+        typer.echo(f"{result.name:<60} {timing}")
+
+    prefixes = [prefix.strip() for prefix in only.split(",") if prefix.strip()]
+    results = run_suite(
+        PRESETS[preset], Path(data_dir), repeat=repeat, only=prefixes, progress=progress
+    )
+    Path(output).write_text(json.dumps(results, indent=2))
+    typer.echo(f"Results written to {output}")
+
+    if not baseline:
+        return
+    if save_baseline:
+        Path(baseline).write_text(json.dumps(results, indent=2))
+        typer.echo(f"Baseline written to {baseline}")
+        return
+    rows = compare(results, json.loads(Path(baseline).read_text()), threshold)
+    raise typer.Exit(_report(rows, threshold))
+
+
+@app.command(name="compare", help="Compare two results files and fail on regressions")
+def compare_files(
+    current: str = typer.Argument(..., help="Results JSON from the run under test"),
+    baseline: str = typer.Argument(..., help="Baseline results JSON"),
+    threshold: float = typer.Option(DEFAULT_THRESHOLD, help="Allowed median slowdown"),
+) -> None:
+    """Print a per-case comparison; exit with status 1 on any regression."""
+    rows = compare(
+        json.loads(Path(current).read_text()), json.loads(Path(baseline).read_text()), threshold
+    )
+    raise typer.Exit(_report(rows, threshold))
+
+
+if __name__ == "__main__":
+    app()
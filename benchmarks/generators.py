@@ -0,0 +1,237 @@
+"""Deterministic synthetic rasters and vector layers for benchmarks.
+
+Everything is generated from a seed, window by window or chunk by chunk, so a
+50k x 50k raster or a 10M-feature layer never has to fit in memory and the
+same parameters always produce byte-identical inputs.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Literal
+
+import geopandas as gpd
+import numpy as np
+import pyogrio
+import rasterio
+import shapely
+from rasterio.transform import from_origin
+from rasterio.windows import Window
+
+__all__ = [
+    "RasterSpec",
+    "VectorSpec",
+    "spec_dict",
+    "write_raster",
+    "write_vector",
+]
+
+# Projected CRS (UTM 33N) so buffers, simplification tolerances and pixel
+# sizes are in metres
+DEFAULT_CRS = "EPSG:32633"
+ORIGIN_X = 300_000.0
+ORIGIN_Y = 6_000_000.0
+
+# Fraction of columns along the left edge set to nodata, plus the fraction of
+# random pixels set to nodata anywhere
+NODATA_EDGE = 0.03
+NODATA_SPRINKLE = 0.02
+
+# Rows per write for striped rasters and features per write for vectors
+STRIP_ROWS = 512
+FEATURE_CHUNK = 250_000
+
+GeometryKind = Literal["point", "line", "polygon"]
+
+
+@dataclass(frozen=True, slots=True)
+class RasterSpec:
+    """Parameters of a synthetic raster.
+
+    Attributes:
+        size: Width and height in pixels.
+        bands: Number of bands.
+        dtype: Numpy dtype name.
+        tiled: Internal tiles (True) or strips (False).
+        block: Tile edge in pixels when tiled.
+        nodata: Nodata value; about 5% of pixels are set to it (None for no mask).
+        compress: GeoTIFF compression, or None.
+        pixel_size: Pixel edge in CRS units.
+        seed: Random seed.
+    """
+
+    size: int
+    bands: int = 1
+    dtype: str = "uint16"
+    tiled: bool = True
+    block: int = 256
+    nodata: float | None = 0
+    compress: str | None = None
+    pixel_size: float = 10.0
+    seed: int = 0
+
+    @property
+    def name(self) -> str:
+        """File stem describing the raster."""
+        layout = f"tiled{self.block}" if self.tiled else "striped"
+        return f"raster_{self.size}px_{self.bands}b_{self.dtype}_{layout}"
+
+
+@dataclass(frozen=True, slots=True)
+class VectorSpec:
+    """Parameters of a synthetic vector layer.
+
+    Attributes:
+        kind: Geometry type to generate.
+        features: Number of features.
+        vertices: Vertices per line or polygon ring.
+        extent: Edge of the square layer extent in CRS units.
+        driver: Output driver.
+        seed: Random seed.
+    """
+
+    kind: GeometryKind
+    features: int
+    vertices: int = 16
+    extent: float = 100_000.0
+    driver: str = "GPKG"
+    seed: int = 0
+
+    @property
+    def name(self) -> str:
+        """File stem describing the layer."""
+        return f"{self.kind}_{self.features}f_{self.vertices}v"
+
+
+def write_raster(path: str | Path, spec: RasterSpec) -> Path:
+    """Write a synthetic GeoTIFF: smooth terrain plus noise, with a nodata mask.
+
+    Values form a sum of sine waves across the whole raster (so resampling and
+    statistics see realistic spatial structure) with per-window noise. When
+    ``nodata`` is set, a band of pixels along one edge and a sprinkle of random
+    pixels carry the nodata value.
+    """
+    path = Path(path)
+    profile = {
+        "driver": "GTiff",
+        "width": spec.size,
+        "height": spec.size,
+        "count": spec.bands,
+        "dtype": spec.dtype,
+        "crs": DEFAULT_CRS,
+        "transform": from_origin(ORIGIN_X, ORIGIN_Y, spec.pixel_size, spec.pixel_size),
+        "nodata": spec.nodata,
+        "tiled": spec.tiled,
+        "BIGTIFF": "IF_SAFER",
+    }
+    if spec.tiled:
+        profile.update(blockxsize=spec.block, blockysize=spec.block)
+    if spec.compress:
+        profile["compress"] = spec.compress
+
+    with rasterio.open(path, "w", **profile) as dst:
+        for index, window in enumerate(_raster_windows(spec)):
+            rng = np.random.default_rng((spec.seed, index))
+            for band in range(1, spec.bands + 1):
+                dst.write(_window_values(spec, window, band, rng), band, window=window)
+    return path
+
+
+def _raster_windows(spec: RasterSpec) -> Iterator[Window]:
+    if spec.tiled:
+        # Write whole tiles so each block is compressed once
+        step_x = step_y = spec.block
+    else:
+        step_x, step_y = spec.size, STRIP_ROWS
+    for row in range(0, spec.size, step_y):
+        for col in range(0, spec.size, step_x):
+            yield Window(col, row, min(step_x, spec.size - col), min(step_y, spec.size - row))
+
+
+def _window_values(
+    spec: RasterSpec, window: Window, band: int, rng: np.random.Generator
+) -> np.ndarray:
+    rows = np.arange(window.row_off, window.row_off + window.height)[:, None] / spec.size
+    cols = np.arange(window.col_off, window.col_off + window.width)[None, :] / spec.size
+    surface = (
+        np.sin(2 * np.pi * (cols * 3 + band / 7))
+        + np.cos(2 * np.pi * rows * 5)
+        + 0.5 * np.sin(2 * np.pi * (rows + cols) * 11)
+    )
+    noise = rng.normal(0, 0.1, surface.shape)
+    unit = (surface + noise + 2.6) / 5.2  # roughly 0..1
+
+    info = np.iinfo(spec.dtype) if np.issubdtype(spec.dtype, np.integer) else None
+    if info is not None:
+        low = info.min + 1 if spec.nodata == info.min else info.min
+        values = np.clip(unit * (info.max - low) + low, low, info.max)
+    else:
+        values = unit * 1000.0
+    values = values.astype(spec.dtype)
+
+    if spec.nodata is not None:
+        values[:, (cols[0] < NODATA_EDGE)] = spec.nodata
+        values[rng.random(values.shape) < NODATA_SPRINKLE] = spec.nodata
+    return values
+
+
+def write_vector(path: str | Path, spec: VectorSpec) -> Path:
+    """Write a synthetic point, line or polygon layer with a few attribute columns.
+
+    Features are laid out on a jittered grid so polygons do not overlap and
+    spatial filters select predictable fractions of the layer.
+    """
+    path = Path(path)
+    if path.exists():
+        path.unlink()
+    for start in range(0, spec.features, FEATURE_CHUNK):
+        count = min(FEATURE_CHUNK, spec.features - start)
+        rng = np.random.default_rng((spec.seed, start))
+        ids = np.arange(start, start + count)
+        gdf = gpd.GeoDataFrame(
+            {
+                "fid_src": ids,
+                "value": rng.normal(100.0, 15.0, count),
+                "category": np.array(["a", "b", "c", "d"])[ids % 4],
+            },
+            geometry=_geometries(spec, ids, rng),
+            crs=DEFAULT_CRS,
+        )
+        pyogrio.write_dataframe(gdf, path, driver=spec.driver, append=start > 0)
+    return path
+
+
+def _geometries(spec: VectorSpec, ids: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    per_side = int(np.ceil(np.sqrt(spec.features)))
+    cell = spec.extent / per_side
+    centres = np.column_stack(
+        [
+            ORIGIN_X + (ids % per_side + 0.5) * cell,
+            ORIGIN_Y - spec.extent + (ids // per_side + 0.5) * cell,
+        ]
+    )
+    centres += rng.uniform(-0.1, 0.1, centres.shape) * cell
+
+    if spec.kind == "point":
+        return shapely.points(centres)
+
+    n = max(spec.vertices, 4 if spec.kind == "polygon" else 2)
+    if spec.kind == "line":
+        # Random walk confined to the cell
+        steps = rng.normal(0, cell / (2 * n), (len(ids), n, 2))
+        coords = centres[:, None, :] + np.clip(np.cumsum(steps, axis=1), -cell / 3, cell / 3)
+        return shapely.linestrings(coords)
+
+    # Star-shaped polygon with jittered radii, closed explicitly
+    angles = np.linspace(0, 2 * np.pi, n, endpoint=False)
+    radii = cell * rng.uniform(0.25, 0.45, (len(ids), n))
+    ring = centres[:, None, :] + np.stack([radii * np.cos(angles), radii * np.sin(angles)], axis=-1)
+    ring = np.concatenate([ring, ring[:, :1]], axis=1)
+    return shapely.polygons(ring)
+
+
+def spec_dict(spec: RasterSpec | VectorSpec) -> dict[str, object]:
+    """Return a spec as a plain dictionary (for manifests and results)."""
+    return asdict(spec)
@@ -0,0 +1,421 @@
+"""Benchmark cases, runner and baseline comparison.
+
+Each case calls a tool's core coroutine (the same function the MCP wrapper
+awaits) on generated data, so timings cover the real tool code path without
+the transport or middleware.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import time
+from collections.abc import Callable, Coroutine, Sequence
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pyogrio
+import rasterio
+import shapely
+
+from benchmarks.generators import (
+    GeometryKind,
+    RasterSpec,
+    VectorSpec,
+    spec_dict,
+    write_raster,
+    write_vector,
+)
+
+if TYPE_CHECKING:  # pragma: no cover - import for type checking only
+    from src.models.vector.simplify import SimplifyMethod
+
+try:  # Not available on Windows
+    import resource
+except ImportError:  # pragma: no cover - platform specific
+    resource = None  # type: ignore
+
+__all__ = [
+    "PRESETS",
+    "Case",
+    "CaseResult",
+    "Preset",
+    "build_cases",
+    "compare",
+    "prepare_data",
+    "run_suite",
+]
+
+RESULTS_VERSION = 1
+
+# Median slowdown (fraction) beyond which a case counts as a regression
+DEFAULT_THRESHOLD = 0.10
+
+# ru_maxrss is reported in bytes on macOS and in KiB elsewhere
+_MAXRSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+
+@dataclass(frozen=True, slots=True)
+class Preset:
+    """A named set of input sizes."""
+
+    rasters: tuple[RasterSpec, ...]
+    vectors: tuple[VectorSpec, ...]
+
+
+# Every preset generates one layer per geometry kind
+_VECTOR_KINDS: tuple[GeometryKind, ...] = ("point", "line", "polygon")
+
+# Simplification methods timed on every line and polygon layer
+_SIMPLIFY_METHODS: tuple[SimplifyMethod, ...] = ("douglas-peucker", "visvalingam")
+
+
+def _preset(raster_size: int, features: int, ring_vertices: int) -> Preset:
+    return Preset(
+        rasters=(
+            RasterSpec(size=raster_size, bands=3, tiled=True),
+            RasterSpec(size=raster_size, bands=1, tiled=False),
+        ),
+        vectors=(
+            *(VectorSpec(kind, features) for kind in _VECTOR_KINDS),
+            # One long ring, which Visvalingam-Whyatt simplifies through its heap path
+            VectorSpec("polygon", 1, vertices=ring_vertices),
+        ),
+    )
+
+
+PRESETS: dict[str, Preset] = {
+    "smoke": _preset(1_024, 10_000, 20_000),
+    "medium": _preset(10_000, 1_000_000, 632_000),
+    "large": _preset(50_000, 10_000_000, 5_000_000),
+}
+
+
+@dataclass(slots=True)
+class Case:
+    """One timed operation.
+
+    Attributes:
+        name: Unique case name, e.g. "vector_buffer[point_10000f_16v]".
+        tool: Tool being measured.
+        run: Coroutine factory taking a scratch directory for outputs.
+    """
+
+    name: str
+    tool: str
+    run: Callable[[Path], Coroutine[Any, Any, Any]]
+
+
+@dataclass(slots=True)
+class CaseResult:
+    """Timings of one case across repeats (seconds)."""
+
+    name: str
+    tool: str
+    runs: list[float] = field(default_factory=list)
+    peak_rss_delta_bytes: int = 0
+    error: str | None = None
+
+    @property
+    def median(self) -> float | None:
+        """Median run time, or None if no run completed."""
+        return statistics.median(self.runs) if self.runs else None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialise with summary statistics."""
+        data = asdict(self)
+        data.update(
+            median=self.median,
+            min=min(self.runs) if self.runs else None,
+            mean=statistics.fmean(self.runs) if self.runs else None,
+            stdev=statistics.stdev(self.runs) if len(self.runs) > 1 else 0.0,
+        )
+        return data
+
+
+def prepare_data(preset: Preset, data_dir: Path) -> tuple[list[Path], list[Path]]:
+    """Generate the preset's inputs, reusing files whose manifest still matches."""
+    data_dir.mkdir(parents=True, exist_ok=True)
+    rasters = [
+        _cached(data_dir / f"{spec.name}.tif", spec, write_raster) for spec in preset.rasters
+    ]
+    vectors = [
+        _cached(data_dir / f"{spec.name}.gpkg", spec, write_vector) for spec in preset.vectors
+    ]
+    return rasters, vectors
+
+
+def _cached(path: Path, spec: Any, writer: Callable[[Path, Any], Path]) -> Path:
+    manifest = path.with_suffix(path.suffix + ".json")
+    expected = spec_dict(spec)
+    if path.exists() and manifest.exists():
+        if json.loads(manifest.read_text()) == expected:
+            return path
+    writer(path, spec)
+    manifest.write_text(json.dumps(expected, sort_keys=True))
+    return path
+
+
+def build_cases(rasters: Sequence[Path], vectors: Sequence[Path]) -> list[Case]:
+    """Build the raster, vector and catalog cases over the generated inputs."""
+    from src.models.raster.convert import Options as RasterConvertOptions
+    from src.models.raster.reproject import Params as RasterReprojectParams
+    from src.models.raster.stats import Params as RasterStatsParams
+    from src.models.vector.buffer import Params as BufferParams
+    from src.models.vector.clip import Params as ClipParams
+    from src.models.vector.convert import Params as VectorConvertParams
+    from src.models.vector.reproject import Params as VectorReprojectParams
+    from src.models.vector.simplify import Params as SimplifyParams
+    from src.tools.raster.convert import _convert as raster_convert
+    from src.tools.raster.reproject import _reproject as raster_reproject
+    from src.tools.raster.stats import _stats as raster_stats
+    from src.tools.vector.buffer import _buffer as vector_buffer
+    from src.tools.vector.clip import _clip as vector_clip
+    from src.tools.vector.convert import _convert as vector_convert
+    from src.tools.vector.info import _info as vector_info
+    from src.tools.vector.reproject import _reproject as vector_reproject
+    from src.tools.vector.simplify import _simplify as vector_simplify
+
+    cases: list[Case] = []
+
+    def add(
+        tool: str,
+        path: Path,
+        run: Callable[[Path], Coroutine[Any, Any, Any]],
+        variant: str | None = None,
+    ) -> None:
+        label = f"{path.stem},{variant}" if variant else path.stem
+        cases.append(Case(f"{tool}[{label}]", tool, run))
+
+    def add_raster_cases(raster: Path) -> None:
+        uri = str(raster)
+        add("raster_stats", raster, lambda out: raster_stats(uri, RasterStatsParams()))
+        add(
+            "raster_reproject",
+            raster,
+            lambda out: raster_reproject(
+                uri,
+                str(out / "reprojected.tif"),
+                RasterReprojectParams(dst_crs="EPSG:3857", resampling="bilinear"),
+            ),
+        )
+        add(
+            "raster_convert",
+            raster,
+            lambda out: raster_convert(
+                uri,
+                str(out / "converted.tif"),
+                RasterConvertOptions(driver="GTiff", compression="deflate"),
+            ),
+        )
+
+    def add_vector_cases(vector: Path) -> None:
+        uri = str(vector)
+        info = pyogrio.read_info(uri)
+        kind = info["geometry_type"]
+        minx, miny, maxx, maxy = info["total_bounds"]
+        quarter = [
+            minx + (maxx - minx) / 4,
+            miny + (maxy - miny) / 4,
+            maxx - (maxx - minx) / 4,
+            maxy - (maxy - miny) / 4,
+        ]
+        # Feature spacing, so distances and tolerances scale with layer density
+        spacing = (maxx - minx) / max(1, info["features"]) ** 0.5
+
+        add("vector_info", vector, lambda out: vector_info(uri))
+        add(
+            "vector_convert",
+            vector,
+            lambda out: vector_convert(uri, str(out / "converted.gpkg"), VectorConvertParams()),
+        )
+        add(
+            "vector_reproject",
+            vector,
+            lambda out: vector_reproject(
+                uri, str(out / "reprojected.gpkg"), VectorReprojectParams(dst_crs="EPSG:4326")
+            ),
+        )
+        add(
+            "vector_clip",
+            vector,
+            lambda out: vector_clip(uri, str(out / "clipped.gpkg"), ClipParams(bounds=quarter)),
+        )
+        if kind in ("Point", "LineString"):
+            add(
+                "vector_buffer",
+                vector,
+                lambda out: vector_buffer(
+                    uri, str(out / "buffered.gpkg"), BufferParams(distance=spacing / 4)
+                ),
+            )
+        if kind in ("LineString", "Polygon"):
+            for method in _SIMPLIFY_METHODS:
+                add_simplify_case(vector, method, spacing / 50)
+
+    def add_simplify_case(vector: Path, method: SimplifyMethod, tolerance: float) -> None:
+        params = SimplifyParams(tolerance=tolerance, method=method)
+        add(
+            "vector_simplify",
+            vector,
+            lambda out: vector_simplify(str(vector), str(out / "simplified.gpkg"), params),
+            # The default method keeps the plain case name so older baselines still match
+            variant=None if method == "douglas-peucker" else method,
+        )
+
+    # Cases bind their inputs in the helper's scope, not through lambda defaults
+    for raster in rasters:
+        add_raster_cases(raster)
+    for vector in vectors:
+        add_vector_cases(vector)
+
+    data_dir = Path(rasters[0] if rasters else vectors[0]).parent
+    cases.append(Case("catalog_scan[cold]", "catalog_scan", lambda out: _catalog_scan(data_dir)))
+    return cases
+
+
+async def _catalog_scan(workspace: Path) -> int:
+    from src.config import reset_workspaces_cache
+    from src.shared.catalog.scanner import clear_cache, scan
+
+    previous = os.environ.get("GDAL_MCP_WORKSPACES")
+    os.environ["GDAL_MCP_WORKSPACES"] = str(workspace)
+    reset_workspaces_cache()
+    clear_cache()
+    try:
+        return len(scan(kind="all"))
+    finally:
+        if previous is None:
+            os.environ.pop("GDAL_MCP_WORKSPACES", None)
+        else:
+            os.environ["GDAL_MCP_WORKSPACES"] = previous
+        reset_workspaces_cache()
+
+
+def _max_rss_bytes() -> int:
+    if resource is None:  # pragma: no cover - platform specific
+        return 0
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _MAXRSS_UNIT
+
+
+def run_case(case: Case, scratch: Path, repeat: int) -> CaseResult:
+    """Run a case ``repeat`` times, clearing its outputs before each run."""
+    result = CaseResult(case.name, case.tool)
+    rss_before = _max_rss_bytes()
+    for _ in range(repeat):
+        shutil.rmtree(scratch, ignore_errors=True)
+        scratch.mkdir(parents=True)
+        started = time.perf_counter()
+        try:
+            asyncio.run(case.run(scratch))
+        except Exception as e:
+            result.error = f"{type(e).__name__}: {e}"
+            break
+        result.runs.append(time.perf_counter() - started)
+    result.peak_rss_delta_bytes = max(0, _max_rss_bytes() - rss_before)
+    shutil.rmtree(scratch, ignore_errors=True)
+    return result
+
+
+def run_suite(
+    preset: Preset,
+    data_dir: Path,
+    *,
+    repeat: int = 3,
+    only: Sequence[str] | None = None,
+    progress: Callable[[CaseResult], None] | None = None,
+) -> dict[str, Any]:
+    """Generate inputs, run every case and return JSON-serialisable results.
+
+    Args:
+        preset: Input sizes
+        data_dir: Directory for generated inputs (reused across runs)
+        repeat: Timed runs per case
+        only: Run only cases whose tool or name starts with one of these
+        progress: Called with each finished case
+    """
+    rasters, vectors = prepare_data(preset, data_dir)
+    cases = build_cases(rasters, vectors)
+    if only:
+        cases = [c for c in cases if any(c.name.startswith(p) for p in only)]
+
+    results: dict[str, Any] = {}
+    scratch = data_dir / "_outputs"
+    for case in cases:
+        result = run_case(case, scratch, repeat)
+        results[case.name] = result.to_dict()
+        if progress is not None:
+            progress(result)
+
+    return {
+        "version": RESULTS_VERSION,
+        "meta": _environment(preset, repeat),
+        "results": results,
+    }
+
+
+def _environment(preset: Preset, repeat: int) -> dict[str, Any]:
+    specs: tuple[RasterSpec | VectorSpec, ...] = (*preset.rasters, *preset.vectors)
+    return {
+        "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "gdal": rasterio.__gdal_version__,
+        "rasterio": rasterio.__version__,
+        "pyogrio": pyogrio.__version__,
+        "shapely": shapely.__version__,
+        "geos": shapely.geos_version_string,
+        "repeat": repeat,
+        "inputs": [spec_dict(s) for s in specs],
+    }
+
+
+def compare(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[dict[str, Any]]:
+    """Compare median timings against a baseline results file.
+
+    Returns one row per case with status "regression" (slower than the
+    baseline by more than ``threshold``), "improvement" (faster by more than
+    ``threshold``), "ok", "new" (not in the baseline), "missing" (only in the
+    baseline) or "error" (failed in the current run).
+    """
+    rows: list[dict[str, Any]] = []
+    current_results = current.get("results", {})
+    baseline_results = baseline.get("results", {})
+    for name in sorted(current_results.keys() | baseline_results.keys()):
+        now = current_results.get(name)
+        before = baseline_results.get(name)
+        row: dict[str, Any] = {
+            "case": name,
+            "baseline": before.get("median") if before else None,
+            "current": now.get("median") if now else None,
+            "ratio": None,
+        }
+        if now is None:
+            row["status"] = "missing"
+        elif now.get("error"):
+            row["status"] = "error"
+        elif before is None or not before.get("median"):
+            row["status"] = "new"
+        else:
+            ratio = now["median"] / before["median"]
+            row["ratio"] = ratio
+            if ratio > 1 + threshold:
+                row["status"] = "regression"
+            elif ratio < 1 - threshold:
+                row["status"] = "improvement"
+            else:
+                row["status"] = "ok"
+        rows.append(row)
+    return rows
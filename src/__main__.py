@@ -4,8 +4,6 @@ import logging
 
 import typer
 
-from .server import mcp
-
 app = typer.Typer(add_completion=False, no_args_is_help=False)
 
 
@@ -16,6 +14,29 @@ def _setup_logging(level: str) -> None:
     )
 
 
+def _run(transport: str, host: str, port: int, log_level: str, warm: bool) -> None:
+    if transport not in {"stdio", "http"}:
+        raise typer.BadParameter("transport must be 'stdio' or 'http'")
+    from .config import is_warm_start_enabled
+    from .server import mcp
+
+    _setup_logging(log_level)
+    if warm or is_warm_start_enabled():
+        from .startup import start_warmup
+
+        start_warmup()
+    if transport == "stdio":
+        mcp.run()
+    else:
+        mcp.run(transport="http", host=host, port=port)
+
+
+_WARM_HELP = (
+    "Preload GDAL/OGR drivers, PROJ, extension tables and the catalog in the background "
+    "(also GDAL_MCP_WARM=1)"
+)
+
+
 @app.callback(invoke_without_command=True)
 def _default(
     ctx: typer.Context,
@@ -23,17 +44,22 @@ def _default(
     host: str = typer.Option("0.0.0.0", help="Host for HTTP transport"),
     port: int = typer.Option(8000, help="Port for HTTP transport"),
     log_level: str = typer.Option("INFO", help="Logging level"),
+    warm: bool = typer.Option(False, "--warm", help=_WARM_HELP),
+    profile_startup: bool = typer.Option(
+        False,
+        "--profile-startup",
+        help="Report server import time by module and which heavy libraries load, then exit",
+    ),
 ) -> None:
     """Run the GDAL MCP server or execute subcommands."""
+    if profile_startup:
+        from .startup import format_profile, profile_startup as run_profile
+
+        typer.echo(format_profile(run_profile()))
+        raise typer.Exit()
     if ctx.invoked_subcommand is not None:
         return
-    _setup_logging(log_level)
-    if transport == "stdio":
-        mcp.run()
-    elif transport == "http":
-        mcp.run(transport="http", host=host, port=port)
-    else:
-        raise typer.BadParameter("transport must be 'stdio' or 'http'")
+    _run(transport, host, port, log_level, warm)
 
 
 @app.command(help="Run the GDAL MCP server")
@@ -42,15 +68,29 @@ def serve(
     host: str = typer.Option("0.0.0.0", help="Host for HTTP transport"),
     port: int = typer.Option(8000, help="Port for HTTP transport"),
     log_level: str = typer.Option("INFO", help="Logging level"),
+    warm: bool = typer.Option(False, "--warm", help=_WARM_HELP),
 ) -> None:
     """Start the GDAL MCP server with specified transport."""
+    _run(transport, host, port, log_level, warm)
+
+
+@app.command(
+    name="migrate-reflections",
+    help="Import justifications from the JSON directory layout into the SQLite store",
+)
+def migrate_reflections(
+    source: str = typer.Option(
+        ".preflight/justifications", help="Directory written by the disk store"
+    ),
+    db: str = typer.Option(".preflight/justifications.sqlite3", help="SQLite database path"),
+    log_level: str = typer.Option("INFO", help="Logging level"),
+) -> None:
+    """Copy existing JSON justifications into a SQLite reflection store."""
+    from .middleware.reflection_sqlite import SQLiteStore
+
     _setup_logging(log_level)
-    if transport == "stdio":
-        mcp.run()
-    elif transport == "http":
-        mcp.run(transport="http", host=host, port=port)
-    else:
-        raise typer.BadParameter("transport must be 'stdio' or 'http'")
+    migrated = SQLiteStore(db).migrate_from_directory(source)
+    typer.echo(f"Migrated {migrated} justification(s) from {source} into {db}")
 
 
 def main() -> None:
@@ -131,6 +131,269 @@ def is_raster_tools_enabled() -> bool:
     return _get_bool_env("RASTER", default=True)
 
 
+def is_warm_start_enabled() -> bool:
+    """Return whether GDAL_MCP_WARM asks for drivers and caches to be preloaded at startup."""
+    return _get_bool_env("GDAL_MCP_WARM", default=False)
+
+
+REFLECTION_STORE_BACKENDS = ("disk", "indexed", "sqlite")
+SECONDS_PER_DAY = 86400
+
+
+def get_reflection_store_backend() -> str:
+    """Return the justification store backend selected by GDAL_MCP_REFLECTION_STORE.
+
+    - "disk" (default): one JSON file per justification, checked on every lookup
+    - "indexed": same layout, with an in-memory key index and background writes
+    - "sqlite": single WAL-mode database, for several server processes sharing a cache
+
+    Unknown values log a warning and fall back to "disk".
+    """
+    raw_value = os.getenv("GDAL_MCP_REFLECTION_STORE")
+    if raw_value is None:
+        return "disk"
+
+    normalized = raw_value.strip().lower()
+    if normalized in REFLECTION_STORE_BACKENDS:
+        return normalized
+
+    logger.warning(
+        "Invalid value for GDAL_MCP_REFLECTION_STORE: %s. Expected one of %s. "
+        "Falling back to default=disk.",
+        raw_value,
+        "{" + ",".join(REFLECTION_STORE_BACKENDS) + "}",
+    )
+    return "disk"
+
+
+def get_reflection_ttl_seconds() -> int | None:
+    """Return the justification max age from GDAL_MCP_REFLECTION_TTL_DAYS, if set.
+
+    Only honoured by the sqlite store. Unset, empty, or invalid values mean
+    justifications never expire.
+    """
+    raw_value = os.getenv("GDAL_MCP_REFLECTION_TTL_DAYS")
+    if raw_value is None or not raw_value.strip():
+        return None
+
+    try:
+        days = float(raw_value)
+    except ValueError:
+        days = 0.0
+    if days <= 0:
+        logger.warning(
+            "Invalid value for GDAL_MCP_REFLECTION_TTL_DAYS: %s. Expected a positive number "
+            "of days. Justifications will not expire.",
+            raw_value,
+        )
+        return None
+    return int(days * SECONDS_PER_DAY)
+
+
+TRACE_EXPORTERS = ("memory", "jsonl", "off")
+DEFAULT_TRACE_FILE = "traces/spans.jsonl"
+
+
+def get_trace_exporter() -> str:
+    """Return the span exporter selected by GDAL_MCP_TRACE.
+
+    - "memory" (default): keep recent spans in an in-memory ring buffer
+    - "jsonl": also append every span to GDAL_MCP_TRACE_FILE
+    - "off": do not record spans
+
+    Unknown values log a warning and fall back to "memory".
+    """
+    raw_value = os.getenv("GDAL_MCP_TRACE")
+    if raw_value is None:
+        return "memory"
+
+    normalized = raw_value.strip().lower()
+    if normalized in TRACE_EXPORTERS:
+        return normalized
+
+    logger.warning(
+        "Invalid value for GDAL_MCP_TRACE: %s. Expected one of %s. Falling back to default=memory.",
+        raw_value,
+        "{" + ",".join(TRACE_EXPORTERS) + "}",
+    )
+    return "memory"
+
+
+def get_trace_file() -> Path:
+    """Return the JSONL span file from GDAL_MCP_TRACE_FILE (default traces/spans.jsonl)."""
+    return Path(os.getenv("GDAL_MCP_TRACE_FILE") or DEFAULT_TRACE_FILE)
+
+
+DEFAULT_MEMORY_BUDGET = "50%"
+DEFAULT_MEMORY_QUEUE_TIMEOUT = 300.0
+MAX_PERCENT = 100
+_BYTE_UNITS = {
+    "": 1,
+    "b": 1,
+    "kb": 1000,
+    "mb": 1000**2,
+    "gb": 1000**3,
+    "tb": 1000**4,
+    "kib": 1024,
+    "mib": 1024**2,
+    "gib": 1024**3,
+    "tib": 1024**4,
+}
+_CGROUP_MEMORY_LIMITS = (
+    Path("/sys/fs/cgroup/memory.max"),
+    Path("/sys/fs/cgroup/memory/memory.limit_in_bytes"),
+)
+
+
+def _memory_limit_bytes() -> int | None:
+    """Return the container memory limit, or physical memory when unconstrained."""
+    physical: int | None = None
+    try:
+        physical = os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, OSError, ValueError):  # pragma: no cover - platform specific
+        pass
+
+    for limit_file in _CGROUP_MEMORY_LIMITS:
+        try:
+            raw = limit_file.read_text().strip()
+        except OSError:
+            continue
+        # cgroup v2 reports "max" and v1 a huge sentinel when unlimited
+        if raw.isdigit() and (physical is None or int(raw) < physical):
+            return int(raw)
+    return physical
+
+
+def _parse_memory_size(raw_value: str) -> int | None:
+    """Parse "512MB", "2GiB", "1073741824" or "40%" (of the memory limit) into bytes."""
+    value = raw_value.strip().lower().replace(" ", "")
+    if value.endswith("%"):
+        limit = _memory_limit_bytes()
+        try:
+            percent = float(value[:-1])
+        except ValueError:
+            return None
+        if limit is None or not 0 < percent <= MAX_PERCENT:
+            return None
+        return int(limit * percent / MAX_PERCENT)
+
+    number = value.rstrip("abcdefghijklmnopqrstuvwxyz")
+    unit = value[len(number) :]
+    if unit not in _BYTE_UNITS:
+        return None
+    try:
+        size = int(float(number) * _BYTE_UNITS[unit])
+    except ValueError:
+        return None
+    return size if size > 0 else None
+
+
+def get_memory_budget() -> int | None:
+    """Return the memory budget shared by concurrent tool calls from GDAL_MCP_MEMORY_BUDGET.
+
+    Accepts a size ("512MB", "2GiB", plain bytes) or a percentage of the
+    container memory limit (physical memory when unconstrained). The default
+    is "50%". "off" disables admission control and returns None; invalid
+    values log a warning and fall back to the default.
+    """
+    raw_value = os.getenv("GDAL_MCP_MEMORY_BUDGET")
+    if raw_value is not None and raw_value.strip().lower() in {"off", "0", "false"}:
+        return None
+
+    if raw_value is not None and raw_value.strip():
+        budget = _parse_memory_size(raw_value)
+        if budget is not None:
+            return budget
+        logger.warning(
+            "Invalid value for GDAL_MCP_MEMORY_BUDGET: %s. Expected a size such as 2GiB or a "
+            "percentage such as 50%%. Falling back to default=%s.",
+            raw_value,
+            DEFAULT_MEMORY_BUDGET,
+        )
+    return _parse_memory_size(DEFAULT_MEMORY_BUDGET)
+
+
+def get_memory_queue_timeout() -> float:
+    """Return the longest a tool call waits for memory, from GDAL_MCP_MEMORY_QUEUE_TIMEOUT.
+
+    Seconds, default 300. Invalid or non-positive values log a warning and
+    fall back to the default.
+    """
+    raw_value = os.getenv("GDAL_MCP_MEMORY_QUEUE_TIMEOUT")
+    if raw_value is None or not raw_value.strip():
+        return DEFAULT_MEMORY_QUEUE_TIMEOUT
+
+    try:
+        seconds = float(raw_value)
+    except ValueError:
+        seconds = 0.0
+    if seconds <= 0:
+        logger.warning(
+            "Invalid value for GDAL_MCP_MEMORY_QUEUE_TIMEOUT: %s. Expected a positive number "
+            "of seconds. Falling back to default=%s.",
+            raw_value,
+            DEFAULT_MEMORY_QUEUE_TIMEOUT,
+        )
+        return DEFAULT_MEMORY_QUEUE_TIMEOUT
+    return seconds
+
+
+GDAL_PROFILES = ("default", "low-memory", "throughput", "network-storage")
+
+
+def get_gdal_profile_name() -> str:
+    """Return the GDAL runtime tuning preset selected by GDAL_MCP_GDAL_PROFILE.
+
+    - "default": GDAL's own defaults (plus any GDAL options set in the environment)
+    - "low-memory": small block cache, single-threaded, no VSI read cache
+    - "throughput": large block cache and swath, multi-threaded codecs
+    - "network-storage": cloud-optimised reads over /vsicurl/, S3 and other remote files
+
+    Unknown values log a warning and fall back to "default".
+    """
+    raw_value = os.getenv("GDAL_MCP_GDAL_PROFILE")
+    if raw_value is None or not raw_value.strip():
+        return "default"
+
+    normalized = raw_value.strip().lower().replace("_", "-")
+    if normalized in GDAL_PROFILES:
+        return normalized
+
+    logger.warning(
+        "Invalid value for GDAL_MCP_GDAL_PROFILE: %s. Expected one of %s. "
+        "Falling back to default=default.",
+        raw_value,
+        "{" + ",".join(GDAL_PROFILES) + "}",
+    )
+    return "default"
+
+
+def get_gdal_option_overrides() -> dict[str, str]:
+    """Return GDAL config options from GDAL_MCP_GDAL_OPTIONS.
+
+    Semicolon-separated ``KEY=VALUE`` pairs applied on top of the preset,
+    e.g. ``GDAL_CACHEMAX=1024;GDAL_NUM_THREADS=4``. Malformed entries log a
+    warning and are skipped; values are validated by the profile loader.
+    """
+    raw_value = os.getenv("GDAL_MCP_GDAL_OPTIONS")
+    if raw_value is None or not raw_value.strip():
+        return {}
+
+    overrides: dict[str, str] = {}
+    for item in raw_value.split(";"):
+        if not item.strip():
+            continue
+        key, sep, value = item.partition("=")
+        key = key.strip().upper()
+        if not sep or not key or not value.strip():
+            logger.warning(
+                "Invalid entry in GDAL_MCP_GDAL_OPTIONS: %r. Expected KEY=VALUE; skipping.", item
+            )
+            continue
+        overrides[key] = value.strip()
+    return overrides
+
+
 def get_workspace_root() -> Path | None:
     """Get the primary workspace root directory for resolving relative paths.
 
@@ -1,15 +1,26 @@
-"""Middleware for preflight reflection and path validation."""
+"""Middleware for preflight reflection, path validation, metrics and admission control."""
 
 from __future__ import annotations
 
+from .admission import AdmissionMiddleware
+from .metrics import MetricsMiddleware, get_metrics
 from .paths import PathValidationMiddleware
+from .pipeline import ToolCallPipeline
 from .preflight import requires_reflection
-from .reflection_store import DiskStore, ReflectionStore, get_store
+from .reflection_store import DiskStore, IndexedDiskStore, ReflectionStore, get_store
+from .tool_call import ToolCall, current_tool_call
 
 __all__ = [
     "requires_reflection",
     "ReflectionStore",
     "DiskStore",
+    "IndexedDiskStore",
     "get_store",
     "PathValidationMiddleware",
+    "ToolCallPipeline",
+    "MetricsMiddleware",
+    "get_metrics",
+    "AdmissionMiddleware",
+    "ToolCall",
+    "current_tool_call",
 ]
@@ -0,0 +1,247 @@
+"""Memory-budget admission control for tool calls.
+
+Before a tool runs, its working set is estimated from the input's header
+(raster dimensions, dtype and band count, or vector feature count) and
+reserved against the global :class:`~src.shared.budget.MemoryBudget`. Calls
+that do not fit are downgraded to windowed or sampled reads where the tool
+supports it, or queued until memory is released. The grant is visible to the
+tool as ``current_tool_call().admission`` and reported in the result under
+``admission``.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from fastmcp.server.middleware.middleware import CallNext, Middleware, MiddlewareContext
+from fastmcp.tools.tool import ToolResult
+
+from src.config import resolve_path
+from src.middleware.tool_call import ToolCall, current_tool_call, extract_tool_call
+from src.shared.budget import Admission, Estimate, MemoryBudget, get_budget
+from src.shared.gdal_env import gdal_env
+
+__all__ = ["ESTIMATORS", "AdmissionMiddleware", "estimate_tool_call"]
+
+logger = logging.getLogger(__name__)
+
+# GDAL's default warp buffer (GDAL_WARP_MEMORY is unset, rasterio passes 0)
+WARP_MEMORY_BYTES = 64 * 1024**2
+
+# Pixels per band read by raster_stats in sampled mode
+STATS_SAMPLE_PIXELS = 4_000_000
+
+# Rows per strip copied by raster_convert in windowed mode
+CONVERT_WINDOW_ROWS = 256
+
+# Bytes per raster pixel held by raster_zonal_stats: the zone label array plus
+# the per-block boolean masks of each worker
+ZONAL_BYTES_PER_PIXEL = 4
+
+# Bytes held per loaded feature relative to its share of the file: Arrow
+# buffers, GEOS geometries and the transformed copy
+VECTOR_EXPANSION = 4
+MIN_FEATURE_BYTES = 64
+
+# Vector modes that hold every geometry at once instead of streaming batches
+_VECTOR_WHOLE_LAYER = {
+    "vector_buffer": ("dissolve", True),
+    "vector_simplify": ("method", "coverage"),
+}
+
+Estimator = Callable[[ToolCall], Estimate | None]
+
+
+def _input_path(call: ToolCall) -> str | None:
+    resolved = call.resolved_paths.get("uri")
+    if resolved is not None:
+        return str(resolved)
+    uri = call.arguments.get("uri")
+    return str(resolve_path(uri)) if isinstance(uri, str) and uri else None
+
+
+def _raster_header(call: ToolCall) -> tuple[int, int, int, int] | None:
+    """Return (width, height, band count, bytes per pixel) of the input raster."""
+    import numpy as np
+    import rasterio
+
+    path = _input_path(call)
+    if path is None:
+        return None
+    with gdal_env(), rasterio.open(path) as src:
+        itemsize = max(np.dtype(dtype).itemsize for dtype in src.dtypes)
+        return src.width, src.height, src.count, itemsize
+
+
+def _estimate_raster_stats(call: ToolCall) -> Estimate | None:
+    header = _raster_header(call)
+    if header is None:
+        return None
+    width, height, _, itemsize = header
+    # One band at a time: masked read, compressed valid copy and percentile partition
+    per_pixel = 3 * itemsize + 1
+    return Estimate(
+        full_bytes=width * height * per_pixel,
+        reduced_bytes=min(width * height, STATS_SAMPLE_PIXELS) * per_pixel,
+        reduced_mode="sampled",
+    )
+
+
+def _estimate_raster_convert(call: ToolCall) -> Estimate | None:
+    header = _raster_header(call)
+    if header is None:
+        return None
+    width, height, count, itemsize = header
+    return Estimate(
+        full_bytes=width * height * itemsize,
+        reduced_bytes=width * min(height, CONVERT_WINDOW_ROWS) * count * itemsize,
+        reduced_mode="windowed",
+    )
+
+
+def _estimate_raster_reproject(call: ToolCall) -> Estimate | None:
+    header = _raster_header(call)
+    if header is None:
+        return None
+    width, height, _, itemsize = header
+    # GDAL warps in chunks bounded by the warp buffer
+    return Estimate(full_bytes=min(WARP_MEMORY_BYTES, 2 * width * height * itemsize))
+
+
+def _estimate_raster_clip(call: ToolCall) -> Estimate | None:
+    from src.shared.raster.clip import CLIP_WINDOW_ROWS
+
+    header = _raster_header(call)
+    if header is None:
+        return None
+    width, height, count, itemsize = header
+    # One strip of every band; the clip window is at most the full raster width
+    return Estimate(full_bytes=width * min(height, CLIP_WINDOW_ROWS) * count * itemsize)
+
+
+def _estimate_raster_zonal_stats(call: ToolCall) -> Estimate | None:
+    header = _raster_header(call)
+    if header is None:
+        return None
+    width, height, _, _ = header
+    return Estimate(full_bytes=width * height * ZONAL_BYTES_PER_PIXEL)
+
+
+def _estimate_vector(call: ToolCall) -> Estimate | None:
+    import pyogrio
+
+    from src.shared.vector.stream import DEFAULT_BATCH_SIZE
+
+    path = _input_path(call)
+    if path is None:
+        return None
+    info = pyogrio.read_info(path)
+    file_bytes = sum(p.stat().st_size for p in _dataset_files(Path(path)))
+    features = int(info.get("features") or -1)
+    if features <= 0:
+        return Estimate(full_bytes=file_bytes * VECTOR_EXPANSION)
+
+    per_feature = max(MIN_FEATURE_BYTES, file_bytes // features) * VECTOR_EXPANSION
+    whole_layer = _VECTOR_WHOLE_LAYER.get(call.name)
+    if whole_layer is not None and call.arguments.get(whole_layer[0]) == whole_layer[1]:
+        return Estimate(full_bytes=features * per_feature)
+    return Estimate(full_bytes=min(features, DEFAULT_BATCH_SIZE) * per_feature)
+
+
+def _dataset_files(path: Path) -> list[Path]:
+    if not path.is_file():
+        return []
+    if path.suffix.lower() == ".shp":
+        # Shapefile geometry and attributes live in sidecar files
+        return [p for p in path.parent.glob(path.stem + ".*") if p.is_file()]
+    return [path]
+
+
+ESTIMATORS: dict[str, Estimator] = {
+    "raster_clip": _estimate_raster_clip,
+    "raster_stats": _estimate_raster_stats,
+    "raster_convert": _estimate_raster_convert,
+    "raster_reproject": _estimate_raster_reproject,
+    "raster_zonal_stats": _estimate_raster_zonal_stats,
+    "vector_buffer": _estimate_vector,
+    "vector_clip": _estimate_vector,
+    "vector_convert": _estimate_vector,
+    "vector_reproject": _estimate_vector,
+    "vector_simplify": _estimate_vector,
+}
+
+
+def estimate_tool_call(call: ToolCall) -> Estimate | None:
+    """Estimate a call's working set, or None for tools that only read metadata."""
+    estimator = ESTIMATORS.get(call.name)
+    if estimator is None:
+        return None
+    import pyogrio
+    import rasterio
+
+    try:
+        return estimator(call)
+    except (OSError, rasterio.errors.RasterioError, pyogrio.errors.DataSourceError) as e:
+        # The tool reports unreadable inputs itself
+        logger.debug("Cannot estimate memory for '%s': %s", call.name, e)
+        return None
+
+
+class AdmissionMiddleware(Middleware):
+    """Admit, queue or downgrade tool calls against the global memory budget.
+
+    Register it after :class:`ToolCallPipeline` so only validated calls are
+    estimated and the grant is attached to the shared :class:`ToolCall`.
+
+    Example:
+        >>> mcp.add_middleware(AdmissionMiddleware())
+    """
+
+    def __init__(self, budget: MemoryBudget | None = None) -> None:
+        self._budget = budget
+
+    @property
+    def budget(self) -> MemoryBudget | None:
+        """The budget calls are admitted against (None when admission control is off)."""
+        return self._budget or get_budget()
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[Any],
+        call_next: CallNext[Any, Any],
+    ) -> Any:
+        """Reserve the call's estimated memory for as long as the tool runs."""
+        budget = self.budget
+        call = current_tool_call()
+        if budget is None or call is None:
+            if call is None:
+                tool_name, _ = extract_tool_call(context)
+                logger.debug("AdmissionMiddleware: no tool call state for '%s'", tool_name)
+            return await call_next(context)
+
+        estimate = estimate_tool_call(call)
+        if estimate is None:
+            return await call_next(context)
+
+        admission = await budget.admit(estimate, label=f"'{call.name}'")
+        call.admission = admission
+        try:
+            result = await call_next(context)
+        finally:
+            budget.release(admission)
+        return _with_admission(result, admission)
+
+
+def _with_admission(result: Any, admission: Admission) -> Any:
+    if not isinstance(result, ToolResult) or not isinstance(result.structured_content, dict):
+        return result
+    structured = dict(result.structured_content)
+    if "result" in structured and len(structured) == 1:
+        # Wrapped non-object output: leave the schema-checked shape alone
+        return result
+    structured["admission"] = admission.to_dict()
+    # Keep the tool's own content blocks; only the structured output gains the field
+    return ToolResult(content=result.content, structured_content=structured)
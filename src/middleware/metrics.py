@@ -0,0 +1,362 @@
+"""Per-tool and per-resource latency, CPU, memory and I/O instrumentation."""
+
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from fastmcp.server.middleware.middleware import CallNext, Middleware, MiddlewareContext
+
+from src.middleware.paths import INPUT_PATH_ARGS
+from src.middleware.tool_call import ToolCall, extract_tool_call, observe_tool_call
+
+try:  # Not available on Windows
+    import resource
+except ImportError:  # pragma: no cover - platform specific
+    resource = None  # type: ignore
+
+__all__ = [
+    "LatencyHistogram",
+    "MetricsMiddleware",
+    "MetricsRegistry",
+    "get_metrics",
+]
+
+logger = logging.getLogger(__name__)
+
+# Linear sub-buckets per power of two: 256 keeps every recorded value within
+# 1% of its bucket's upper bound (two significant figures, as in HdrHistogram)
+SUB_BUCKET_BITS = 8
+
+# Quantiles reported in snapshots and in the Prometheus summaries
+QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+# ru_maxrss is reported in bytes on macOS and in KiB elsewhere
+_MAXRSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+# Path segments naming the metadata resource kind, e.g. metadata://{file}/raster
+_METADATA_KINDS = frozenset({"bands", "format", "raster", "statistics", "vector"})
+
+
+class LatencyHistogram:
+    """HDR-style log-linear histogram of durations.
+
+    Durations are recorded in whole microseconds. Values below
+    ``2**SUB_BUCKET_BITS`` get exact buckets; larger values share buckets that
+    are linear within each power of two, so relative error stays below 1% from
+    microseconds to hours while only buckets actually hit are stored.
+    """
+
+    __slots__ = ("_counts", "count", "max_us", "min_us", "total_us")
+
+    def __init__(self) -> None:
+        self._counts: dict[int, int] = {}
+        self.count = 0
+        self.total_us = 0
+        self.min_us = 0
+        self.max_us = 0
+
+    @staticmethod
+    def _bucket(value_us: int) -> int:
+        """Return the lowest value sharing a bucket with ``value_us``."""
+        shift = max(0, value_us.bit_length() - SUB_BUCKET_BITS)
+        return (value_us >> shift) << shift
+
+    @staticmethod
+    def _bucket_upper(bucket: int) -> int:
+        shift = max(0, bucket.bit_length() - SUB_BUCKET_BITS)
+        return bucket + (1 << shift) - 1
+
+    def record(self, seconds: float) -> None:
+        """Record one duration."""
+        value_us = max(0, round(seconds * 1e6))
+        bucket = self._bucket(value_us)
+        self._counts[bucket] = self._counts.get(bucket, 0) + 1
+        self.min_us = value_us if self.count == 0 else min(self.min_us, value_us)
+        self.max_us = max(self.max_us, value_us)
+        self.count += 1
+        self.total_us += value_us
+
+    def percentile(self, quantile: float) -> float:
+        """Return the duration in seconds at ``quantile`` (0-1), 0 if empty."""
+        if self.count == 0:
+            return 0.0
+        rank = max(1, int(quantile * self.count + 0.5))
+        seen = 0
+        for bucket in sorted(self._counts):
+            seen += self._counts[bucket]
+            if seen >= rank:
+                return min(self._bucket_upper(bucket), self.max_us) / 1e6
+        return self.max_us / 1e6
+
+    def snapshot(self) -> dict[str, float | int]:
+        """Return count, sum, min, max, mean and quantiles in seconds."""
+        summary: dict[str, float | int] = {
+            "count": self.count,
+            "sum": self.total_us / 1e6,
+            "min": self.min_us / 1e6,
+            "max": self.max_us / 1e6,
+            "mean": self.total_us / self.count / 1e6 if self.count else 0.0,
+        }
+        for quantile in QUANTILES:
+            summary[f"p{quantile * 100:g}"] = self.percentile(quantile)
+        return summary
+
+
+@dataclass(slots=True)
+class _OperationStats:
+    wall: LatencyHistogram = field(default_factory=LatencyHistogram)
+    errors: int = 0
+    cpu_seconds: float = 0.0
+    peak_rss_delta_bytes: int = 0
+    bytes_read: int = 0
+    bytes_written: int = 0
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "calls": self.wall.count,
+            "errors": self.errors,
+            "wall_seconds": self.wall.snapshot(),
+            "cpu_seconds": self.cpu_seconds,
+            "max_peak_rss_delta_bytes": self.peak_rss_delta_bytes,
+            "bytes_read": self.bytes_read,
+            "bytes_written": self.bytes_written,
+        }
+
+
+class MetricsRegistry:
+    """Thread-safe store of per-operation metrics, keyed by kind and name."""
+
+    KINDS = ("tool", "resource")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats: dict[tuple[str, str], _OperationStats] = {}
+        self.started_at = time.time()
+
+    def record(
+        self,
+        kind: str,
+        name: str,
+        *,
+        wall_seconds: float,
+        cpu_seconds: float = 0.0,
+        peak_rss_delta_bytes: int = 0,
+        bytes_read: int = 0,
+        bytes_written: int = 0,
+        error: bool = False,
+    ) -> None:
+        """Record one completed (or failed) operation."""
+        with self._lock:
+            stats = self._stats.get((kind, name))
+            if stats is None:
+                stats = self._stats[(kind, name)] = _OperationStats()
+            stats.wall.record(wall_seconds)
+            stats.cpu_seconds += cpu_seconds
+            stats.peak_rss_delta_bytes = max(stats.peak_rss_delta_bytes, peak_rss_delta_bytes)
+            stats.bytes_read += bytes_read
+            stats.bytes_written += bytes_written
+            stats.errors += int(error)
+
+    def reset(self) -> None:
+        """Drop all recorded metrics (testing helper)."""
+        with self._lock:
+            self._stats.clear()
+            self.started_at = time.time()
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return all metrics as a JSON-serialisable dictionary."""
+        with self._lock:
+            items = sorted(self._stats.items())
+            result: dict[str, Any] = {
+                "uptime_seconds": time.time() - self.started_at,
+                **{f"{kind}s": {} for kind in self.KINDS},
+            }
+            for (kind, name), stats in items:
+                result[f"{kind}s"][name] = stats.snapshot()
+        return result
+
+    def to_prometheus(self) -> str:
+        """Render metrics in the Prometheus text exposition format."""
+        lines = [
+            "# HELP gdal_mcp_uptime_seconds Seconds since metrics collection started.",
+            "# TYPE gdal_mcp_uptime_seconds gauge",
+            f"gdal_mcp_uptime_seconds {time.time() - self.started_at:.3f}",
+        ]
+        with self._lock:
+            items = sorted(self._stats.items())
+            lines.extend(_prometheus_summary(items))
+            for metric, kind_of, help_text, value_of in _PROMETHEUS_COUNTERS:
+                lines.append(f"# HELP {metric} {help_text}")
+                lines.append(f"# TYPE {metric} {kind_of}")
+                for (kind, name), stats in items:
+                    lines.append(f"{metric}{_labels(kind, name)} {value_of(stats)}")
+        return "\n".join(lines) + "\n"
+
+
+_PROMETHEUS_COUNTERS: tuple[tuple[str, str, str, Any], ...] = (
+    ("gdal_mcp_errors_total", "counter", "Failed operations.", lambda s: s.errors),
+    ("gdal_mcp_cpu_seconds_total", "counter", "Process CPU time.", lambda s: s.cpu_seconds),
+    (
+        "gdal_mcp_peak_rss_delta_bytes",
+        "gauge",
+        "Largest increase of the process peak RSS caused by one operation.",
+        lambda s: s.peak_rss_delta_bytes,
+    ),
+    ("gdal_mcp_read_bytes_total", "counter", "Input file bytes.", lambda s: s.bytes_read),
+    ("gdal_mcp_written_bytes_total", "counter", "Output bytes.", lambda s: s.bytes_written),
+)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(kind: str, name: str, **extra: str) -> str:
+    pairs = {"kind": kind, "name": name, **extra}
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in pairs.items()) + "}"
+
+
+def _prometheus_summary(items: list[tuple[tuple[str, str], _OperationStats]]) -> Iterator[str]:
+    yield "# HELP gdal_mcp_duration_seconds Wall time per operation."
+    yield "# TYPE gdal_mcp_duration_seconds summary"
+    for (kind, name), stats in items:
+        for quantile in QUANTILES:
+            labels = _labels(kind, name, quantile=f"{quantile:g}")
+            yield f"gdal_mcp_duration_seconds{labels} {stats.wall.percentile(quantile)}"
+        yield f"gdal_mcp_duration_seconds_sum{_labels(kind, name)} {stats.wall.total_us / 1e6}"
+        yield f"gdal_mcp_duration_seconds_count{_labels(kind, name)} {stats.wall.count}"
+
+
+_METRICS = MetricsRegistry()
+
+
+def get_metrics() -> MetricsRegistry:
+    """Return the process-wide metrics registry."""
+    return _METRICS
+
+
+def _max_rss_bytes() -> int:
+    if resource is None:  # pragma: no cover - platform specific
+        return 0
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _MAXRSS_UNIT
+
+
+def _input_bytes(call: ToolCall) -> int:
+    """Sum the sizes of existing input files among a call's validated paths.
+
+    Only paths that passed workspace validation are stat'ed; raw arguments
+    never are, so metrics cannot reveal whether files outside the workspaces
+    exist.
+    """
+    total = 0
+    for name in INPUT_PATH_ARGS & call.resolved_paths.keys():
+        try:
+            total += os.stat(call.resolved_paths[name]).st_size
+        except OSError:
+            continue
+    return total
+
+
+def _output_bytes(result: Any) -> int:
+    """Sum ``ResourceRef.size`` over every resource reference in a tool result."""
+    content = getattr(result, "structured_content", result)
+    total = 0
+    stack = [content]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            if "uri" in item and isinstance(item.get("size"), int):
+                total += item["size"]
+            stack.extend(item.values())
+        elif isinstance(item, list | tuple):
+            stack.extend(item)
+    return total
+
+
+def _resource_key(uri: str) -> str:
+    """Collapse a resource URI to its template family to bound metric cardinality."""
+    scheme, _, rest = uri.split("?", 1)[0].partition("://")
+    parts = rest.split("/")
+    if scheme == "metadata":
+        kind = next((part for part in reversed(parts[1:]) if part in _METADATA_KINDS), "other")
+        return f"metadata://{{file}}/{kind}"
+    return f"{scheme}://" + "/".join(parts[:2])
+
+
+class MetricsMiddleware(Middleware):
+    """Record wall time, CPU time, peak RSS growth, bytes and errors per operation.
+
+    Register it before :class:`ToolCallPipeline` so the measurements include
+    path validation and reflection checks, and denied calls count as errors.
+    Input bytes are taken from the paths the pipeline validated, so they are
+    only recorded for calls that pass it.
+
+    CPU time is process-wide (it includes the worker threads a tool fans out
+    to), and peak RSS growth is how far the call raised the process
+    high-water mark, so both are approximate when calls overlap.
+
+    Example:
+        >>> mcp.add_middleware(MetricsMiddleware())
+    """
+
+    def __init__(self, registry: MetricsRegistry | None = None) -> None:
+        self.registry = registry or get_metrics()
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[Any],
+        call_next: CallNext[Any, Any],
+    ) -> Any:
+        """Time a tool call and record the sizes of its inputs and outputs."""
+        tool_name, _ = extract_tool_call(context)
+        bytes_read: list[int] = []
+        with observe_tool_call(lambda call: bytes_read.append(_input_bytes(call))):
+            return await self._measure(
+                "tool", tool_name or "unknown", context, call_next, bytes_read=bytes_read
+            )
+
+    async def on_read_resource(
+        self,
+        context: MiddlewareContext[Any],
+        call_next: CallNext[Any, Any],
+    ) -> Any:
+        """Time a resource read."""
+        uri = str(getattr(context.message, "uri", "unknown"))
+        return await self._measure("resource", _resource_key(uri), context, call_next)
+
+    async def _measure(
+        self,
+        kind: str,
+        name: str,
+        context: MiddlewareContext[Any],
+        call_next: CallNext[Any, Any],
+        *,
+        bytes_read: list[int] | None = None,
+    ) -> Any:
+        rss_before = _max_rss_bytes()
+        cpu_before = time.process_time()
+        started = time.perf_counter()
+        result = None
+        failed = True
+        try:
+            result = await call_next(context)
+            failed = False
+            return result
+        finally:
+            self.registry.record(
+                kind,
+                name,
+                wall_seconds=time.perf_counter() - started,
+                cpu_seconds=time.process_time() - cpu_before,
+                peak_rss_delta_bytes=max(0, _max_rss_bytes() - rss_before),
+                bytes_read=sum(bytes_read or ()),
+                bytes_written=0 if failed or kind != "tool" else _output_bytes(result),
+                error=failed,
+            )
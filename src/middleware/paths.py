@@ -3,6 +3,12 @@
 from __future__ import annotations
 
 import logging
+import os
+import stat
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
@@ -13,6 +19,127 @@ from src.config import get_workspaces
 
 logger = logging.getLogger(__name__)
 
+# Bounded cache of resolved-path decisions (Path.resolve() stats every component)
+PATH_CACHE_SIZE = 4096
+# Cached decisions are re-checked against the lstat of every path component at most
+# this old; a changed component (e.g. a directory swapped for a symlink) forces full
+# re-resolution
+PATH_REVALIDATE_SECONDS = 5.0
+
+# Marker key for the node that terminates a workspace root in the prefix trie
+# (path components are never empty strings)
+_WORKSPACE_MARKER = ""
+
+# (st_dev, st_ino, file type) per path component, None past the first missing one
+Fingerprint = tuple[tuple[int, int, int] | None, ...] | None
+
+# Arguments that represent input file paths (read operations)
+INPUT_PATH_ARGS = frozenset({"uri", "path", "file", "input", "zones", "mask", "points_file"})
+
+# Arguments that represent output file paths (write operations)
+OUTPUT_PATH_ARGS = frozenset({"output", "destination", "dest", "target"})
+
+
+@dataclass(slots=True)
+class _Decision:
+    resolved: Path
+    fingerprint: Fingerprint
+    checked_at: float
+
+
+class _WorkspaceTrie:
+    """Prefix trie of workspace root components for O(depth) containment checks."""
+
+    def __init__(self, workspaces: tuple[Path, ...]) -> None:
+        self.workspaces = workspaces
+        self._root: dict[str, Any] = {}
+        for workspace in workspaces:
+            node = self._root
+            for part in workspace.parts:
+                node = node.setdefault(part, {})
+            node.setdefault(_WORKSPACE_MARKER, workspace)
+
+    def match(self, path: Path) -> Path | None:
+        """Return the workspace containing ``path`` or None."""
+        node = self._root
+        for part in path.parts:
+            node = node.get(part)  # type: ignore[assignment]
+            if node is None:
+                return None
+            if _WORKSPACE_MARKER in node:
+                return node[_WORKSPACE_MARKER]  # type: ignore[no-any-return]
+        return None
+
+
+_CACHE_LOCK = threading.Lock()
+_DECISIONS: OrderedDict[tuple[str, str, tuple[Path, ...]], _Decision] = OrderedDict()
+_TRIE: _WorkspaceTrie | None = None
+
+
+def _fingerprint(path: str) -> Fingerprint:
+    """Identify every component of ``path``; None if the chain holds a symlink.
+
+    Resolution depends on each ancestor, not just the last component: an output
+    path that does not exist yet escapes the workspace once a parent directory
+    is swapped for a symlink. Components past the first missing one are not
+    recorded (a later directory or symlink there changes the fingerprint).
+    Paths that go through a symlink are never cached, because the link's
+    target chain would need fingerprinting as well.
+    """
+    components: list[tuple[int, int, int] | None] = []
+    current = Path(os.getcwd(), path)
+    for prefix in (*reversed(current.parents), current):
+        try:
+            st = os.stat(prefix, follow_symlinks=False)
+        except OSError:
+            components.append(None)
+            break
+        if stat.S_ISLNK(st.st_mode):
+            return None
+        components.append((st.st_dev, st.st_ino, stat.S_IFMT(st.st_mode)))
+    return tuple(components)
+
+
+def _workspace_trie(workspaces: tuple[Path, ...]) -> _WorkspaceTrie:
+    global _TRIE
+    trie = _TRIE
+    if trie is None or trie.workspaces != workspaces:
+        trie = _WorkspaceTrie(workspaces)
+        _TRIE = trie
+    return trie
+
+
+def _cached_resolved(key: tuple[str, str, tuple[Path, ...]], path: str) -> Path | None:
+    with _CACHE_LOCK:
+        decision = _DECISIONS.get(key)
+        if decision is None:
+            return None
+        _DECISIONS.move_to_end(key)
+
+    now = time.monotonic()
+    if now - decision.checked_at < PATH_REVALIDATE_SECONDS:
+        return decision.resolved
+    if _fingerprint(path) != decision.fingerprint:
+        return None
+    decision.checked_at = now
+    return decision.resolved
+
+
+def _remember(
+    key: tuple[str, str, tuple[Path, ...]], resolved: Path, fingerprint: Fingerprint
+) -> None:
+    with _CACHE_LOCK:
+        _DECISIONS[key] = _Decision(resolved, fingerprint, time.monotonic())
+        _DECISIONS.move_to_end(key)
+        while len(_DECISIONS) > PATH_CACHE_SIZE:
+            _DECISIONS.popitem(last=False)
+
+
+def clear_path_cache() -> None:
+    """Reset cached path validation decisions (testing helper)."""
+    with _CACHE_LOCK:
+        _DECISIONS.clear()
+
 
 class PathValidationMiddleware(Middleware):
     """Middleware to validate file paths against allowed workspaces.
@@ -40,10 +167,10 @@ class PathValidationMiddleware(Middleware):
     """
 
     # Arguments that represent input file paths (read operations)
-    INPUT_PATH_ARGS = {"uri", "path", "file", "input"}
+    INPUT_PATH_ARGS = INPUT_PATH_ARGS
 
     # Arguments that represent output file paths (write operations)
-    OUTPUT_PATH_ARGS = {"output", "destination", "dest", "target"}
+    OUTPUT_PATH_ARGS = OUTPUT_PATH_ARGS
 
     async def on_call_tool(self, context: MiddlewareContext, call_next: Any) -> Any:
         """Intercept tool calls to validate path arguments.
@@ -61,41 +188,60 @@ class PathValidationMiddleware(Middleware):
         tool_name = context.message.name
         arguments = context.message.arguments or {}
 
-        logger.debug(f"PathValidationMiddleware: Checking tool '{tool_name}'")
-
-        # Validate input paths (read operations)
-        for arg_name in self.INPUT_PATH_ARGS:
-            if arg_name in arguments:
-                path_value = arguments[arg_name]
-                if path_value:  # Skip empty/None values
-                    try:
-                        logger.debug(f"Validating input path '{arg_name}': {path_value}")
-                        # This will raise ToolError if path is not allowed
-                        validate_path(str(path_value))
-                        logger.debug(f"✓ Input path '{path_value}' allowed")
-                    except ToolError as e:
-                        # Enhance error message with tool context
-                        raise ToolError(f"Tool '{tool_name}' denied: {str(e)}") from e
-
-        # Validate output paths (write operations)
-        for arg_name in self.OUTPUT_PATH_ARGS:
-            if arg_name in arguments:
-                path_value = arguments[arg_name]
-                if path_value:  # Skip empty/None values
-                    try:
-                        logger.debug(f"Validating output path '{arg_name}': {path_value}")
-                        # Use output-specific validation (checks parent directory)
-                        validate_output_path(str(path_value))
-                        logger.debug(f"✓ Output path '{path_value}' allowed")
-                    except ToolError as e:
-                        # Enhance error message with tool context
-                        raise ToolError(f"Tool '{tool_name}' denied: {str(e)}") from e
+        validate_tool_paths(tool_name, arguments)
 
         # All paths validated - proceed with tool execution
         logger.debug(f"✓ All paths validated for '{tool_name}', executing tool")
         return await call_next(context)
 
 
+def validate_tool_paths(tool_name: str, arguments: dict[str, Any]) -> dict[str, Path]:
+    """Validate every path argument of a tool call.
+
+    Args:
+        tool_name: Name of the tool being called (used in error messages)
+        arguments: Tool arguments
+
+    Returns:
+        Resolved absolute paths keyed by argument name
+
+    Raises:
+        ToolError: If any path argument is outside allowed workspaces
+    """
+    logger.debug(f"PathValidationMiddleware: Checking tool '{tool_name}'")
+    resolved: dict[str, Path] = {}
+
+    # Validate input paths (read operations)
+    for arg_name in INPUT_PATH_ARGS:
+        if arg_name in arguments:
+            path_value = arguments[arg_name]
+            if path_value:  # Skip empty/None values
+                try:
+                    logger.debug(f"Validating input path '{arg_name}': {path_value}")
+                    # This will raise ToolError if path is not allowed
+                    resolved[arg_name] = validate_path(str(path_value))
+                    logger.debug(f"✓ Input path '{path_value}' allowed")
+                except ToolError as e:
+                    # Enhance error message with tool context
+                    raise ToolError(f"Tool '{tool_name}' denied: {str(e)}") from e
+
+    # Validate output paths (write operations)
+    for arg_name in OUTPUT_PATH_ARGS:
+        if arg_name in arguments:
+            path_value = arguments[arg_name]
+            if path_value:  # Skip empty/None values
+                try:
+                    logger.debug(f"Validating output path '{arg_name}': {path_value}")
+                    # Use output-specific validation (checks parent directory)
+                    resolved[arg_name] = validate_output_path(str(path_value))
+                    logger.debug(f"✓ Output path '{path_value}' allowed")
+                except ToolError as e:
+                    # Enhance error message with tool context
+                    raise ToolError(f"Tool '{tool_name}' denied: {str(e)}") from e
+
+    return resolved
+
+
 def validate_path(path: str, workspaces: list[Path] | None = None) -> Path:
     """Validate path against allowed workspace directories.
 
@@ -135,6 +281,17 @@ def validate_path(path: str, workspaces: list[Path] | None = None) -> Path:
     """
     if workspaces is None:
         workspaces = get_workspaces()
+    workspace_key = tuple(workspaces)
+
+    # Relative paths resolve against the CWD, so it is part of the cache key
+    base = "" if os.path.isabs(path) else os.getcwd()
+    cache_key = (base, path, workspace_key)
+    cached = _cached_resolved(cache_key, path)
+    if cached is not None:
+        return cached
+
+    # Fingerprint before resolving so a swap in between is caught on the next check
+    fingerprint = _fingerprint(path)
 
     # Resolve to absolute path (handles .., symlinks, relative paths)
     try:
@@ -142,21 +299,13 @@ def validate_path(path: str, workspaces: list[Path] | None = None) -> Path:
     except (OSError, RuntimeError) as e:
         raise ToolError(f"Invalid path '{path}': {str(e)}") from e
 
-    # If no workspaces configured, allow all paths (development mode)
-    if not workspaces:
+    # If no workspaces configured, allow all paths (development mode);
+    # otherwise the path must fall within one of the allowed workspaces
+    if not workspaces or _workspace_trie(workspace_key).match(resolved) is not None:
+        if fingerprint is not None:
+            _remember(cache_key, resolved, fingerprint)
         return resolved
 
-    # Check if path is within any allowed workspace
-    for workspace in workspaces:
-        try:
-            # This will succeed only if resolved is within workspace
-            resolved.relative_to(workspace)
-            # Path is allowed - return it
-            return resolved
-        except ValueError:
-            # Not in this workspace, try next
-            continue
-
     # Path is outside all allowed workspaces - DENY
     workspace_list = "\n".join(f"  • {ws}" for ws in workspaces)
     msg = (
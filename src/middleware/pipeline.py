@@ -0,0 +1,101 @@
+"""Single-pass tool call pipeline for path validation and reflection preflight."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Sequence
+from time import perf_counter
+from typing import Any
+
+from fastmcp.server.middleware.middleware import CallNext, Middleware, MiddlewareContext
+
+from src.middleware.paths import validate_tool_paths
+from src.middleware.reflection_transform import check_reflections
+from src.middleware.tool_call import (
+    _CURRENT_CALL,
+    ToolCall,
+    extract_tool_call,
+    notify_tool_call,
+)
+
+logger = logging.getLogger(__name__)
+
+Stage = Callable[[ToolCall], None]
+
+
+def path_validation_stage(call: ToolCall) -> None:
+    """Validate path arguments against workspaces and record the resolved paths."""
+    call.resolved_paths.update(validate_tool_paths(call.name, call.arguments))
+
+
+def reflection_stage(call: ToolCall) -> None:
+    """Require cached justifications for tools listed in ``TOOL_REFLECTIONS``."""
+    call.reflection_hashes.update(check_reflections(call.name, call.arguments))
+
+
+# Security before epistemics: never hash or look up justifications for a denied call
+DEFAULT_STAGES: tuple[tuple[str, Stage], ...] = (
+    ("paths", path_validation_stage),
+    ("reflection", reflection_stage),
+)
+
+
+class ToolCallPipeline(Middleware):
+    """Run ordered pre-execution stages over a tool call parsed once.
+
+    Each stage receives the same :class:`ToolCall`, so results such as resolved
+    paths and reflection cache keys are computed once and visible to later
+    stages and, through :func:`current_tool_call`, to the tool itself. Time
+    spent in each stage is accumulated and available from :meth:`overhead`.
+
+    Example:
+        >>> mcp.add_middleware(ToolCallPipeline())
+    """
+
+    def __init__(self, stages: Sequence[tuple[str, Stage]] = DEFAULT_STAGES) -> None:
+        self._stages = tuple(stages)
+        self.calls = 0
+        self.stage_seconds: dict[str, float] = {name: 0.0 for name, _ in self._stages}
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[Any],
+        call_next: CallNext[Any, Any],
+    ) -> Any:
+        """Run every stage, then execute the tool with the shared call state."""
+        tool_name, arguments = extract_tool_call(context)
+        if not tool_name:
+            # Reflection is keyed by tool name, but workspace checks must never fail open
+            logger.warning("ToolCallPipeline: Unable to determine tool name; validating paths only")
+            validate_tool_paths("<unknown>", arguments)
+            return await call_next(context)
+
+        call = ToolCall(name=tool_name, arguments=arguments)
+        self.calls += 1
+        for stage_name, stage in self._stages:
+            started = perf_counter()
+            try:
+                stage(call)
+            finally:
+                elapsed = perf_counter() - started
+                call.timings[stage_name] = elapsed
+                self.stage_seconds[stage_name] += elapsed
+
+        logger.debug(
+            "Pipeline overhead for '%s': %s",
+            tool_name,
+            ", ".join(f"{name}={seconds * 1e6:.0f}µs" for name, seconds in call.timings.items()),
+        )
+
+        notify_tool_call(call)
+        token = _CURRENT_CALL.set(call)
+        try:
+            return await call_next(context)
+        finally:
+            _CURRENT_CALL.reset(token)
+
+    def overhead(self) -> dict[str, float]:
+        """Return mean seconds per call spent in each stage."""
+        if not self.calls:
+            return dict.fromkeys(self.stage_seconds, 0.0)
+        return {name: total / self.calls for name, total in self.stage_seconds.items()}
@@ -13,6 +13,7 @@ from typing import Any
 from fastmcp.exceptions import ToolError
 
 from src.middleware.reflection_store import get_store
+from src.middleware.tool_call import current_tool_call
 from src.prompts import aggregation, crs, hydrology, resampling
 from src.prompts.justification import Justification
 
@@ -30,6 +31,10 @@ _PROMPT_SOURCE_FETCHERS: dict[str, Callable[[], str]] = {
     "justify_aggregation_strategy": lambda: inspect.getsource(aggregation.register),
 }
 
+# Prompt source is fixed for the lifetime of the process, so each prompt is hashed
+# once; getsource() reads and tokenizes the module file on every call otherwise.
+_PROMPT_HASH_CACHE: dict[str, str] = {}
+
 
 def _get_prompt_source(prompt_name: str) -> str:
     try:
@@ -95,8 +100,25 @@ def _normalize_prompt_args(prompt_args: dict[str, Any]) -> dict[str, Any]:
 
 
 def _hash_prompt_content(prompt_name: str) -> str:
+    cached = _PROMPT_HASH_CACHE.get(prompt_name)
+    if cached is not None:
+        return cached
+
     prompt_source = _get_prompt_source(prompt_name)
-    return hashlib.sha256(prompt_source.encode("utf-8")).hexdigest()[:16]
+    prompt_hash = hashlib.sha256(prompt_source.encode("utf-8")).hexdigest()[:16]
+    _PROMPT_HASH_CACHE[prompt_name] = prompt_hash
+    return prompt_hash
+
+
+def warm_prompt_hashes() -> None:
+    """Hash every known reflection prompt up front so tool calls never touch disk."""
+    for prompt_name in _PROMPT_SOURCE_FETCHERS:
+        _hash_prompt_content(prompt_name)
+
+
+def reset_prompt_hash_cache() -> None:
+    """Reset the prompt hash cache (useful for testing)."""
+    _PROMPT_HASH_CACHE.clear()
 
 
 def _stable_hash(prompt_args: dict[str, Any], domain: str, prompt_hash: str) -> str:
@@ -227,6 +249,13 @@ def requires_reflection(
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
             reflection_payload = kwargs.pop("__reflection", None)
 
+            # The middleware pipeline already hashed the arguments and found these
+            current_call = current_tool_call()
+            verified = current_call.reflection_hashes if current_call else {}
+            if reflection_payload is None and all(spec["domain"] in verified for spec in spec_list):
+                logger.debug("Reflections verified by the pipeline for %s", fn.__name__)
+                return await fn(*args, **kwargs)
+
             call_args = _bind_arguments(fn, *args, **kwargs)
             spec_states = [_build_spec_state(fn.__name__, spec, call_args) for spec in spec_list]
 
@@ -278,11 +307,13 @@ def requires_reflection(
                 )
 
             store = get_store()
+            # Keys the middleware pipeline already confirmed need no second lookup
+            verified_keys = set(verified.values())
             missing_specs: list[dict[str, Any]] = []
             for state in spec_states:
                 spec = state["spec"]
                 hash_key = state["hash_key"]
-                if not store.has(hash_key, spec["domain"]):
+                if hash_key not in verified_keys and not store.has(hash_key, spec["domain"]):
                     missing_specs.append(
                         {
                             "spec": spec,
@@ -329,6 +360,8 @@ def requires_reflection(
 
 __all__ = [
     "requires_reflection",
+    "warm_prompt_hashes",
+    "reset_prompt_hash_cache",
     "_stable_hash",
     "_hash_prompt_content",
     "_normalize_prompt_args",
@@ -61,6 +61,10 @@ TOOL_REFLECTIONS: dict[str, list[ReflectionSpec]] = {
 }
 
 
+# Precomputed membership set so tools without reflections skip preflight work entirely
+REFLECTION_TOOLS: frozenset[str] = frozenset(TOOL_REFLECTIONS)
+
+
 def get_tool_reflections(tool_name: str) -> list[ReflectionSpec]:
     """Get reflection specs for a tool.
 
@@ -82,4 +86,4 @@ def has_reflections(tool_name: str) -> bool:
     Returns:
         True if tool has reflection requirements
     """
-    return tool_name in TOOL_REFLECTIONS
+    return tool_name in REFLECTION_TOOLS
@@ -8,6 +8,7 @@ from typing import Any
 from fastmcp.server.middleware.middleware import CallNext, Middleware, MiddlewareContext
 
 from src.middleware.reflection_transform import reflection_preflight_check
+from src.middleware.tool_call import extract_tool_call
 
 logger = logging.getLogger(__name__)
 
@@ -35,19 +36,7 @@ class ReflectionMiddleware(Middleware):
             Result from the tool or raises ToolError if reflections missing
         """
         # Extract tool name and arguments from context (support both new and legacy APIs)
-        tool_name = None
-        arguments: dict[str, Any] = {}
-        try:
-            # Preferred FastMCP API
-            tool_name = context.message.name
-            arguments = context.message.arguments or {}
-        except AttributeError:
-            # Fallback to legacy request-based API if present
-            request = getattr(context, "request", None)
-            if request is not None and hasattr(request, "params"):
-                params = request.params or {}
-                tool_name = params.get("name")
-                arguments = params.get("arguments", {}) or {}
+        tool_name, arguments = extract_tool_call(context)
 
         logger.debug(f"Reflection middleware intercepting tool call: {tool_name}")
 
@@ -0,0 +1,205 @@
+"""SQLite-backed store for justification artifacts.
+
+Intended for deployments that run several server processes against the same
+justification cache. The database runs in WAL mode so readers never block the
+single writer, and lookups use the (domain, hash) primary key index.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from src.middleware.reflection_store import (
+    DEFAULT_STORE_ROOT,
+    ReflectionStore,
+    _serialize,
+)
+from src.prompts.justification import Justification
+
+__all__ = ["SQLiteStore", "DEFAULT_DB_PATH"]
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = ".preflight/justifications.sqlite3"
+BUSY_TIMEOUT_SECONDS = 30.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS justifications (
+    domain TEXT NOT NULL,
+    hash TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    created_at INTEGER NOT NULL,
+    PRIMARY KEY (domain, hash)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_justifications_created_at ON justifications (created_at);
+"""
+
+
+class SQLiteStore(ReflectionStore):
+    """Persist justifications in a single SQLite database.
+
+    Entries are addressed by ``(domain, hash)``. To stay compatible with the
+    path-based :class:`ReflectionStore` interface, ``put`` returns a virtual
+    path of the form ``<db>/<domain>/<hash>.json`` that ``get`` understands.
+
+    Args:
+        path: Database file location.
+        ttl_seconds: Optional maximum age; older entries are treated as missing
+            and can be removed with :meth:`prune`.
+    """
+
+    def __init__(self, path: str = DEFAULT_DB_PATH, ttl_seconds: int | None = None) -> None:
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._ttl_seconds = ttl_seconds
+        self._local = threading.local()
+
+        conn = self._connect()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        # sqlite3 connections must not be shared across threads; keep one per thread
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self._path, timeout=BUSY_TIMEOUT_SECONDS, isolation_level=None)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _prefix(domain: str) -> str:
+        return domain.replace("_justification", "")
+
+    def _min_created_at(self) -> int:
+        if self._ttl_seconds is None:
+            return 0
+        return int(time.time()) - self._ttl_seconds
+
+    def path_for(self, key: str, domain: str) -> Path:
+        """Return the virtual path addressing a justification entry."""
+        return self._path / self._prefix(domain) / f"{key}.json"
+
+    def has(self, key: str, domain: str) -> bool:
+        """Return True if a non-expired justification exists for the given key/domain."""
+        row = (
+            self._connect()
+            .execute(
+                "SELECT 1 FROM justifications WHERE domain = ? AND hash = ? AND created_at >= ?",
+                (self._prefix(domain), key, self._min_created_at()),
+            )
+            .fetchone()
+        )
+        return row is not None
+
+    def get(self, key_path: str) -> dict[str, Any] | None:
+        """Retrieve a non-expired justification by the virtual path returned from ``put``."""
+        path = Path(key_path)
+        if path.suffix != ".json":
+            return None
+        row = (
+            self._connect()
+            .execute(
+                "SELECT payload FROM justifications "
+                "WHERE domain = ? AND hash = ? AND created_at >= ?",
+                (path.parent.name, path.stem, self._min_created_at()),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return None
+        return json.loads(row[0])  # type: ignore[no-any-return]
+
+    def put(self, key: str, value: Justification, domain: str) -> Path:
+        """Insert or replace a single justification."""
+        self.put_many([(key, value, domain)])
+        return self.path_for(key, domain)
+
+    def put_many(self, entries: Iterable[tuple[str, Justification, str]]) -> int:
+        """Insert or replace several justifications in one transaction.
+
+        Returns:
+            Number of rows written.
+        """
+        rows = []
+        for key, value, domain in entries:
+            payload = _serialize(value)
+            rows.append(
+                (self._prefix(domain), key, json.dumps(payload), payload["_meta"]["created_at"])
+            )
+        self._write_rows(rows, replace=True)
+        return len(rows)
+
+    def _write_rows(self, rows: list[tuple[str, str, str, int]], *, replace: bool) -> None:
+        if not rows:
+            return
+        verb = "INSERT OR REPLACE" if replace else "INSERT OR IGNORE"
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(
+                f"{verb} INTO justifications (domain, hash, payload, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def prune(self, max_age_seconds: int | None = None) -> int:
+        """Delete entries older than ``max_age_seconds`` (defaults to the store TTL).
+
+        Returns:
+            Number of rows removed.
+        """
+        age = max_age_seconds if max_age_seconds is not None else self._ttl_seconds
+        if age is None:
+            return 0
+        cutoff = int(time.time()) - age
+        cursor = self._connect().execute(
+            "DELETE FROM justifications WHERE created_at < ?",
+            (cutoff,),
+        )
+        return cursor.rowcount
+
+    def migrate_from_directory(self, root: str = DEFAULT_STORE_ROOT) -> int:
+        """Import justifications written by :class:`DiskStore` under ``root``.
+
+        Existing rows are kept, so the import can be repeated safely while
+        other processes are still writing JSON files.
+
+        Returns:
+            Number of JSON files read.
+        """
+        root_path = Path(root)
+        if not root_path.is_dir():
+            return 0
+
+        rows: list[tuple[str, str, str, int]] = []
+        for path in root_path.glob("*/*.json"):
+            if path.name.startswith("."):
+                continue
+            try:
+                payload = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as exc:
+                logger.warning("Skipping unreadable justification %s: %s", path, exc)
+                continue
+            created_at = int(payload.get("_meta", {}).get("created_at") or path.stat().st_mtime)
+            rows.append((path.parent.name, path.stem, json.dumps(payload), created_at))
+
+        self._write_rows(rows, replace=False)
+        logger.info("Migrated %d justification(s) from %s into %s", len(rows), root, self._path)
+        return len(rows)
+
+    def count(self) -> int:
+        """Return the number of stored justifications."""
+        row = self._connect().execute("SELECT COUNT(*) FROM justifications").fetchone()
+        return int(row[0])
@@ -2,21 +2,37 @@
 
 from __future__ import annotations
 
+import atexit
 import json
+import logging
+import os
+import tempfile
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Any
 
+from src.config import get_reflection_store_backend, get_reflection_ttl_seconds
 from src.prompts.justification import Justification
 
-__all__ = ["ReflectionStore", "DiskStore", "get_store"]
+__all__ = ["ReflectionStore", "DiskStore", "IndexedDiskStore", "get_store"]
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_ROOT = ".preflight/justifications"
+_SUFFIX = ".json"
 
 
 class ReflectionStore:
     """Abstract interface describing justification storage operations."""
 
+    def has(self, key: str, domain: str) -> bool:  # pragma: no cover - interface
+        """Return True if a justification exists for the given key/domain."""
+        raise NotImplementedError
+
     def get(self, key_path: str) -> dict[str, Any] | None:  # pragma: no cover - interface
-        """Retrieve a justification by path."""
+        """Retrieve a justification by path, or None if it is missing or expired."""
         raise NotImplementedError
 
     def put(
@@ -32,14 +48,21 @@ class ReflectionStore:
 class DiskStore(ReflectionStore):
     """Persist justifications to disk using operation-aware hashes."""
 
-    def __init__(self, root: str = ".preflight/justifications") -> None:
+    def __init__(self, root: str = DEFAULT_STORE_ROOT) -> None:
         self._root = Path(root)
         self._root.mkdir(parents=True, exist_ok=True)
+        self._known_dirs: set[str] = set()
+
+    @staticmethod
+    def _prefix(domain: str) -> str:
+        return domain.replace("_justification", "")
 
     def _risk_dir(self, domain: str) -> Path:
-        prefix = domain.replace("_justification", "")
+        prefix = self._prefix(domain)
         path = self._root / prefix
-        path.mkdir(parents=True, exist_ok=True)
+        if prefix not in self._known_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(prefix)
         return path
 
     def _path_for(self, key: str, domain: str) -> Path:
@@ -56,41 +79,183 @@ class DiskStore(ReflectionStore):
     def get(self, key_path: str) -> dict[str, Any] | None:
         """Retrieve a justification by path."""
         path = Path(key_path)
-        if path.exists():
+        try:
             return json.loads(path.read_text(encoding="utf-8"))  # type: ignore[no-any-return]
-        return None
+        except FileNotFoundError:
+            return None
 
     def put(self, key: str, value: Justification, domain: str) -> Path:
         """Atomically write justification to disk (temp + rename for crash safety)."""
         path = self._path_for(key, domain)
-        payload = value.model_dump()
-        payload["_meta"] = {"created_at": int(time.time())}
+        _write_atomic(path, _serialize(value))
+        return path
+
+
+class IndexedDiskStore(DiskStore):
+    """Disk store with an in-memory key index and write-behind persistence.
 
-        # Write to temp file first, then atomic rename
-        import tempfile
+    The set of stored keys is loaded once per domain directory, so ``has`` is a
+    set lookup with no filesystem access on a hit. On a miss the directory mtime
+    is compared with the one seen at load time; if another process sharing the
+    same root has written since, the directory is re-listed, which also drops
+    keys whose files were deleted. A ``get`` that finds the backing file gone
+    drops its key straight away. Writes update the index immediately and are
+    persisted on a background thread using the same temp file + atomic rename
+    as :class:`DiskStore`.
+    """
 
-        temp_fd, temp_path = tempfile.mkstemp(
-            dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
-        )
+    def __init__(self, root: str = DEFAULT_STORE_ROOT) -> None:
+        super().__init__(root)
+        self._lock = threading.Lock()
+        self._index: dict[str, set[str]] = {}
+        self._dir_mtimes: dict[str, int] = {}
+        self._pending: dict[Path, dict[str, Any]] = {}
+        self._futures: set[Future[None]] = set()
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="reflection-store")
+
+        for entry in self._root.iterdir():
+            if entry.is_dir() and not entry.name.startswith("."):
+                self._load_dir(entry.name)
+
+        atexit.register(self.flush)
+
+    def _load_dir(self, prefix: str) -> None:
+        directory = self._root / prefix
         try:
-            with open(temp_fd, "w", encoding="utf-8") as f:
-                f.write(json.dumps(payload, indent=2))
-            # Atomic rename (POSIX guarantees atomicity)
-            Path(temp_path).rename(path)
-        except Exception:
-            # Clean up temp file on error
-            Path(temp_path).unlink(missing_ok=True)
-            raise
+            # Record mtime before listing so a concurrent write forces a later reload
+            mtime = directory.stat().st_mtime_ns
+            keys = {
+                entry.name[: -len(_SUFFIX)]
+                for entry in os.scandir(directory)
+                if entry.name.endswith(_SUFFIX) and not entry.name.startswith(".")
+            }
+        except FileNotFoundError:
+            return
+
+        with self._lock:
+            # Replace rather than merge so deleted files leave the index; keys
+            # still waiting on the background writer are not on disk yet
+            pending = {path.stem for path in self._pending if path.parent.name == prefix}
+            self._index[prefix] = keys | pending
+            self._dir_mtimes[prefix] = mtime
+
+    def _refresh(self, prefix: str) -> bool:
+        """Reload a domain directory if another writer changed it; return True if reloaded."""
+        try:
+            mtime = (self._root / prefix).stat().st_mtime_ns
+        except FileNotFoundError:
+            return False
+        if mtime == self._dir_mtimes.get(prefix):
+            return False
+        self._load_dir(prefix)
+        return True
+
+    def has(self, key: str, domain: str) -> bool:
+        """Return True if a justification exists for the given key/domain."""
+        prefix = self._prefix(domain)
+        keys = self._index.get(prefix)
+        if keys is not None and key in keys:
+            return True
+        if not self._refresh(prefix):
+            return False
+        return key in self._index.get(prefix, ())
 
+    def get(self, key_path: str) -> dict[str, Any] | None:
+        """Retrieve a justification by path, including writes not yet flushed."""
+        path = Path(key_path)
+        with self._lock:
+            pending = self._pending.get(path)
+        if pending is not None:
+            return dict(pending)
+        payload = super().get(key_path)
+        if payload is None:
+            # The file was deleted behind the index; stop reporting the key
+            with self._lock:
+                if path not in self._pending:
+                    self._index.get(path.parent.name, set()).discard(path.stem)
+        return payload
+
+    def put(self, key: str, value: Justification, domain: str) -> Path:
+        """Index the justification immediately and persist it in the background."""
+        prefix = self._prefix(domain)
+        path = self._path_for(key, domain)
+        payload = _serialize(value)
+
+        with self._lock:
+            self._index.setdefault(prefix, set()).add(key)
+            self._pending[path] = payload
+            future = self._writer.submit(self._persist, path, payload)
+            self._futures.add(future)
+        future.add_done_callback(self._futures.discard)
         return path
 
+    def _persist(self, path: Path, payload: dict[str, Any]) -> None:
+        try:
+            _write_atomic(path, payload)
+        except Exception:
+            logger.exception("Failed to persist justification to %s", path)
+        finally:
+            with self._lock:
+                if self._pending.get(path) is payload:
+                    del self._pending[path]
+
+    def flush(self) -> None:
+        """Block until every queued write has reached disk."""
+        with self._lock:
+            futures = list(self._futures)
+        wait(futures)
+
+    def close(self) -> None:
+        """Flush pending writes and stop the background writer."""
+        self.flush()
+        self._writer.shutdown(wait=True)
+        atexit.unregister(self.flush)
+
+
+def _serialize(value: Justification) -> dict[str, Any]:
+    payload = value.model_dump()
+    payload["_meta"] = {"created_at": int(time.time())}
+    return payload
+
+
+def _write_atomic(path: Path, payload: dict[str, Any]) -> None:
+    # Write to temp file first, then atomic rename
+    temp_fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with open(temp_fd, "w", encoding="utf-8") as f:
+            f.write(json.dumps(payload, indent=2))
+        # Atomic rename (POSIX guarantees atomicity)
+        Path(temp_path).rename(path)
+    except Exception:
+        # Clean up temp file on error
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+
+
+_STORE_BACKENDS: dict[str, type[DiskStore]] = {
+    "disk": DiskStore,
+    "indexed": IndexedDiskStore,
+}
+
+_DEFAULT_STORE: ReflectionStore | None = None
+
+
+def _create_store(backend: str) -> ReflectionStore:
+    if backend != "sqlite":
+        return _STORE_BACKENDS[backend]()
+
+    from src.middleware.reflection_sqlite import SQLiteStore
 
-_DEFAULT_STORE: DiskStore | None = None
+    store = SQLiteStore(ttl_seconds=get_reflection_ttl_seconds())
+    if store.count() == 0:
+        # First start on SQLite: carry over justifications from the directory layout
+        store.migrate_from_directory(DEFAULT_STORE_ROOT)
+    return store
 
 
-def get_store() -> DiskStore:
-    """Return the shared disk-backed justification store instance."""
+def get_store() -> ReflectionStore:
+    """Return the shared justification store for the configured backend."""
     global _DEFAULT_STORE
     if _DEFAULT_STORE is None:
-        _DEFAULT_STORE = DiskStore()
+        _DEFAULT_STORE = _create_store(get_reflection_store_backend())
     return _DEFAULT_STORE
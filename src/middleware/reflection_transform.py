@@ -13,7 +13,7 @@ from src.middleware.preflight import (
     _normalize_prompt_args,
     _stable_hash,
 )
-from src.middleware.reflection_config import get_tool_reflections
+from src.middleware.reflection_config import REFLECTION_TOOLS, get_tool_reflections
 from src.middleware.reflection_store import get_store
 
 logger = logging.getLogger(__name__)
@@ -63,12 +63,30 @@ async def reflection_preflight_check(
     Raises:
         ToolError: If required reflections are missing from cache
     """
-    specs = get_tool_reflections(tool_name)
-    if not specs:
+    check_reflections(tool_name, arguments)
+
+
+def check_reflections(tool_name: str, arguments: dict[str, Any]) -> dict[str, str]:
+    """Verify required reflections are cached for a tool call.
+
+    Args:
+        tool_name: Name of the tool being called
+        arguments: Tool arguments (kwargs)
+
+    Returns:
+        Cache keys of the justifications found, keyed by domain (empty for
+        tools without reflection requirements)
+
+    Raises:
+        ToolError: If required reflections are missing from cache
+    """
+    if tool_name not in REFLECTION_TOOLS:
         # No reflections required for this tool
-        return
+        return {}
 
+    specs = get_tool_reflections(tool_name)
     store = get_store()
+    found: dict[str, str] = {}
     missing_reflections: list[dict[str, Any]] = []
 
     for spec in specs:
@@ -92,6 +110,7 @@ async def reflection_preflight_check(
                 f"Reflection cache miss for {tool_name}: {spec.domain} (hash={hash_key[:16]}...)"
             )
         else:
+            found[spec.domain] = hash_key
             logger.debug(
                 f"Reflection cache hit for {tool_name}: {spec.domain} (hash={hash_key[:16]}...)"
             )
@@ -119,3 +138,4 @@ async def reflection_preflight_check(
 
     # All required reflections present - allow execution
     logger.info(f"All reflections present for {tool_name}, proceeding with execution")
+    return found
@@ -0,0 +1,95 @@
+"""Per-call state shared between middleware stages and tool code."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover - import for type checking only
+    from src.shared.budget import Admission
+
+__all__ = [
+    "ToolCall",
+    "current_tool_call",
+    "extract_tool_call",
+    "notify_tool_call",
+    "observe_tool_call",
+]
+
+
+@dataclass(slots=True)
+class ToolCall:
+    """Tool call arguments parsed once, plus results produced by pipeline stages.
+
+    Attributes:
+        name: Tool name from the MCP request.
+        arguments: Raw tool arguments.
+        resolved_paths: Validated absolute paths keyed by argument name.
+        reflection_hashes: Justification cache keys confirmed present, keyed by domain.
+        timings: Seconds spent in each pipeline stage.
+        admission: Memory granted by admission control, including the mode
+            ("full", "windowed" or "sampled") the tool must run in.
+    """
+
+    name: str
+    arguments: dict[str, Any]
+    resolved_paths: dict[str, Path] = field(default_factory=dict)
+    reflection_hashes: dict[str, str] = field(default_factory=dict)
+    timings: dict[str, float] = field(default_factory=dict)
+    admission: Admission | None = None
+
+
+_CURRENT_CALL: ContextVar[ToolCall | None] = ContextVar("gdal_mcp_tool_call", default=None)
+
+
+def current_tool_call() -> ToolCall | None:
+    """Return the tool call being executed in this context, if any."""
+    return _CURRENT_CALL.get()
+
+
+_CALL_OBSERVER: ContextVar[Callable[[ToolCall], None] | None] = ContextVar(
+    "gdal_mcp_tool_call_observer", default=None
+)
+
+
+@contextmanager
+def observe_tool_call(observer: Callable[[ToolCall], None]) -> Iterator[None]:
+    """Call ``observer`` with the tool call once an inner pipeline has validated it.
+
+    Lets middleware registered before :class:`ToolCallPipeline` use the
+    pipeline's results (such as resolved paths) without re-parsing arguments.
+    """
+    token = _CALL_OBSERVER.set(observer)
+    try:
+        yield
+    finally:
+        _CALL_OBSERVER.reset(token)
+
+
+def notify_tool_call(call: ToolCall) -> None:
+    """Pass a tool call that passed every pipeline stage to the active observer."""
+    observer = _CALL_OBSERVER.get()
+    if observer is not None:
+        observer(call)
+
+
+def extract_tool_call(context: Any) -> tuple[str | None, dict[str, Any]]:
+    """Extract tool name and arguments from a middleware context.
+
+    Supports both the FastMCP ``context.message`` API and the legacy
+    request-based API.
+    """
+    try:
+        # Preferred FastMCP API
+        return context.message.name, context.message.arguments or {}
+    except AttributeError:
+        # Fallback to legacy request-based API if present
+        request = getattr(context, "request", None)
+        if request is not None and hasattr(request, "params"):
+            params = request.params or {}
+            return params.get("name"), params.get("arguments", {}) or {}
+    return None, {}
@@ -0,0 +1,76 @@
+"""Raster clipping models."""
+
+from __future__ import annotations
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from src.models.raster.convert import CompressionMethod
+from src.models.resourceref import ResourceRef
+
+
+class Params(BaseModel):
+    """Parameters for raster clipping."""
+
+    bounds: list[float] | None = Field(
+        None,
+        min_length=4,
+        max_length=4,
+        description="Bounding box [minx, miny, maxx, maxy] to clip to",
+    )
+    bounds_crs: str | None = Field(
+        None,
+        description="CRS of bounds (e.g. 'EPSG:4326'); default is the raster's CRS",
+    )
+    mask: str | None = Field(
+        None,
+        description="Path to polygon layer to clip to (alternative to bounds)",
+    )
+    all_touched: bool = Field(
+        default=False,
+        description="With a mask, keep every pixel a polygon touches, not only pixel centres",
+    )
+    nodata: float | None = Field(
+        None,
+        description=(
+            "Value for pixels outside the mask when the source has no nodata value; "
+            "must be representable in the raster data type"
+        ),
+    )
+    compression: CompressionMethod | None = Field(
+        None,
+        description="GeoTIFF compression for the output (default: same as source)",
+    )
+
+    model_config = ConfigDict()
+
+    @model_validator(mode="after")
+    def _one_extent(self) -> Params:
+        if (self.bounds is None) == (self.mask is None):
+            raise ValueError("Provide exactly one of bounds or mask")
+        return self
+
+
+class Window(BaseModel):
+    """Pixel window of the source raster that was read."""
+
+    col_off: int = Field(ge=0, description="First source column")
+    row_off: int = Field(ge=0, description="First source row")
+    width: int = Field(ge=1, description="Window width in pixels")
+    height: int = Field(ge=1, description="Window height in pixels")
+
+
+class Result(BaseModel):
+    """Result of a raster clipping operation."""
+
+    output: ResourceRef = Field(description="Reference to the clipped raster (GeoTIFF or VRT)")
+    driver: str = Field(description="Output driver (GTiff, or VRT for a virtual subset)")
+    window: Window = Field(description="Source pixel window covered by the output")
+    width: int = Field(ge=1, description="Output width in pixels")
+    height: int = Field(ge=1, description="Output height in pixels")
+    bounds: list[float] = Field(
+        min_length=4,
+        max_length=4,
+        description="Output bounds [minx, miny, maxx, maxy] in the raster CRS",
+    )
+    crs: str | None = Field(None, description="Raster CRS")
+    clip_method: str = Field(description="Clipping method used (bbox or mask)")
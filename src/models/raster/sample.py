@@ -0,0 +1,81 @@
+"""Raster point sampling models."""
+
+from __future__ import annotations
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from src.models.resourceref import ResourceRef
+
+SampleId = str | int | float | bool | None
+
+# Inline points are [x, y]
+POINT_DIMENSIONS = 2
+
+
+class Params(BaseModel):
+    """Parameters for raster point sampling."""
+
+    points: list[list[float]] | None = Field(
+        None,
+        description="Inline coordinates as [[x, y], ...] (x = longitude for geographic CRSs)",
+    )
+    points_crs: str | None = Field(
+        None,
+        description=(
+            "CRS of inline points (e.g. 'EPSG:4326'); default is the raster's CRS. "
+            "Points read from points_file use the file's CRS."
+        ),
+    )
+    points_file: str | None = Field(
+        None,
+        description="Path to a Point vector layer to sample (alternative to points)",
+    )
+    id_field: str | None = Field(
+        None,
+        description="Attribute of points_file echoed as each sample's id (default: feature index)",
+    )
+    bands: list[int] | None = Field(
+        None,
+        description="Band indices to sample (1-based). None = all bands.",
+    )
+
+    model_config = ConfigDict()
+
+    @model_validator(mode="after")
+    def _one_source(self) -> Params:
+        if (self.points is None) == (self.points_file is None):
+            raise ValueError("Provide exactly one of points or points_file")
+        if self.points is not None and any(len(p) != POINT_DIMENSIONS for p in self.points):
+            raise ValueError("Each point must be [x, y]")
+        return self
+
+
+class Sample(BaseModel):
+    """Band values at one point."""
+
+    id: SampleId = Field(description="id_field value, or 0-based point index")
+    x: float = Field(description="Input x coordinate")
+    y: float = Field(description="Input y coordinate")
+    row: int | None = Field(None, description="Pixel row (None if outside the raster)")
+    col: int | None = Field(None, description="Pixel column (None if outside the raster)")
+    values: list[float | None] = Field(
+        description="One value per sampled band; None for nodata or points outside the raster"
+    )
+
+
+class Result(BaseModel):
+    """Result of raster point sampling."""
+
+    path: str = Field(description="Path to the raster dataset")
+    bands: list[int] = Field(description="Band indices sampled, in the order of each values list")
+    crs: str | None = Field(None, description="Raster CRS")
+    point_count: int = Field(ge=0, description="Number of points sampled")
+    inside_count: int = Field(ge=0, description="Points falling inside the raster")
+    blocks_read: int = Field(ge=0, description="Distinct raster blocks read")
+    samples: list[Sample] = Field(
+        default_factory=list,
+        description="Per-point values (empty when written to output instead)",
+    )
+    output: ResourceRef | None = Field(
+        None, description="CSV with one row per point, when output was given"
+    )
@@ -0,0 +1,65 @@
+"""Raster zonal statistics models."""
+
+from __future__ import annotations
+
+from pydantic import BaseModel, Field
+
+
+class Params(BaseModel):
+    """Parameters for zonal statistics."""
+
+    zone_field: str | None = Field(
+        None,
+        description=(
+            "Attribute identifying zones; features sharing a value form one zone. "
+            "None = one zone per feature, keyed by its 0-based index."
+        ),
+    )
+    bands: list[int] | None = Field(
+        None,
+        description="Band indices to summarise (1-based). None = all bands.",
+    )
+    all_touched: bool = Field(
+        default=False,
+        description=(
+            "Count every pixel touched by a zone instead of only pixels whose centre is inside"
+        ),
+    )
+    workers: int | None = Field(
+        None,
+        ge=1,
+        description="Threads reading raster blocks (None = all cores)",
+    )
+
+
+class ZoneBand(BaseModel):
+    """Statistics of one band within one zone."""
+
+    band: int = Field(ge=1, description="Band index (1-based)")
+    count: int = Field(ge=0, description="Number of valid (non-nodata) pixels in the zone")
+    sum: float | None = Field(None, description="Sum of valid pixel values")
+    min: float | None = Field(None, description="Minimum value")
+    max: float | None = Field(None, description="Maximum value")
+    mean: float | None = Field(None, description="Mean value")
+    std: float | None = Field(None, description="Population standard deviation")
+
+
+class Zone(BaseModel):
+    """Statistics of every requested band within one zone."""
+
+    zone: str | int | float | bool | None = Field(
+        description="Zone identifier (zone_field value, or feature index)"
+    )
+    band_stats: list[ZoneBand] = Field(description="Per-band statistics")
+
+
+class Result(BaseModel):
+    """Result of a zonal statistics computation."""
+
+    path: str = Field(description="Path to the raster dataset")
+    zones_path: str = Field(description="Path to the zones vector dataset")
+    zone_field: str | None = Field(None, description="Attribute used to identify zones")
+    bands: list[int] = Field(description="Band indices summarised")
+    zones: list[Zone] = Field(description="Per-zone statistics, in order of first appearance")
+    total_pixels: int = Field(ge=0, description="Total number of pixels per band")
+    zoned_pixels: int = Field(ge=0, description="Pixels covered by at least one zone")
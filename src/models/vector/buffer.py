@@ -5,6 +5,7 @@ from __future__ import annotations
 from pydantic import BaseModel, ConfigDict, Field
 
 from src.models.resourceref import ResourceRef
+from src.shared.chunking import DEFAULT_CHUNK_SIZE
 
 
 class Params(BaseModel):
@@ -20,6 +21,22 @@ class Params(BaseModel):
         le=64,
         description="Segments per quadrant for buffer polygon (higher = smoother, slower)",
     )
+    workers: int | None = Field(
+        None,
+        ge=1,
+        le=256,
+        description="Threads used for geometry processing (default: all CPU cores)",
+    )
+    chunk_size: int = Field(
+        DEFAULT_CHUNK_SIZE,
+        ge=1,
+        description="Geometries per parallel chunk (smaller = finer load balancing)",
+    )
+    dissolve: bool = Field(
+        False,
+        description="Union overlapping buffers into one feature per resulting polygon "
+        "(source attributes are dropped)",
+    )
 
     model_config = ConfigDict()
 
@@ -28,7 +45,7 @@ class Result(BaseModel):
     """Result of a vector buffer operation."""
 
     output: ResourceRef = Field(description="Reference to the output vector file")
-    feature_count: int = Field(ge=0, description="Number of features buffered")
+    feature_count: int = Field(ge=0, description="Number of features written")
     buffer_distance: float = Field(description="Buffer distance applied")
     resolution: int = Field(description="Segments per quadrant used")
     bounds: list[float] | None = Field(
@@ -37,3 +54,4 @@ class Result(BaseModel):
         max_length=4,
         description="Output bounds [minx, miny, maxx, maxy]",
     )
+    dissolved: bool = Field(False, description="Whether overlapping buffers were dissolved")
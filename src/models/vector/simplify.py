@@ -4,11 +4,12 @@ from __future__ import annotations
 
 from typing import Literal
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from src.models.resourceref import ResourceRef
+from src.shared.chunking import DEFAULT_CHUNK_SIZE
 
-SimplifyMethod = Literal["douglas-peucker", "visvalingam"]
+SimplifyMethod = Literal["douglas-peucker", "visvalingam", "coverage"]
 
 
 class Params(BaseModel):
@@ -20,16 +21,51 @@ class Params(BaseModel):
     )
     method: SimplifyMethod = Field(
         "douglas-peucker",
-        description="Simplification algorithm: douglas-peucker (default, fast) or "
-        "visvalingam (area-based, preserves shape better)",
+        description="Simplification algorithm: douglas-peucker (default, fast), "
+        "visvalingam (area-based, preserves shape better, several times slower) or "
+        "coverage (polygon layers whose neighbours share edges; stays gap-free; "
+        "simplifies the whole layer at once, so preserve_topology, workers and "
+        "chunk_size do not apply)",
     )
     preserve_topology: bool = Field(
         True,
         description="Ensure output geometries are valid (no self-intersections)",
     )
+    workers: int | None = Field(
+        None,
+        ge=1,
+        le=256,
+        description="Threads used for geometry processing (default: all CPU cores)",
+    )
+    chunk_size: int = Field(
+        DEFAULT_CHUNK_SIZE,
+        ge=1,
+        description="Geometries per parallel chunk (smaller = finer load balancing)",
+    )
 
     model_config = ConfigDict()
 
+    @model_validator(mode="after")
+    def _coverage_options(self) -> Params:
+        # Coverage simplification is one whole-layer GEOS call that always keeps
+        # polygons valid; per-geometry and parallel options have nothing to act on
+        if self.method == "coverage":
+            ignored = [
+                name
+                for name, unset in (
+                    ("preserve_topology=False", self.preserve_topology),
+                    ("workers", self.workers is None),
+                    ("chunk_size", "chunk_size" not in self.model_fields_set),
+                )
+                if not unset
+            ]
+            if ignored:
+                raise ValueError(
+                    f"method='coverage' does not support {', '.join(ignored)}: the layer is "
+                    "simplified in one pass and always stays valid"
+                )
+        return self
+
 
 class Result(BaseModel):
     """Result of a vector simplification operation."""
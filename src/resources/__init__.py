@@ -4,13 +4,15 @@ Resources provide read-only information per ADR-0023:
 - metadata://  File properties and statistics
 - catalog://   Workspace discovery
 - reference:// System capabilities (formats, CRS, compression, glossary)
+- metrics://   Server instrumentation
 """
 
-from src.resources import catalog, reference
+from src.resources import catalog, metrics, reference
 from src.resources.metadata import band, format_detection, raster, statistics, vector
 
 __all__ = [
     "catalog",
+    "metrics",
     "reference",
     "band",
     "format_detection",
@@ -7,7 +7,6 @@ from typing import Any
 from fastmcp import Context
 
 from src.app import mcp
-from src.shared.raster.bands import band_metadata
 
 
 @mcp.resource("metadata://{file}/bands/{_dummy}{?include_statistics}")
@@ -28,6 +27,8 @@ def get_raster_band_metadata(
     Returns:
         Dictionary containing band metadata.
     """
+    from src.shared.raster.bands import band_metadata
+
     if ctx:
         ctx.info(
             "[metadata://{file}/bands] Retrieving band metadata",
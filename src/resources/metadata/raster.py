@@ -5,7 +5,6 @@ from __future__ import annotations
 from typing import Any
 
 from src.app import mcp
-from src.shared import raster
 
 
 @mcp.resource("metadata://{file}/raster")
@@ -16,4 +15,6 @@ def get_raster_metadata(file: str) -> dict[str, Any]:
     nodata, overview levels, and tags. Used by AI during planning to
     understand file properties before choosing operations and parameters.
     """
+    from src.shared import raster
+
     return raster.info(file)
@@ -5,7 +5,6 @@ from __future__ import annotations
 from typing import Any
 
 from src.app import mcp
-from src.shared import raster
 
 
 @mcp.resource("metadata://{file}/statistics")
@@ -16,5 +15,7 @@ def get_raster_statistics(file: str) -> dict[str, Any]:
     percentiles (25/50/75). Histogram is disabled for lightweight planning
     use. This helps the AI choose methods and parameters during planning.
     """
+    from src.shared import raster
+
     params = {"include_histogram": False, "percentiles": [25.0, 50.0, 75.0]}
     return raster.stats(file, params)
@@ -5,7 +5,6 @@ from __future__ import annotations
 from typing import Any
 
 from src.app import mcp
-from src.shared import vector
 
 
 @mcp.resource("metadata://{file}/vector")
@@ -16,4 +15,6 @@ def get_vector_metadata(file: str) -> dict[str, Any]:
     schema. Used by AI during planning to understand dataset properties
     and choose appropriate operations.
     """
+    from src.shared import vector
+
     return vector.info(file)
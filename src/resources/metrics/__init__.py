@@ -0,0 +1,19 @@
+"""Server metrics resources."""
+
+from .server import (
+    get_gdal_runtime_profile,
+    get_health,
+    get_recent_spans,
+    get_server_metrics,
+    health_check,
+    prometheus_metrics,
+)
+
+__all__ = [
+    "get_gdal_runtime_profile",
+    "get_health",
+    "get_recent_spans",
+    "get_server_metrics",
+    "health_check",
+    "prometheus_metrics",
+]
@@ -0,0 +1,98 @@
+"""Server metrics and trace resources, and the Prometheus endpoint."""
+
+from __future__ import annotations
+
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse
+
+from src.app import mcp
+from src.middleware.metrics import get_metrics
+from src.shared.gdal_env import get_gdal_profile
+from src.shared.tracing import recent_spans
+from src.startup import health
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+HTTP_OK = 200
+HTTP_SERVICE_UNAVAILABLE = 503
+
+
+@mcp.resource(
+    uri="metrics://server",
+    name="Server Metrics",
+    description=(
+        "Per-tool and per-resource instrumentation since server start: call and error counts, "
+        "wall-time latency histograms (count, sum, min, max, mean, p50/p90/p99/p99.9 seconds), "
+        "process CPU seconds, largest peak-RSS increase, and bytes read from inputs and "
+        "written to outputs. Use it to find slow or memory-hungry operations before tuning "
+        "batch sizes, worker counts or formats."
+    ),
+)
+def get_server_metrics() -> dict:
+    """Return a snapshot of the server metrics registry."""
+    return get_metrics().snapshot()
+
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def prometheus_metrics(request: Request) -> PlainTextResponse:
+    """Serve metrics in the Prometheus text format (HTTP transport only)."""
+    return PlainTextResponse(get_metrics().to_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+@mcp.resource(
+    uri="metrics://traces",
+    name="Recent Trace Spans",
+    description=(
+        "Most recent stage-level spans recorded by raster and vector tools (open, transform, "
+        "per-band read/warp, per-batch read/transform, write, flush/compression, overviews, "
+        "stat), in OTLP JSON form with trace/span ids, parent links and nanosecond timestamps. "
+        "Compare child span durations to tell whether a slow job is I/O-, decode- or "
+        "warp-bound. Empty when GDAL_MCP_TRACE=off."
+    ),
+)
+def get_recent_spans() -> dict:
+    """Return spans kept by the in-memory trace buffer."""
+    spans = recent_spans()
+    return {"spans": spans, "total": len(spans)}
+
+
+@mcp.resource(
+    uri="metrics://health",
+    name="Server Health",
+    description=(
+        "Server readiness: 'ready', 'warming' while a warm start (--warm / GDAL_MCP_WARM) is "
+        "still registering GDAL/OGR drivers, initialising PROJ, building extension tables and "
+        "scanning the catalog, or 'degraded' if a warm-up stage failed. Includes per-stage "
+        "timings and which geospatial libraries are already loaded, so the first heavy call "
+        "can be expected to be fast or slow."
+    ),
+)
+def get_health() -> dict:
+    """Return server readiness and warm-up progress."""
+    return health()
+
+
+@mcp.custom_route("/health", methods=["GET"])
+async def health_check(request: Request) -> JSONResponse:
+    """Serve readiness for load balancers: 503 while warming, 200 otherwise (HTTP only)."""
+    report = health()
+    status = HTTP_SERVICE_UNAVAILABLE if report["status"] == "warming" else HTTP_OK
+    return JSONResponse(report, status_code=status)
+
+
+@mcp.resource(
+    uri="metrics://gdal-profile",
+    name="GDAL Runtime Profile",
+    description=(
+        "Active GDAL tuning profile applied to every raster read and write: the preset "
+        "(default, low-memory, throughput or network-storage, from GDAL_MCP_GDAL_PROFILE), "
+        "each effective configuration option (GDAL_CACHEMAX, GDAL_NUM_THREADS, VSI_CACHE, "
+        "GDAL_DISABLE_READDIR_ON_OPEN, HTTP range options, ...) with whether it came from the "
+        "preset, the environment or GDAL_MCP_GDAL_OPTIONS, options rejected by validation, "
+        "and the GDAL version."
+    ),
+)
+def get_gdal_runtime_profile() -> dict:
+    """Return the active GDAL profile and the GDAL version."""
+    import rasterio
+
+    return {**get_gdal_profile().to_dict(), "gdal_version": rasterio.__gdal_version__}
@@ -1,6 +1,10 @@
 """Server module that exposes the shared FastMCP instance.
 
 Ensures all tool modules are imported so their @mcp.tool functions register.
+Tool and resource modules import only FastMCP and pydantic models at module
+level; rasterio, pyogrio, shapely and friends are imported inside the tool
+functions, so schemas are registered before the MCP handshake and the GDAL
+stack loads on the first call (``gdal --profile-startup`` shows the split).
 """
 
 from __future__ import annotations
@@ -11,10 +15,17 @@ from __future__ import annotations
 import src.resources.catalog.all  # noqa: F401
 import src.resources.catalog.by_crs  # noqa: F401
 import src.resources.catalog.summary  # noqa: F401
+
+# ===============================================================
+# resources/metrics (always available)
+# ===============================================================
+import src.resources.metrics.server  # noqa: F401
 from src.app import mcp
 from src.config import is_raster_tools_enabled, is_vector_tools_enabled
-from src.middleware.paths import PathValidationMiddleware
-from src.middleware.reflection_middleware import ReflectionMiddleware
+from src.middleware.admission import AdmissionMiddleware
+from src.middleware.metrics import MetricsMiddleware
+from src.middleware.pipeline import ToolCallPipeline
+from src.middleware.preflight import warm_prompt_hashes
 from src.prompts import register_prompts
 
 if is_raster_tools_enabled():
@@ -38,10 +49,13 @@ if is_vector_tools_enabled():
 # tools
 # ===============================================================
 if is_raster_tools_enabled():
+    import src.tools.raster.clip  # noqa: F401
     import src.tools.raster.convert  # noqa: F401
     import src.tools.raster.info  # noqa: F401
     import src.tools.raster.reproject  # noqa: F401
+    import src.tools.raster.sample  # noqa: F401
     import src.tools.raster.stats  # noqa: F401
+    import src.tools.raster.zonal_stats  # noqa: F401
 
 if is_vector_tools_enabled():
     import src.tools.vector.buffer  # noqa: F401
@@ -63,12 +77,24 @@ register_prompts(mcp)
 # reflection system
 # ===============================================================
 
-# Register path validation middleware (security layer)
-# This enforces workspace boundaries and prevents directory traversal
-mcp.add_middleware(PathValidationMiddleware())
+# Hash reflection prompt sources once so preflight checks never read source files
+warm_prompt_hashes()
+
+# Register metrics first so it is the outermost middleware: timings include the
+# pipeline below, and calls it denies are counted as errors. Under HTTP transport
+# the same metrics are served in Prometheus format at /metrics
+mcp.add_middleware(MetricsMiddleware())
+
+# Register the tool call pipeline, which parses arguments once and runs, in order:
+# 1. path validation (security layer): enforces workspace boundaries and
+#    prevents directory traversal
+# 2. reflection preflight (epistemic layer): checks for required justifications
+mcp.add_middleware(ToolCallPipeline())
 
-# Register reflection middleware (epistemic layer)
-# This intercepts tool calls and checks for required justifications
-mcp.add_middleware(ReflectionMiddleware())
+# Register admission control inside the pipeline so only validated calls are
+# estimated: each call reserves its estimated working set against the global
+# memory budget (GDAL_MCP_MEMORY_BUDGET) and is admitted, queued, or
+# downgraded to windowed/sampled reads
+mcp.add_middleware(AdmissionMiddleware())
 
 __all__ = ["mcp"]
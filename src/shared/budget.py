@@ -0,0 +1,203 @@
+"""Global memory budget shared by concurrent tool calls.
+
+Each call reserves its estimated working set before it runs and releases it
+when it finishes. A call that does not fit is either downgraded to a cheaper
+mode (windowed or sampled reads) or queued in arrival order until enough
+memory is released, so concurrent agents cannot together load more than the
+budget into RAM.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Literal
+
+from fastmcp.exceptions import ToolError
+
+from src.config import get_memory_budget, get_memory_queue_timeout
+
+__all__ = [
+    "Admission",
+    "Estimate",
+    "MemoryBudget",
+    "get_budget",
+    "reset_budget",
+]
+
+logger = logging.getLogger(__name__)
+
+AdmissionMode = Literal["full", "windowed", "sampled"]
+
+
+@dataclass(frozen=True, slots=True)
+class Estimate:
+    """Estimated peak memory of a tool call.
+
+    Attributes:
+        full_bytes: Working set when the call runs as requested.
+        reduced_bytes: Working set in the cheaper mode, if the tool has one.
+        reduced_mode: Mode that achieves ``reduced_bytes``.
+    """
+
+    full_bytes: int
+    reduced_bytes: int | None = None
+    reduced_mode: AdmissionMode | None = None
+
+
+@dataclass(slots=True)
+class Admission:
+    """Memory granted to one tool call.
+
+    Attributes:
+        mode: "full", or the cheaper mode the tool must switch to.
+        estimated_bytes: Working set estimated for the requested mode.
+        reserved_bytes: Bytes held against the budget while the call runs.
+        queued_seconds: Time spent waiting for memory before starting.
+    """
+
+    mode: AdmissionMode
+    estimated_bytes: int
+    reserved_bytes: int
+    queued_seconds: float = 0.0
+
+    def to_dict(self) -> dict[str, object]:
+        """Serialise for tool results."""
+        return {
+            "mode": self.mode,
+            "estimated_bytes": self.estimated_bytes,
+            "reserved_bytes": self.reserved_bytes,
+            "queued_seconds": round(self.queued_seconds, 6),
+        }
+
+
+class MemoryBudget:
+    """FIFO admission control over a fixed number of bytes.
+
+    Calls are admitted in arrival order: a small call never overtakes a large
+    one that is already waiting, so large calls cannot starve. A call larger
+    than the whole budget with no cheaper mode reserves the entire budget and
+    runs alone.
+    """
+
+    def __init__(self, total_bytes: int, queue_timeout: float) -> None:
+        self.total_bytes = total_bytes
+        self.queue_timeout = queue_timeout
+        self.in_use = 0
+        self._waiters: deque[tuple[int, asyncio.Future[None]]] = deque()
+
+    @property
+    def available(self) -> int:
+        """Bytes not reserved by running calls."""
+        return self.total_bytes - self.in_use
+
+    @property
+    def queued(self) -> int:
+        """Number of calls waiting for memory."""
+        return len(self._waiters)
+
+    def _fits_now(self, size: int) -> bool:
+        return not self._waiters and size <= self.available
+
+    async def admit(self, estimate: Estimate, label: str = "tool call") -> Admission:
+        """Reserve memory for a call, downgrading or queueing it as needed.
+
+        Raises:
+            ToolError: If memory does not become available within the queue timeout.
+        """
+        full = estimate.full_bytes
+        if full <= self.total_bytes and self._fits_now(full):
+            return self._reserve("full", full, full)
+
+        # Downgrade rather than wait when the tool has a cheaper mode
+        mode: AdmissionMode = "full"
+        needed = full
+        if (
+            estimate.reduced_mode is not None
+            and estimate.reduced_bytes is not None
+            and estimate.reduced_bytes < full
+        ):
+            mode, needed = estimate.reduced_mode, estimate.reduced_bytes
+        size = min(needed, self.total_bytes)
+        if size < needed:
+            logger.warning(
+                "%s needs about %d bytes, more than the %d byte memory budget; running it alone",
+                label,
+                needed,
+                self.total_bytes,
+            )
+        if self._fits_now(size):
+            return self._reserve(mode, full, size)
+
+        started = time.perf_counter()
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        entry = (size, waiter)
+        self._waiters.append(entry)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), self.queue_timeout)
+        except TimeoutError as e:
+            self._abandon(entry)
+            raise ToolError(
+                f"Server memory is busy: {label} waited {self.queue_timeout:.0f}s for "
+                f"{size} bytes of the {self.total_bytes} byte budget. Retry later, or use "
+                "parameters that reduce the work (a smaller area, fewer bands, sampling)."
+            ) from e
+        except BaseException:
+            self._abandon(entry)
+            raise
+
+        admission = Admission(mode, full, size, time.perf_counter() - started)
+        logger.debug("%s admitted in %s mode after %.3fs", label, mode, admission.queued_seconds)
+        return admission
+
+    def release(self, admission: Admission) -> None:
+        """Return a call's reservation and admit waiting calls that now fit."""
+        self.in_use = max(0, self.in_use - admission.reserved_bytes)
+        self._wake()
+
+    def _reserve(self, mode: AdmissionMode, estimated: int, size: int) -> Admission:
+        self.in_use += size
+        return Admission(mode, estimated, size)
+
+    def _wake(self) -> None:
+        while self._waiters:
+            size, waiter = self._waiters[0]
+            if size > self.available:
+                return
+            self._waiters.popleft()
+            self.in_use += size
+            waiter.set_result(None)
+
+    def _abandon(self, entry: tuple[int, asyncio.Future[None]]) -> None:
+        size, waiter = entry
+        if waiter.done() and not waiter.cancelled():
+            # Admitted while timing out or being cancelled: give the memory back
+            self.in_use = max(0, self.in_use - size)
+        else:
+            waiter.cancel()
+            self._waiters.remove(entry)
+        self._wake()
+
+
+_BUDGET: MemoryBudget | None = None
+_BUDGET_CONFIGURED = False
+
+
+def get_budget() -> MemoryBudget | None:
+    """Return the process-wide budget (None when admission control is off)."""
+    global _BUDGET, _BUDGET_CONFIGURED
+    if not _BUDGET_CONFIGURED:
+        total = get_memory_budget()
+        _BUDGET = MemoryBudget(total, get_memory_queue_timeout()) if total else None
+        _BUDGET_CONFIGURED = True
+    return _BUDGET
+
+
+def reset_budget(budget: MemoryBudget | None = None) -> None:
+    """Replace the process-wide budget, or rebuild it from the environment (testing helper)."""
+    global _BUDGET, _BUDGET_CONFIGURED
+    _BUDGET = budget
+    _BUDGET_CONFIGURED = budget is not None
@@ -113,7 +113,7 @@ def scan(
         # Development fallback: use current working directory
         workspaces = [Path.cwd()]
 
-    _ensure_dynamic_extensions()
+    ensure_dynamic_extensions()
 
     signature = _compute_signature(workspaces, include_hidden, allowed_extensions)
     normalized_exts = tuple(sorted(normalize_extensions(allowed_extensions)))
@@ -263,7 +263,8 @@ def _maybe_log(ctx: Context, message: str) -> None:
         pass
 
 
-def _ensure_dynamic_extensions() -> None:
+def ensure_dynamic_extensions() -> None:
+    """Add every extension known to the installed GDAL raster and OGR drivers (once)."""
     global _EXTENSIONS_INITIALIZED
     if _EXTENSIONS_INITIALIZED:
         return
@@ -0,0 +1,12 @@
+"""Defaults for partitioned geometry processing.
+
+Kept free of numpy and shapely so tool parameter models can share them
+without loading the deferred vector stack at server startup.
+"""
+
+from __future__ import annotations
+
+__all__ = ["DEFAULT_CHUNK_SIZE"]
+
+# Geometries per chunk handed to one thread by the partitioned executors
+DEFAULT_CHUNK_SIZE = 4096
@@ -0,0 +1,230 @@
+"""GDAL runtime tuning profile shared by every ``rasterio.Env``.
+
+A profile is a preset of GDAL configuration options (block cache, codec
+threads, VSI read cache, directory listing on open, HTTP range handling)
+selected with GDAL_MCP_GDAL_PROFILE. GDAL options already set in the process
+environment (the Docker image sets GDAL_CACHEMAX) override the preset, and
+GDAL_MCP_GDAL_OPTIONS overrides both. Every value is validated once when the
+profile is loaded; invalid values are logged and dropped.
+
+Usage::
+
+    with gdal_env(), rasterio.open(path) as src:
+        ...
+
+Both settings can go in ``deployment.env`` of ``fastmcp.json`` like any other
+server variable.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Literal
+
+from src.config import get_gdal_option_overrides, get_gdal_profile_name
+
+if TYPE_CHECKING:
+    import rasterio
+
+__all__ = [
+    "PRESETS",
+    "GdalProfile",
+    "gdal_env",
+    "get_gdal_profile",
+    "load_gdal_profile",
+    "reset_gdal_profile",
+]
+
+logger = logging.getLogger(__name__)
+
+OptionSource = Literal["preset", "environment", "override"]
+
+_MIB = 1024**2
+
+# Extensions GDAL may request over HTTP; everything else (e.g. .aux.xml probes) is skipped
+_REMOTE_EXTENSIONS = (
+    ".tif,.tiff,.vrt,.jp2,.gpkg,.fgb,.parquet,.json,.geojson,.shp,.shx,.dbf,.prj,.cpg"
+)
+
+PRESETS: dict[str, dict[str, str]] = {
+    "default": {},
+    "low-memory": {
+        "GDAL_CACHEMAX": "64",
+        "GDAL_NUM_THREADS": "1",
+        "VSI_CACHE": "FALSE",
+        "GDAL_MAX_DATASET_POOL_SIZE": "50",
+        "GDAL_FORCE_CACHING": "NO",
+    },
+    "throughput": {
+        "GDAL_CACHEMAX": "25%",
+        "GDAL_NUM_THREADS": "ALL_CPUS",
+        "GDAL_SWATH_SIZE": str(256 * _MIB),
+        "VSI_CACHE": "TRUE",
+        "VSI_CACHE_SIZE": str(256 * _MIB),
+        "GDAL_TIFF_INTERNAL_MASK": "YES",
+        "GDAL_TIFF_OVR_BLOCKSIZE": "512",
+    },
+    "network-storage": {
+        "GDAL_CACHEMAX": "512",
+        "GDAL_NUM_THREADS": "ALL_CPUS",
+        "GDAL_DISABLE_READDIR_ON_OPEN": "EMPTY_DIR",
+        "CPL_VSIL_CURL_ALLOWED_EXTENSIONS": _REMOTE_EXTENSIONS,
+        "CPL_VSIL_CURL_CACHE_SIZE": str(128 * _MIB),
+        "GDAL_INGESTED_BYTES_AT_OPEN": "32768",
+        "GDAL_HTTP_MULTIRANGE": "YES",
+        "GDAL_HTTP_MERGE_CONSECUTIVE_RANGES": "YES",
+        "GDAL_HTTP_MAX_RETRY": "3",
+        "GDAL_HTTP_RETRY_DELAY": "1",
+        "VSI_CACHE": "TRUE",
+        "VSI_CACHE_SIZE": str(64 * _MIB),
+    },
+}
+
+_BOOL_VALUES = {"YES", "NO", "TRUE", "FALSE", "ON", "OFF", "1", "0"}
+
+
+def _integer(value: str) -> bool:
+    return value.isdigit()
+
+
+def _number(value: str) -> bool:
+    try:
+        return float(value) >= 0
+    except ValueError:
+        return False
+
+
+def _boolean(value: str) -> bool:
+    return value.upper() in _BOOL_VALUES
+
+
+def _one_of(*choices: str) -> Callable[[str], bool]:
+    return lambda value: value.upper() in choices
+
+
+# Options the profile knows how to validate; other GDAL options pass through unchecked
+VALIDATORS: dict[str, Callable[[str], bool]] = {
+    "GDAL_CACHEMAX": lambda value: (
+        re.fullmatch(r"\d+(\.\d+)?%|\d+(MB|GB)?", value.upper()) is not None
+    ),
+    "GDAL_NUM_THREADS": lambda value: value.upper() == "ALL_CPUS" or _integer(value),
+    "GDAL_SWATH_SIZE": _integer,
+    "GDAL_MAX_DATASET_POOL_SIZE": _integer,
+    "GDAL_FORCE_CACHING": _boolean,
+    "GDAL_DISABLE_READDIR_ON_OPEN": _one_of("YES", "NO", "TRUE", "FALSE", "EMPTY_DIR"),
+    "GDAL_TIFF_INTERNAL_MASK": _boolean,
+    "GDAL_TIFF_OVR_BLOCKSIZE": _integer,
+    "GDAL_INGESTED_BYTES_AT_OPEN": _integer,
+    "VSI_CACHE": _boolean,
+    "VSI_CACHE_SIZE": _integer,
+    "CPL_VSIL_CURL_ALLOWED_EXTENSIONS": lambda value: bool(value.strip()),
+    "CPL_VSIL_CURL_CACHE_SIZE": _integer,
+    "GDAL_HTTP_MULTIRANGE": _one_of("YES", "NO", "SERIAL", "PARALLEL"),
+    "GDAL_HTTP_MERGE_CONSECUTIVE_RANGES": _boolean,
+    "GDAL_HTTP_MAX_RETRY": _integer,
+    "GDAL_HTTP_RETRY_DELAY": _number,
+}
+
+# GDAL reads these once per process (the block cache is sized on first use), so
+# they are exported to the environment instead of relying on per-Env config
+PROCESS_OPTIONS = ("GDAL_CACHEMAX",)
+
+_OPTION_NAME = re.compile(r"[A-Z][A-Z0-9_]*")
+
+
+@dataclass(frozen=True, slots=True)
+class GdalProfile:
+    """Resolved GDAL configuration options.
+
+    Attributes:
+        name: Preset the options start from.
+        options: Effective option values passed to every ``rasterio.Env``.
+        sources: Where each option came from ("preset", "environment" or "override").
+        rejected: Options dropped because their value failed validation.
+    """
+
+    name: str
+    options: dict[str, str] = field(default_factory=dict)
+    sources: dict[str, OptionSource] = field(default_factory=dict)
+    rejected: dict[str, str] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialise for the profile resource."""
+        return {
+            "profile": self.name,
+            "options": {
+                key: {"value": value, "source": self.sources[key]}
+                for key, value in sorted(self.options.items())
+            },
+            "rejected": dict(self.rejected),
+        }
+
+
+def _valid(key: str, value: str) -> bool:
+    if _OPTION_NAME.fullmatch(key) is None:
+        return False
+    validator = VALIDATORS.get(key)
+    return validator is None or validator(value.strip())
+
+
+def load_gdal_profile() -> GdalProfile:
+    """Resolve the profile from the preset, the process environment and overrides."""
+    name = get_gdal_profile_name()
+    options: dict[str, str] = {}
+    sources: dict[str, OptionSource] = {}
+    rejected: dict[str, str] = {}
+
+    layers: list[tuple[OptionSource, dict[str, str]]] = [
+        ("preset", PRESETS[name]),
+        ("environment", {key: os.environ[key] for key in VALIDATORS if os.environ.get(key)}),
+        ("override", get_gdal_option_overrides()),
+    ]
+    for source, values in layers:
+        for key, value in values.items():
+            if not _valid(key, value):
+                logger.warning(
+                    "Invalid GDAL option %s=%r from %s; keeping the previous value.",
+                    key,
+                    value,
+                    source,
+                )
+                rejected[key] = value
+                continue
+            options[key] = value.strip()
+            sources[key] = source
+    return GdalProfile(name=name, options=options, sources=sources, rejected=rejected)
+
+
+_PROFILE: GdalProfile | None = None
+
+
+def get_gdal_profile() -> GdalProfile:
+    """Return the process-wide profile, loading and applying it on first use."""
+    global _PROFILE
+    if _PROFILE is None:
+        _PROFILE = load_gdal_profile()
+        for key in PROCESS_OPTIONS:
+            if key in _PROFILE.options:
+                os.environ[key] = _PROFILE.options[key]
+        logger.debug("GDAL profile '%s': %s", _PROFILE.name, _PROFILE.options)
+    return _PROFILE
+
+
+def reset_gdal_profile(profile: GdalProfile | None = None) -> None:
+    """Replace the process-wide profile, or reload it from the environment (testing helper)."""
+    global _PROFILE
+    _PROFILE = profile
+
+
+def gdal_env(**options: Any) -> rasterio.Env:
+    """Return a ``rasterio.Env`` configured with the active profile.
+
+    Keyword options override profile values for this environment only.
+    """
+    import rasterio
+
+    return rasterio.Env(**{**get_gdal_profile().options, **options})
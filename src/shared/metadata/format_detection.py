@@ -2,25 +2,22 @@
 
 from __future__ import annotations
 
+import importlib
+from functools import cache
 from pathlib import Path
+from types import ModuleType
 from typing import Any
 
-try:  # Optional dependency
-    import pyogrio
-except ImportError:  # pragma: no cover - optional
-    pyogrio = None  # type: ignore
+from src.shared.gdal_env import gdal_env
 
-try:  # Optional dependency
-    import fiona  # type: ignore
-except ImportError:  # pragma: no cover - optional
-    fiona = None  # type: ignore
 
-try:  # Optional dependency
-    import rasterio
-    from rasterio.errors import RasterioIOError
-except ImportError:  # pragma: no cover - optional
-    rasterio = None  # type: ignore
-    RasterioIOError = Exception  # type: ignore
+@cache
+def _optional_module(name: str) -> ModuleType | None:
+    """Import an optional backend on first use (None when it is not installed)."""
+    try:
+        return importlib.import_module(name)
+    except ImportError:  # pragma: no cover - optional
+        return None
 
 
 def read_format_metadata(path: str) -> dict[str, Any]:
@@ -56,10 +53,11 @@ def read_format_metadata(path: str) -> dict[str, Any]:
 
 
 def _try_rasterio(resolved: Path) -> dict[str, Any] | None:
+    rasterio = _optional_module("rasterio")
     if rasterio is None:
         return None
     try:
-        with rasterio.Env(), rasterio.open(resolved) as dataset:
+        with gdal_env(), rasterio.open(resolved) as dataset:
             dtype = dataset.dtypes[0] if dataset.count > 0 and dataset.dtypes else None
             crs_str = str(dataset.crs) if dataset.crs else None
             details = {
@@ -75,11 +73,12 @@ def _try_rasterio(resolved: Path) -> dict[str, Any] | None:
                 "driver_description": getattr(dataset, "driver_description", None),
                 "details": details,
             }
-    except RasterioIOError:
+    except rasterio.errors.RasterioIOError:
         return None
 
 
 def _try_vector(resolved: Path) -> dict[str, Any] | None:
+    pyogrio = _optional_module("pyogrio")
     if pyogrio is not None:
         try:
             info = pyogrio.read_info(resolved)
@@ -95,6 +94,7 @@ def _try_vector(resolved: Path) -> dict[str, Any] | None:
         except Exception:
             pass
 
+    fiona = _optional_module("fiona")
     if fiona is not None:
         try:
             with fiona.open(resolved) as collection:
@@ -0,0 +1,112 @@
+"""Process-wide caches for CRS objects and coordinate transformers.
+
+Building a PROJ transformation means searching the PROJ database for candidate
+operations (and opening grid-shift files), which costs tens of milliseconds per
+CRS pair. Agents reproject to the same handful of CRSs repeatedly, so the
+resulting :class:`pyproj.Transformer` objects are kept in a bounded LRU and
+shared by every tool.
+
+pyproj >= 3.1 transformers are thread-safe: each thread lazily gets its own
+PROJ context and operation copy, so one cached transformer can be used from
+any worker thread.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+import numpy as np
+import rasterio.crs
+import shapely
+from pyproj import CRS, Transformer
+
+__all__ = [
+    "TRANSFORMER_CACHE_SIZE",
+    "clear_transformer_cache",
+    "get_crs",
+    "get_raster_crs",
+    "get_transformer",
+    "transform_geometries",
+]
+
+TRANSFORMER_CACHE_SIZE = 64
+CRS_CACHE_SIZE = 128
+
+_TransformerKey = tuple[str, str, bool]
+
+_CACHE_LOCK = threading.Lock()
+_TRANSFORMERS: OrderedDict[_TransformerKey, Transformer] = OrderedDict()
+
+
+@lru_cache(maxsize=CRS_CACHE_SIZE)
+def get_crs(value: str) -> CRS:
+    """Return a cached pyproj CRS for a user CRS string (e.g. 'EPSG:3857')."""
+    return CRS.from_user_input(value)
+
+
+@lru_cache(maxsize=CRS_CACHE_SIZE)
+def get_raster_crs(value: str) -> rasterio.crs.CRS:
+    """Return a cached rasterio CRS for a user CRS string (e.g. 'EPSG:3857')."""
+    return rasterio.crs.CRS.from_user_input(value)
+
+
+def get_transformer(
+    src_crs: str,
+    dst_crs: str,
+    *,
+    always_xy: bool = True,
+) -> Transformer:
+    """Return a cached transformer between two CRSs.
+
+    Args:
+        src_crs: Source CRS string
+        dst_crs: Destination CRS string
+        always_xy: Use x/y (lon/lat) axis order regardless of CRS definition
+
+    Returns:
+        A transformer shared by all callers with the same key.
+    """
+    key: _TransformerKey = (src_crs, dst_crs, always_xy)
+    with _CACHE_LOCK:
+        transformer = _TRANSFORMERS.get(key)
+        if transformer is not None:
+            _TRANSFORMERS.move_to_end(key)
+            return transformer
+
+    # Build outside the lock; a concurrent miss on the same key just builds twice
+    transformer = Transformer.from_crs(get_crs(src_crs), get_crs(dst_crs), always_xy=always_xy)
+    with _CACHE_LOCK:
+        _TRANSFORMERS[key] = transformer
+        _TRANSFORMERS.move_to_end(key)
+        while len(_TRANSFORMERS) > TRANSFORMER_CACHE_SIZE:
+            _TRANSFORMERS.popitem(last=False)
+    return transformer
+
+
+def clear_transformer_cache() -> None:
+    """Reset cached transformers and CRS objects (testing helper)."""
+    with _CACHE_LOCK:
+        _TRANSFORMERS.clear()
+    get_crs.cache_clear()
+    get_raster_crs.cache_clear()
+
+
+def transform_geometries(geoms: np.ndarray, transformer: Transformer) -> np.ndarray:
+    """Transform an array of geometries in bulk.
+
+    Coordinates of all geometries go through the transformer in one call per
+    dimensionality; Z values are kept only for geometries that have them.
+    """
+    out = geoms.copy()
+    has_z = shapely.has_z(geoms)
+    for include_z in (False, True):
+        subset = has_z == include_z
+        if subset.any():
+            out[subset] = shapely.transform(
+                geoms[subset],
+                lambda coords: np.column_stack(transformer.transform(*coords.T)),
+                include_z=include_z,
+            )
+    return out
@@ -7,6 +7,8 @@ from typing import Any
 import rasterio
 from fastmcp.exceptions import ToolError
 
+from src.shared.gdal_env import gdal_env
+
 
 def band_metadata(path: str, *, include_statistics: bool = False) -> dict[str, Any]:
     """Return metadata for each band in a raster dataset.
@@ -24,7 +26,7 @@ def band_metadata(path: str, *, include_statistics: bool = False) -> dict[str, A
     bands: list[dict[str, Any]] = []
 
     try:
-        with rasterio.Env():
+        with gdal_env():
             with rasterio.open(path) as src:
                 for index in range(1, src.count + 1):
                     description = src.descriptions[index - 1] or None
@@ -0,0 +1,377 @@
+"""Windowed raster subsetting by bounding box or vector mask.
+
+The clip extent is converted to a pixel window with
+``rasterio.windows.from_bounds`` (rounded outward to whole pixels and limited
+to the raster), so GDAL only decodes the blocks that intersect it. The window
+is copied in strips of rows, and a vector mask is rasterized once at output
+size, so time and memory grow with the output, not the source.
+
+A ``.vrt`` output is written as a small XML file referencing the source
+window instead of copying pixels; mask clips add a one-byte mask raster next
+to it.
+"""
+
+from __future__ import annotations
+
+import logging
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pyogrio
+import rasterio
+import shapely
+from fastmcp.exceptions import ToolError
+from rasterio.dtypes import can_cast_dtype, in_dtype_range
+from rasterio.features import geometry_mask
+from rasterio.warp import transform_bounds
+from rasterio.windows import Window, from_bounds
+
+from src.shared.gdal_env import gdal_env
+from src.shared.projection import get_raster_crs, get_transformer, transform_geometries
+from src.shared.tracing import span
+
+if TYPE_CHECKING:  # pragma: no cover - import for type checking only
+    from fastmcp import Context
+    from rasterio.io import DatasetReader
+
+__all__ = ["CLIP_WINDOW_ROWS", "clip", "mask_sidecar_path"]
+
+LOGGER = logging.getLogger(__name__)
+
+# Rows copied per read/write when writing a clipped raster
+CLIP_WINDOW_ROWS = 256
+
+# Output tile size; smaller outputs are written as strips
+OUTPUT_BLOCK_SIZE = 256
+
+# Densify bbox edges when reprojecting so curved edges are covered
+BOUNDS_DENSIFY_POINTS = 21
+
+_GDAL_TYPE_NAMES = {
+    "uint8": "Byte",
+    "int8": "Int8",
+    "uint16": "UInt16",
+    "int16": "Int16",
+    "uint32": "UInt32",
+    "int32": "Int32",
+    "uint64": "UInt64",
+    "int64": "Int64",
+    "float32": "Float32",
+    "float64": "Float64",
+    "complex64": "CFloat32",
+    "complex128": "CFloat64",
+}
+
+
+def _bbox_in_raster_crs(
+    src: DatasetReader, bounds: list[float], bounds_crs: str | None
+) -> tuple[float, float, float, float]:
+    """Return a bbox in the raster CRS."""
+    left, bottom, right, top = bounds
+    if left >= right or bottom >= top:
+        raise ToolError(
+            f"Invalid bounds {bounds}: expected [minx, miny, maxx, maxy] with "
+            "minx < maxx and miny < maxy."
+        )
+    if bounds_crs and src.crs is not None:
+        target = get_raster_crs(bounds_crs)
+        if target != src.crs:
+            return transform_bounds(
+                target, src.crs, left, bottom, right, top, densify_pts=BOUNDS_DENSIFY_POINTS
+            )
+    return left, bottom, right, top
+
+
+def _read_mask(mask_path: str, src: DatasetReader) -> np.ndarray:
+    """Read mask geometries in the raster CRS."""
+    gdf = pyogrio.read_dataframe(mask_path, columns=[])
+    geoms = np.asarray(gdf.geometry.values, dtype=object)
+    geoms = geoms[[geom is not None and not geom.is_empty for geom in geoms]]
+    if gdf.crs is not None and src.crs is not None and gdf.crs != src.crs:
+        transformer = get_transformer(gdf.crs.to_string(), src.crs.to_string())
+        geoms = transform_geometries(geoms, transformer)
+    return geoms
+
+
+def _pixel_window(src: DatasetReader, bbox: tuple[float, float, float, float]) -> Window:
+    """Convert a bbox in the raster CRS to a whole-pixel window inside the raster."""
+    window = from_bounds(*bbox, transform=src.transform)
+    # Round outward so every pixel touching the bbox is kept
+    col_start = max(0, int(np.floor(window.col_off + 1e-9)))
+    row_start = max(0, int(np.floor(window.row_off + 1e-9)))
+    col_stop = min(src.width, int(np.ceil(window.col_off + window.width - 1e-9)))
+    row_stop = min(src.height, int(np.ceil(window.row_off + window.height - 1e-9)))
+    if col_stop <= col_start or row_stop <= row_start:
+        raise ToolError(
+            f"Clip extent {list(bbox)} does not intersect the raster "
+            f"(raster bounds {list(src.bounds)} in {src.crs})."
+        )
+    return Window(col_start, row_start, col_stop - col_start, row_stop - row_start)
+
+
+def _output_profile(
+    src: DatasetReader, window: Window, nodata: float | None, compression: str | None
+) -> dict[str, Any]:
+    profile = src.profile.copy()
+    profile.update(
+        driver="GTiff",
+        width=int(window.width),
+        height=int(window.height),
+        transform=src.window_transform(window),
+        nodata=nodata,
+    )
+    if compression:
+        profile["compress"] = compression
+    if window.width >= OUTPUT_BLOCK_SIZE and window.height >= OUTPUT_BLOCK_SIZE:
+        profile.update(tiled=True, blockxsize=OUTPUT_BLOCK_SIZE, blockysize=OUTPUT_BLOCK_SIZE)
+    else:
+        profile["tiled"] = False
+        profile.pop("blockxsize", None)
+        profile.pop("blockysize", None)
+    return profile
+
+
+def _write_window(
+    src: DatasetReader,
+    output_path: Path,
+    window: Window,
+    inside: np.ndarray | None,
+    nodata: float | None,
+    compression: str | None,
+) -> None:
+    """Copy the window strip by strip, blanking pixels outside the mask."""
+    profile = _output_profile(src, window, nodata, compression)
+    with span("create", width=profile["width"], height=profile["height"]):
+        dst = rasterio.open(str(output_path), "w", **profile)
+    with dst:
+        height = int(window.height)
+        for row in range(0, height, CLIP_WINDOW_ROWS):
+            rows = min(CLIP_WINDOW_ROWS, height - row)
+            strip = Window(0, row, window.width, rows)
+            with span("read", row=row):
+                data = src.read(
+                    window=Window(window.col_off, window.row_off + row, window.width, rows)
+                )
+            with span("write", row=row):
+                if inside is not None:
+                    strip_inside = inside[row : row + rows]
+                    if nodata is not None:
+                        data[:, ~strip_inside] = nodata
+                    else:
+                        # No nodata value to burn: record the mask as a GDAL mask band
+                        dst.write_mask(
+                            np.where(strip_inside, 255, 0).astype(np.uint8), window=strip
+                        )
+                dst.write(data, window=strip)
+        dst.update_tags(**src.tags())
+        with span("flush"):
+            dst.close()
+
+
+def mask_sidecar_path(output_path: Path) -> Path:
+    """Return the mask raster written next to a ``.vrt`` mask clip."""
+    return output_path.with_suffix(".mask.tif")
+
+
+def _check_nodata(src: DatasetReader, nodata: float) -> None:
+    """Reject a nodata value that the source data type cannot hold exactly."""
+    for dtype in dict.fromkeys(src.dtypes):
+        # Range first: casting an out-of-range value warns about overflow
+        if not (in_dtype_range(nodata, dtype) and can_cast_dtype([nodata], dtype)):
+            raise ToolError(
+                f"nodata={nodata} cannot be represented in the raster's {dtype} data type. "
+                "Choose a value within that type's range (whole numbers for integer types)."
+            )
+
+
+def _references(vrt_path: Path, filename: Path) -> bool:
+    """Whether an existing VRT reads from ``filename``."""
+    try:
+        root = ET.parse(vrt_path).getroot()
+    except (OSError, ET.ParseError):
+        return False
+    return any(el.text == str(filename) for el in root.iter("SourceFilename"))
+
+
+def _write_vrt(
+    src: DatasetReader,
+    source_path: str,
+    output_path: Path,
+    window: Window,
+    inside: np.ndarray | None,
+) -> Path | None:
+    """Write a VRT referencing the source window, plus a mask raster for mask clips."""
+    width, height = int(window.width), int(window.height)
+    transform = src.window_transform(window)
+    root = ET.Element("VRTDataset", rasterXSize=str(width), rasterYSize=str(height))
+    if src.crs is not None:
+        ET.SubElement(root, "SRS").text = src.crs.to_wkt()
+    ET.SubElement(root, "GeoTransform").text = ", ".join(
+        repr(float(v)) for v in transform.to_gdal()
+    )
+
+    def simple_source(parent: ET.Element, filename: str, band: int, src_window: Window) -> None:
+        source = ET.SubElement(parent, "SimpleSource")
+        ET.SubElement(source, "SourceFilename", relativeToVRT="0").text = filename
+        ET.SubElement(source, "SourceBand").text = str(band)
+        ET.SubElement(
+            source,
+            "SrcRect",
+            xOff=str(int(src_window.col_off)),
+            yOff=str(int(src_window.row_off)),
+            xSize=str(width),
+            ySize=str(height),
+        )
+        ET.SubElement(source, "DstRect", xOff="0", yOff="0", xSize=str(width), ySize=str(height))
+
+    for band, dtype in enumerate(src.dtypes, start=1):
+        band_el = ET.SubElement(
+            root, "VRTRasterBand", dataType=_GDAL_TYPE_NAMES[dtype], band=str(band)
+        )
+        if src.nodatavals[band - 1] is not None:
+            ET.SubElement(band_el, "NoDataValue").text = repr(float(src.nodatavals[band - 1]))
+        ET.SubElement(band_el, "ColorInterp").text = src.colorinterp[band - 1].name.capitalize()
+        simple_source(band_el, source_path, band, window)
+
+    mask_path = None
+    if inside is not None:
+        mask_path = mask_sidecar_path(output_path)
+        # Only replace a sidecar this output's previous run wrote
+        if mask_path.is_symlink() or (
+            mask_path.exists() and not _references(output_path, mask_path)
+        ):
+            raise ToolError(
+                f"'{mask_path}' already exists and is not the mask of '{output_path}'. "
+                "Remove it or choose another output name."
+            )
+        with (
+            span("mask_raster"),
+            rasterio.open(
+                str(mask_path),
+                "w",
+                driver="GTiff",
+                width=width,
+                height=height,
+                count=1,
+                dtype="uint8",
+                crs=src.crs,
+                transform=transform,
+                compress="deflate",
+            ) as mask_dst,
+        ):
+            mask_dst.write(np.where(inside, 255, 0).astype(np.uint8), 1)
+        mask_el = ET.SubElement(ET.SubElement(root, "MaskBand"), "VRTRasterBand", dataType="Byte")
+        simple_source(mask_el, str(mask_path), 1, Window(0, 0, width, height))
+
+    ET.indent(root)
+    output_path.write_text(ET.tostring(root, encoding="unicode") + "\n")
+    return mask_path
+
+
+def clip(
+    path: str,
+    output_path: str,
+    params: dict[str, Any],
+    ctx: Context | None = None,
+) -> dict[str, Any]:
+    """Subset a raster to a bounding box or vector mask.
+
+    Args:
+        path: Path to source raster
+        output_path: Destination GeoTIFF, or ``.vrt`` for a virtual subset
+        params: Parameters dictionary with keys:
+            - bounds (list[float] | None): [minx, miny, maxx, maxy]
+            - bounds_crs (str | None): CRS of ``bounds`` (default: raster CRS)
+            - mask (str | None): Path to polygon layer; pixels outside become nodata
+            - all_touched (bool): Keep every pixel a mask polygon touches
+            - nodata (float | None): Value for masked pixels when the source has none
+            - compression (str | None): GeoTIFF compression (default: source's)
+        ctx: Optional FastMCP context for logging
+
+    Returns:
+        Dictionary with output path, driver, window, dimensions, bounds, CRS,
+        clip method and mask sidecar path (VRT mask clips only)
+    """
+    bounds = params.get("bounds")
+    mask = params.get("mask")
+    out = Path(output_path)
+    as_vrt = out.suffix.lower() == ".vrt"
+
+    try:
+        with gdal_env(), span("raster_clip", uri=path, vrt=as_vrt):
+            with span("open"):
+                src = rasterio.open(path)
+            with src:
+                if mask:
+                    with span("mask"):
+                        geoms = _read_mask(mask, src)
+                    if len(geoms) == 0:
+                        raise ToolError(f"Mask '{mask}' contains no geometries.")
+                    bbox = tuple(shapely.total_bounds(geoms).tolist())
+                elif bounds is not None:
+                    bbox = _bbox_in_raster_crs(src, bounds, params.get("bounds_crs"))
+                else:
+                    raise ToolError("Provide exactly one of bounds or mask to clip to.")
+                window = _pixel_window(src, bbox)
+
+                inside = None
+                if mask:
+                    with span("rasterize", width=int(window.width), height=int(window.height)):
+                        inside = geometry_mask(
+                            geoms,
+                            out_shape=(int(window.height), int(window.width)),
+                            transform=src.window_transform(window),
+                            invert=True,
+                            all_touched=bool(params.get("all_touched", False)),
+                        )
+
+                nodata = src.nodata if src.nodata is not None else params.get("nodata")
+                if src.nodata is None and nodata is not None and not as_vrt:
+                    _check_nodata(src, nodata)
+                mask_path = None
+                if as_vrt:
+                    with span("vrt"):
+                        mask_path = _write_vrt(src, path, out, window, inside)
+                else:
+                    _write_window(src, out, window, inside, nodata, params.get("compression"))
+
+                transform = src.window_transform(window)
+                left, top = transform @ (0, 0)
+                right, bottom = transform @ (int(window.width), int(window.height))
+                crs = str(src.crs) if src.crs else None
+    except ToolError:
+        raise
+    except rasterio.errors.RasterioIOError as e:
+        raise ToolError(
+            f"Cannot open raster at '{path}'. Ensure the file exists and is a valid raster format."
+        ) from e
+    except pyogrio.errors.DataSourceError as e:
+        raise ToolError(
+            f"Cannot open mask geometry at '{mask}'. Ensure the file exists and is a valid "
+            "vector format."
+        ) from e
+    except PermissionError as e:
+        raise ToolError(
+            f"Permission denied writing to '{output_path}'. Ensure the output directory "
+            "exists and is writable."
+        ) from e
+    except Exception as e:
+        raise ToolError(f"Unexpected error during raster clipping: {e!s}") from e
+
+    return {
+        "driver": "VRT" if as_vrt else "GTiff",
+        "window": {
+            "col_off": int(window.col_off),
+            "row_off": int(window.row_off),
+            "width": int(window.width),
+            "height": int(window.height),
+        },
+        "width": int(window.width),
+        "height": int(window.height),
+        "bounds": [min(left, right), min(top, bottom), max(left, right), max(top, bottom)],
+        "crs": crs,
+        "clip_method": "mask" if mask else "bbox",
+        "mask_path": str(mask_path) if mask_path else None,
+    }
@@ -6,6 +6,8 @@ import rasterio
 from fastmcp import Context
 from fastmcp.exceptions import ToolError
 
+from src.shared.gdal_env import gdal_env
+
 
 def extract_raster_info(
     path: str,
@@ -18,7 +20,7 @@ def extract_raster_info(
     or direct JSON serialization from a Resource.
     """
     try:
-        with rasterio.Env():
+        with gdal_env():
             with rasterio.open(path) as ds:
                 if band is not None:
                     if band < 1 or band > ds.count:
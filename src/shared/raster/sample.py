@@ -0,0 +1,216 @@
+"""Bulk point sampling of raster bands.
+
+Coordinates are transformed to the raster CRS in one call and converted to
+pixel indices with the inverse geotransform. Points are then grouped by the
+raster's internal block, and each block that holds at least one point is read
+once, for all requested bands, so sampling N points costs one decode per
+distinct block instead of one windowed read per point.
+"""
+
+from __future__ import annotations
+
+import csv
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pyogrio
+import rasterio
+import shapely
+from fastmcp.exceptions import ToolError
+from pyproj.exceptions import CRSError
+from rasterio.windows import Window
+
+from src.shared.gdal_env import gdal_env
+from src.shared.projection import get_transformer
+from src.shared.tracing import span
+
+if TYPE_CHECKING:  # pragma: no cover - import for type checking only
+    from fastmcp import Context
+    from rasterio.io import DatasetReader
+
+__all__ = ["read_points", "sample", "write_samples_csv"]
+
+LOGGER = logging.getLogger(__name__)
+
+
+def read_points(
+    points_path: str, id_field: str | None = None
+) -> tuple[np.ndarray, np.ndarray, list[Any], str | None]:
+    """Read point coordinates, identifiers and CRS from a vector layer.
+
+    Identifiers are ``id_field`` values, or 0-based feature indices.
+    """
+    gdf = pyogrio.read_dataframe(points_path, columns=[id_field] if id_field else [])
+    if id_field is not None and id_field not in gdf.columns:
+        raise ToolError(
+            f"Field '{id_field}' not found in '{points_path}'. "
+            f"Available fields: {[c for c in gdf.columns if c != gdf.geometry.name]}."
+        )
+    geoms = np.asarray(gdf.geometry.values, dtype=object)
+    type_ids = shapely.get_type_id(geoms)
+    if len(geoms) and not np.all(type_ids == shapely.GeometryType.POINT):
+        raise ToolError(
+            f"'{points_path}' must contain only Point geometries to sample. Convert lines or "
+            "polygons to representative points first."
+        )
+    ids = gdf[id_field].tolist() if id_field else list(range(len(gdf)))
+    crs = gdf.crs.to_string() if gdf.crs is not None else None
+    return shapely.get_x(geoms), shapely.get_y(geoms), ids, crs
+
+
+def _pixel_indices(src: DatasetReader, xs: np.ndarray, ys: np.ndarray) -> tuple[np.ndarray, ...]:
+    """Return integer rows, columns and an inside-the-raster flag for each point."""
+    cols_f, rows_f = ~src.transform @ (xs, ys)
+    finite = np.isfinite(cols_f) & np.isfinite(rows_f)
+    cols = np.where(finite, np.floor(np.where(finite, cols_f, 0)), -1).astype(np.int64)
+    rows = np.where(finite, np.floor(np.where(finite, rows_f, 0)), -1).astype(np.int64)
+    inside = finite & (cols >= 0) & (cols < src.width) & (rows >= 0) & (rows < src.height)
+    return rows, cols, inside
+
+
+def _read_by_block(
+    src: DatasetReader,
+    band_indices: list[int],
+    rows: np.ndarray,
+    cols: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, int]:
+    """Read every block holding a point once; return values, validity and block count."""
+    values = np.zeros((len(band_indices), len(rows)), dtype=np.float64)
+    valid = np.zeros((len(band_indices), len(rows)), dtype=bool)
+    if len(rows) == 0:
+        return values, valid, 0
+
+    block_height, block_width = src.block_shapes[0]
+    blocks_x = -(-src.width // block_width)
+    keys = (rows // block_height) * blocks_x + cols // block_width
+
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+    stops = np.r_[starts[1:], len(order)]
+    for start, stop in zip(starts, stops, strict=True):
+        members = order[start:stop]
+        block_row, block_col = divmod(int(sorted_keys[start]), blocks_x)
+        row_off, col_off = block_row * block_height, block_col * block_width
+        window = Window(
+            col_off,
+            row_off,
+            min(block_width, src.width - col_off),
+            min(block_height, src.height - row_off),
+        )
+        data = src.read(band_indices, window=window, masked=True)
+        local_rows, local_cols = rows[members] - row_off, cols[members] - col_off
+        values[:, members] = data.data[:, local_rows, local_cols]
+        valid[:, members] = ~np.ma.getmaskarray(data)[:, local_rows, local_cols]
+    return values, valid, len(starts)
+
+
+def sample(
+    path: str,
+    xs: np.ndarray,
+    ys: np.ndarray,
+    params: dict[str, Any] | None = None,
+    ctx: Context | None = None,
+) -> dict[str, Any]:
+    """Sample raster bands at many points.
+
+    Args:
+        path: Path to raster file
+        xs: Point x coordinates (longitude for geographic CRSs)
+        ys: Point y coordinates
+        params: Optional parameters dictionary with keys:
+            - bands (list[int] | None): Band indices to sample (default all)
+            - points_crs (str | None): CRS of the coordinates (default: raster CRS)
+        ctx: Optional FastMCP context for logging
+
+    Returns:
+        Dictionary with bands, crs, per-point ``rows``/``cols`` (None outside
+        the raster), per-band ``values`` (None for nodata or outside), and
+        ``blocks_read``
+    """
+    params = params or {}
+    bands = params.get("bands")
+    points_crs = params.get("points_crs")
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+
+    try:
+        with gdal_env(), span("raster_sample", uri=path, points=len(xs)):
+            with span("open"), rasterio.open(path) as src:
+                band_indices = list(bands) if bands else list(range(1, src.count + 1))
+                for idx in band_indices:
+                    if idx < 1 or idx > src.count:
+                        raise ToolError(
+                            f"Band index {idx} is out of range. Valid range: 1 to {src.count}."
+                        )
+                raster_crs = src.crs.to_string() if src.crs else None
+                if points_crs and raster_crs and points_crs != raster_crs and len(xs):
+                    with span("transform", points=len(xs)):
+                        transformer = get_transformer(points_crs, raster_crs)
+                        xs, ys = transformer.transform(xs, ys)
+                        xs, ys = np.asarray(xs), np.asarray(ys)
+
+                rows, cols, inside = _pixel_indices(src, xs, ys)
+                values = np.zeros((len(band_indices), len(xs)))
+                valid = np.zeros((len(band_indices), len(xs)), dtype=bool)
+                with span("read", points=int(inside.sum())) as read_span:
+                    block_values, block_valid, blocks_read = _read_by_block(
+                        src, band_indices, rows[inside], cols[inside]
+                    )
+                    read_span.attributes["blocks"] = blocks_read
+                values[:, inside] = block_values
+                valid[:, inside] = block_valid
+                if np.issubdtype(np.dtype(src.dtypes[0]), np.floating):
+                    valid &= np.isfinite(values)
+    except ToolError:
+        raise
+    except rasterio.errors.RasterioIOError as e:
+        raise ToolError(
+            f"Cannot open raster at '{path}'. Ensure the file exists and is a valid raster format."
+        ) from e
+    except (rasterio.errors.CRSError, CRSError) as e:
+        raise ToolError(f"Invalid points_crs '{points_crs}': {e}") from e
+    except Exception as e:
+        raise ToolError(f"Unexpected error while sampling raster: {e!s}") from e
+
+    return {
+        "path": path,
+        "bands": band_indices,
+        "crs": raster_crs,
+        "rows": [int(r) if ok else None for r, ok in zip(rows, inside, strict=True)],
+        "cols": [int(c) if ok else None for c, ok in zip(cols, inside, strict=True)],
+        "values": [
+            [float(v) if ok else None for v, ok in zip(band_values, band_valid, strict=True)]
+            for band_values, band_valid in zip(values, valid, strict=True)
+        ],
+        "inside_count": int(inside.sum()),
+        "blocks_read": blocks_read,
+    }
+
+
+def write_samples_csv(
+    output_path: Path,
+    ids: list[Any],
+    xs: np.ndarray,
+    ys: np.ndarray,
+    data: dict[str, Any],
+) -> None:
+    """Write one CSV row per point: id, x, y, row, col and one column per band."""
+    with output_path.open("w", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["id", "x", "y", "row", "col", *(f"band_{b}" for b in data["bands"])])
+        for i, point_id in enumerate(ids):
+            band_values = ("" if band[i] is None else band[i] for band in data["values"])
+            row, col = data["rows"][i], data["cols"][i]
+            writer.writerow(
+                [
+                    point_id,
+                    float(xs[i]),
+                    float(ys[i]),
+                    "" if row is None else row,
+                    "" if col is None else col,
+                    *band_values,
+                ]
+            )
@@ -3,16 +3,20 @@
 from __future__ import annotations
 
 import logging
+from contextlib import ExitStack
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
 import rasterio
 from fastmcp.exceptions import ToolError
-from rasterio.crs import CRS
+from rasterio.enums import Resampling
 from rasterio.io import DatasetReader
 from rasterio.warp import transform_bounds
 
 from src.shared.enum import Percentile, direction
+from src.shared.gdal_env import gdal_env
+from src.shared.projection import get_raster_crs
+from src.shared.tracing import span
 
 if TYPE_CHECKING:  # pragma: no cover - import for type checking only
     from fastmcp import Context
@@ -141,7 +145,7 @@ def _compute_spatial_extent(src: DatasetReader) -> dict[str, Any]:
         try:
             west, south, east, north = transform_bounds(
                 src.crs,
-                CRS.from_epsg(EPSG_WGS84),
+                get_raster_crs(f"EPSG:{EPSG_WGS84}"),
                 bounds.left,
                 bounds.bottom,
                 bounds.right,
@@ -184,6 +188,9 @@ def stats(
             - percentiles (list[float]): Custom percentiles
             - sample_size (int | None): Sample size for large rasters
             - include_extent (bool): Include spatial extent
+            - max_pixels (int | None): Read bands decimated to at most this many
+              pixels (nearest neighbour, using overviews when present); valid
+              and nodata counts are scaled to the full raster
         ctx: Optional FastMCP context for logging
 
     Returns:
@@ -198,11 +205,17 @@ def stats(
     percentiles = params.get("percentiles", Percentile.all())
     sample_size = params.get("sample_size")
     include_extent = bool(params.get("include_extent", True))
+    max_pixels = params.get("max_pixels")
 
     result: dict[str, Any] | None = None
 
     try:
-        with rasterio.Env(), rasterio.open(path) as src:
+        with ExitStack() as stack:
+            stack.enter_context(gdal_env())
+            stack.enter_context(span("raster_stats", uri=path))
+            with span("open"):
+                src = stack.enter_context(rasterio.open(path))
+
             if bands is None:
                 band_indices = list(range(1, src.count + 1))
             else:
@@ -215,27 +228,38 @@ def stats(
                         raise ToolError(message)
 
             total_pixels = src.width * src.height
+            read_kwargs: dict[str, Any] = {}
+            if max_pixels and total_pixels > max_pixels:
+                factor = (total_pixels / max_pixels) ** 0.5
+                read_kwargs = {
+                    "out_shape": (
+                        max(1, int(src.height / factor)),
+                        max(1, int(src.width / factor)),
+                    ),
+                    "resampling": Resampling.nearest,
+                }
             band_stats_list: list[dict[str, Any]] = []
 
             for band_idx in band_indices:
-                if src.nodata is not None:
-                    data = src.read(band_idx, masked=True)
-                    valid_data = data.compressed()
-                    valid_count = int(valid_data.size)
+                with span("read", band=band_idx, decimated=bool(read_kwargs)):
+                    if src.nodata is not None:
+                        data = src.read(band_idx, masked=True, **read_kwargs)
+                        valid_data = data.compressed()
+                    else:
+                        data = src.read(band_idx, **read_kwargs)
+                        valid_data = data.ravel()
+                    # Scale counts from a decimated read back to the full raster
+                    valid_count = round(valid_data.size * total_pixels / data.size)
                     nodata_count = int(total_pixels - valid_count)
-                else:
-                    data = src.read(band_idx)
-                    valid_data = data.ravel()
-                    valid_count = int(valid_data.size)
-                    nodata_count = 0
-
-                # Compute statistics
-                band_stats = _compute_band_statistics(valid_data, percentiles, sample_size)
-
-                # Build histogram if requested
-                histogram_list = (
-                    _build_histogram(valid_data, histogram_bins) if include_histogram else []
-                )
+
+                with span("statistics", band=band_idx):
+                    # Compute statistics
+                    band_stats = _compute_band_statistics(valid_data, percentiles, sample_size)
+
+                    # Build histogram if requested
+                    histogram_list = (
+                        _build_histogram(valid_data, histogram_bins) if include_histogram else []
+                    )
 
                 band_stats_list.append(
                     {
@@ -255,7 +279,8 @@ def stats(
 
             # Add spatial extent if requested
             if include_extent:
-                result["spatial_extent"] = _compute_spatial_extent(src)
+                with span("extent"):
+                    result["spatial_extent"] = _compute_spatial_extent(src)
     except rasterio.errors.RasterioIOError as e:
         message = (
             f"Cannot open raster at '{path}'. Ensure the file exists and is a valid raster format."
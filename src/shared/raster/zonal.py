@@ -0,0 +1,315 @@
+"""Zonal statistics of raster bands over vector zones.
+
+Zones are rasterized once into a label array on the raster's grid (0 means
+outside every zone). Bands are then read one block window at a time and
+aggregated per label with ``np.bincount`` and ``ufunc.at``, so the cost is
+proportional to the number of pixels rather than zones x pixels. Blocks are
+split across threads, each with its own dataset handle; per-block partial
+results (count, mean, sum of squared deviations, min, max) are merged with
+the parallel variance formula, so standard deviations stay exact.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pyogrio
+import rasterio
+from fastmcp.exceptions import ToolError
+from rasterio.features import rasterize
+from rasterio.windows import Window
+
+from src.shared.gdal_env import gdal_env
+from src.shared.projection import get_transformer, transform_geometries
+from src.shared.tracing import span
+
+if TYPE_CHECKING:  # pragma: no cover - import for type checking only
+    from fastmcp import Context
+
+__all__ = ["ZonalAccumulator", "zonal_stats"]
+
+LOGGER = logging.getLogger(__name__)
+
+# Minimum rows per window for strip-organised rasters (one-row strips are common)
+STRIP_ROWS = 256
+
+
+@dataclass(slots=True)
+class ZonalAccumulator:
+    """Per-label running statistics for one band (index 0 is "no zone")."""
+
+    count: np.ndarray
+    mean: np.ndarray
+    m2: np.ndarray
+    minimum: np.ndarray
+    maximum: np.ndarray
+
+    @classmethod
+    def empty(cls, labels: int) -> ZonalAccumulator:
+        """Return an accumulator with no pixels for ``labels`` labels."""
+        return cls(
+            count=np.zeros(labels, dtype=np.int64),
+            mean=np.zeros(labels, dtype=np.float64),
+            m2=np.zeros(labels, dtype=np.float64),
+            minimum=np.full(labels, np.inf),
+            maximum=np.full(labels, -np.inf),
+        )
+
+    def add(self, labels: np.ndarray, values: np.ndarray) -> None:
+        """Aggregate valid pixel values by their zone label."""
+        if labels.size == 0:
+            return
+        size = len(self.count)
+        count = np.bincount(labels, minlength=size)
+        total = np.bincount(labels, weights=values, minlength=size)
+        seen = count > 0
+        mean = np.zeros(size)
+        mean[seen] = total[seen] / count[seen]
+        m2 = np.bincount(labels, weights=(values - mean[labels]) ** 2, minlength=size)
+        np.minimum.at(self.minimum, labels, values)
+        np.maximum.at(self.maximum, labels, values)
+        self._merge(count, mean, m2)
+
+    def merge(self, other: ZonalAccumulator) -> None:
+        """Fold another accumulator for the same labels into this one."""
+        np.minimum(self.minimum, other.minimum, out=self.minimum)
+        np.maximum(self.maximum, other.maximum, out=self.maximum)
+        self._merge(other.count, other.mean, other.m2)
+
+    def _merge(self, count: np.ndarray, mean: np.ndarray, m2: np.ndarray) -> None:
+        # Chan et al. pairwise update of count, mean and sum of squared deviations
+        combined = self.count + count
+        seen = combined > 0
+        delta = mean - self.mean
+        weight = np.zeros(len(combined))
+        weight[seen] = count[seen] / combined[seen]
+        self.mean += delta * weight
+        self.m2 += m2 + delta**2 * self.count * weight
+        self.count = combined
+
+    def zone(self, label: int) -> dict[str, Any]:
+        """Return count, sum, min, max, mean and population std of one label."""
+        count = int(self.count[label])
+        if count == 0:
+            return {"count": 0, "sum": None, "min": None, "max": None, "mean": None, "std": None}
+        mean = float(self.mean[label])
+        return {
+            "count": count,
+            "sum": mean * count,
+            "min": float(self.minimum[label]),
+            "max": float(self.maximum[label]),
+            "mean": mean,
+            "std": float(np.sqrt(max(self.m2[label], 0.0) / count)),
+        }
+
+
+def _read_zones(
+    zones_path: str, zone_field: str | None, raster_crs: Any
+) -> tuple[np.ndarray, list[Any]]:
+    """Read zone geometries in the raster CRS with their zone identifiers."""
+    gdf = pyogrio.read_dataframe(zones_path, columns=[zone_field] if zone_field else [])
+    if zone_field is not None and zone_field not in gdf.columns:
+        raise ToolError(
+            f"Zone field '{zone_field}' not found in '{zones_path}'. "
+            f"Available fields: {[c for c in gdf.columns if c != gdf.geometry.name]}."
+        )
+    geoms = np.asarray(gdf.geometry.values, dtype=object)
+    if gdf.crs is not None and raster_crs is not None and gdf.crs != raster_crs:
+        transformer = get_transformer(gdf.crs.to_string(), raster_crs.to_string())
+        geoms = transform_geometries(geoms, transformer)
+    ids = gdf[zone_field].tolist() if zone_field else list(range(len(gdf)))
+    return geoms, ids
+
+
+def _label_zones(
+    geoms: np.ndarray, ids: list[Any], src: rasterio.io.DatasetReader, all_touched: bool
+) -> tuple[np.ndarray, list[Any]]:
+    """Burn zones into a label array; features sharing a zone id share a label."""
+    labels_by_id: dict[Any, int] = {}
+    shapes = []
+    for geom, zone_id in zip(geoms, ids, strict=True):
+        if geom is None or geom.is_empty:
+            continue
+        label = labels_by_id.setdefault(zone_id, len(labels_by_id) + 1)
+        shapes.append((geom, label))
+    zone_ids = list(labels_by_id)
+
+    dtype = np.uint16 if len(zone_ids) < np.iinfo(np.uint16).max else np.uint32
+    if not shapes:
+        return np.zeros((src.height, src.width), dtype=dtype), zone_ids
+    label_array = rasterize(
+        shapes,
+        out_shape=(src.height, src.width),
+        transform=src.transform,
+        fill=0,
+        all_touched=all_touched,
+        dtype=dtype,
+    )
+    return label_array, zone_ids
+
+
+def _block_windows(src: rasterio.io.DatasetReader) -> list[Window]:
+    """Return read windows aligned with the raster's internal blocks."""
+    block_height, block_width = src.block_shapes[0]
+    if block_width < src.width:
+        return [window for _, window in src.block_windows(1)]
+    # Striped layout: read several whole strips per window to amortise per-read overhead
+    step = block_height * max(1, STRIP_ROWS // block_height)
+    return [
+        Window(0, row, src.width, min(step, src.height - row)) for row in range(0, src.height, step)
+    ]
+
+
+def _aggregate_windows(
+    path: str,
+    windows: list[Window],
+    label_array: np.ndarray,
+    band_indices: list[int],
+    labels: int,
+) -> list[ZonalAccumulator]:
+    """Aggregate a share of the block windows with a thread-local dataset handle."""
+    accumulators = [ZonalAccumulator.empty(labels) for _ in band_indices]
+    with gdal_env(), rasterio.open(path) as src:
+        for window in windows:
+            rows, cols = window.toslices()
+            block_labels = label_array[rows, cols]
+            zoned = block_labels > 0
+            if not zoned.any():
+                continue
+            data = src.read(band_indices, window=window, masked=True)
+            for accumulator, band in zip(accumulators, data, strict=True):
+                valid = zoned & ~np.ma.getmaskarray(band)
+                values = np.asarray(band.data[valid], dtype=np.float64)
+                block_zone_labels = block_labels[valid].astype(np.intp)
+                if np.issubdtype(band.dtype, np.floating):
+                    finite = np.isfinite(values)
+                    values, block_zone_labels = values[finite], block_zone_labels[finite]
+                accumulator.add(block_zone_labels, values)
+    return accumulators
+
+
+def zonal_stats(
+    path: str,
+    zones_path: str,
+    params: dict[str, Any] | None = None,
+    ctx: Context | None = None,
+) -> dict[str, Any]:
+    """Compute per-zone count, sum, min, max, mean and std for raster bands.
+
+    Args:
+        path: Path to raster file
+        zones_path: Path to polygon vector layer defining the zones
+        params: Optional parameters dictionary with keys:
+            - bands (list[int] | None): Band indices to analyze (default all)
+            - zone_field (str | None): Attribute identifying zones; features with
+              the same value form one zone. Default: one zone per feature, keyed
+              by its 0-based index
+            - all_touched (bool): Include every pixel touched by a zone, not only
+              pixels whose centre falls inside
+            - workers (int | None): Threads reading blocks (default all cores)
+        ctx: Optional FastMCP context for logging
+
+    Returns:
+        Dictionary with path, zones_path, zone_field, bands, pixel counts and a
+        ``zones`` list of ``{"zone": id, "band_stats": [...]}``
+
+    Where zones overlap, pixels belong to the zone listed last.
+    """
+    params = params or {}
+    bands = params.get("bands")
+    zone_field = params.get("zone_field")
+    all_touched = bool(params.get("all_touched", False))
+    workers = params.get("workers")
+
+    try:
+        with gdal_env(), span("raster_zonal_stats", uri=path, zones=zones_path):
+            with span("open"), rasterio.open(path) as src:
+                band_indices = list(bands) if bands else list(range(1, src.count + 1))
+                for idx in band_indices:
+                    if idx < 1 or idx > src.count:
+                        raise ToolError(
+                            f"Band index {idx} is out of range. Valid range: 1 to {src.count}."
+                        )
+                with span("read_zones"):
+                    geoms, ids = _read_zones(zones_path, zone_field, src.crs)
+                with span("rasterize", zones=len(geoms)):
+                    label_array, zone_ids = _label_zones(geoms, ids, src, all_touched)
+                windows = _block_windows(src)
+                total_pixels = src.width * src.height
+
+            labels = len(zone_ids) + 1
+            workers = max(1, min(workers or os.cpu_count() or 1, len(windows)))
+            shares = [windows[i::workers] for i in range(workers)]
+            with span("aggregate", blocks=len(windows), workers=workers):
+                if workers == 1:
+                    partials = [
+                        _aggregate_windows(path, windows, label_array, band_indices, labels)
+                    ]
+                else:
+                    with ThreadPoolExecutor(
+                        max_workers=workers, thread_name_prefix="gdal-mcp-zonal"
+                    ) as executor:
+                        partials = list(
+                            executor.map(
+                                lambda share: _aggregate_windows(
+                                    path, share, label_array, band_indices, labels
+                                ),
+                                shares,
+                            )
+                        )
+                accumulators = partials[0]
+                for partial in partials[1:]:
+                    for accumulator, other in zip(accumulators, partial, strict=True):
+                        accumulator.merge(other)
+    except ToolError:
+        raise
+    except rasterio.errors.RasterioIOError as e:
+        raise ToolError(
+            f"Cannot open raster at '{path}'. Ensure the file exists and is a valid raster format."
+        ) from e
+    except pyogrio.errors.DataSourceError as e:
+        raise ToolError(
+            f"Cannot open zones at '{zones_path}'. Ensure the file exists and is a valid "
+            "vector format."
+        ) from e
+    except MemoryError as e:
+        raise ToolError(
+            f"Out of memory while labelling zones for '{path}'. The label array needs one "
+            "value per raster pixel; clip the raster to the zones' extent first."
+        ) from e
+    except Exception as e:
+        raise ToolError(f"Unexpected error while computing zonal statistics: {e!s}") from e
+
+    zones = [
+        {
+            "zone": _json_scalar(zone_id),
+            "band_stats": [
+                {"band": band, **accumulator.zone(label)}
+                for band, accumulator in zip(band_indices, accumulators, strict=True)
+            ],
+        }
+        for label, zone_id in enumerate(zone_ids, start=1)
+    ]
+    return {
+        "path": path,
+        "zones_path": zones_path,
+        "zone_field": zone_field,
+        "bands": band_indices,
+        "zones": zones,
+        "total_pixels": int(total_pixels),
+        "zoned_pixels": int(np.count_nonzero(label_array)),
+    }
+
+
+def _json_scalar(value: Any) -> Any:
+    # numpy scalars and timestamps from attribute columns are not JSON types
+    if isinstance(value, np.generic):
+        return value.item()
+    if value is None or isinstance(value, str | int | float | bool):
+        return value
+    return str(value)
@@ -17,13 +17,7 @@ except ImportError:  # pragma: no cover - backport for Python 3.10
 from collections.abc import Mapping, Sequence
 from functools import lru_cache
 from types import MappingProxyType
-from typing import Final, TypedDict
-
-try:
-    from rasterio.enums import Resampling as _RIOResampling
-except ImportError:  # pragma: no cover - optional
-    _RIOResampling = None  # type: ignore
-
+from typing import Any, Final, TypedDict
 
 AliasTuple = tuple[str, ...]
 EMPTY_ALIASES: Final[AliasTuple] = ()
@@ -221,19 +215,26 @@ _GUIDE: Final[Sequence[dict[str, str]]] = (
 # ─────────────── Registry build (once) ───────────────
 
 
-def _rio_value_or_gdal_token(key: str) -> int | str:
-    if _RIOResampling is not None:
+def _rio_value_or_gdal_token(key: str, rio_resampling: Any) -> int | str:
+    if rio_resampling is not None:
         name_upper = key.upper()
-        if hasattr(_RIOResampling, name_upper):
-            return getattr(_RIOResampling, name_upper).value
+        if hasattr(rio_resampling, name_upper):
+            return getattr(rio_resampling, name_upper).value
     return _GDAL_NAME[key]
 
 
-def _build_registry() -> list[ResamplingInfo]:
+@lru_cache(maxsize=1)
+def _registry() -> list[ResamplingInfo]:
+    """Build the registry on first use, so importing this module does not load rasterio."""
+    try:
+        from rasterio.enums import Resampling as rio_resampling
+    except ImportError:  # pragma: no cover - optional
+        rio_resampling = None
+
     entries: list[ResamplingInfo] = []
     for key in _DESC.keys():
         name: str = key.upper()
-        value: int | str = _rio_value_or_gdal_token(key)
+        value: int | str = _rio_value_or_gdal_token(key, rio_resampling)
         description: str = _DESC[key]
         recommended_usage: str = _USE.get(key, "")
         category: Category = _CAT.get(key, Category.GENERIC)
@@ -258,18 +259,14 @@ def _build_registry() -> list[ResamplingInfo]:
     return entries
 
 
-_REGISTRY: Final[list[ResamplingInfo]] = _build_registry()
-
-# Fast lookups (precomputed)
-_BY_CANON: Final[Mapping[str, ResamplingInfo]] = MappingProxyType(
-    {e["name"].lower(): e for e in _REGISTRY}
-)
-_BY_GDAL: Final[Mapping[str, ResamplingInfo]] = MappingProxyType(
-    {e["gdal_name"]: e for e in _REGISTRY}
-)
-_BY_ALIAS: Final[Mapping[str, ResamplingInfo]] = MappingProxyType(
-    {alias: e for e in _REGISTRY for alias in e["aliases"]}
-)
+@lru_cache(maxsize=1)
+def _lookups() -> tuple[Mapping[str, ResamplingInfo], ...]:
+    """Return the by-name, by-GDAL-name and by-alias lookups (built once)."""
+    registry = _registry()
+    by_canon = MappingProxyType({e["name"].lower(): e for e in registry})
+    by_gdal = MappingProxyType({e["gdal_name"]: e for e in registry})
+    by_alias = MappingProxyType({alias: e for e in registry for alias in e["aliases"]})
+    return by_canon, by_gdal, by_alias
 
 
 # ────────────────── Public API ──────────────────
@@ -279,7 +276,7 @@ def list_resampling_methods(
     *, category: str | None = None, op_type: str | None = None
 ) -> list[ResamplingInfo]:
     """List resampling methods, optionally filtered by category or operation type."""
-    methods: Sequence[ResamplingInfo] = _REGISTRY
+    methods: Sequence[ResamplingInfo] = _registry()
     if category:
         c = category.lower()
         methods = [m for m in methods if m["category"].value == c]
@@ -302,7 +299,8 @@ def resampling_guide(topic: str | None = None) -> list[dict[str, str]]:
 def normalize_resampling(name_or_alias: str) -> ResamplingInfo | None:
     """Normalize a resampling method name or alias to canonical ResamplingInfo."""
     needle = name_or_alias.strip().lower()
-    return _BY_GDAL.get(needle) or _BY_ALIAS.get(needle) or _BY_CANON.get(needle)
+    by_canon, by_gdal, by_alias = _lookups()
+    return by_gdal.get(needle) or by_alias.get(needle) or by_canon.get(needle)
 
 
 def choose_resampling(*, is_categorical: bool, scale_ratio: float) -> ResamplingInfo:
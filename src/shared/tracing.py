@@ -0,0 +1,262 @@
+"""Lightweight stage-level tracing spans.
+
+Spans follow the OpenTelemetry data model (trace and span ids, parent links,
+nanosecond timestamps, attributes, status) and serialise with the field names
+of the OTLP JSON encoding, so exported files can be loaded by OpenTelemetry
+tooling. No collector or SDK is needed: finished spans go to an in-memory
+ring buffer (default) or are appended to a JSONL file.
+
+Usage::
+
+    with span("warp", band=1):
+        reproject(...)
+
+Nested ``span`` blocks, including across ``await`` in the same task, become
+children of the enclosing span. Exporting is configured with
+GDAL_MCP_TRACE (``memory``, ``jsonl`` or ``off``) and GDAL_MCP_TRACE_FILE.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import secrets
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Protocol
+
+from src.config import get_trace_exporter, get_trace_file
+
+__all__ = [
+    "JsonlExporter",
+    "RingBufferExporter",
+    "Span",
+    "SpanExporter",
+    "current_span",
+    "get_exporter",
+    "recent_spans",
+    "reset_tracing",
+    "set_exporter",
+    "span",
+]
+
+logger = logging.getLogger(__name__)
+
+# Finished spans kept by the in-memory exporter
+RING_BUFFER_SIZE = 4096
+
+
+@dataclass(slots=True)
+class Span:
+    """One timed stage of work.
+
+    Attributes:
+        name: Stage name (e.g. "open", "warp", "write").
+        trace_id: 32 hex digits shared by every span of one operation.
+        span_id: 16 hex digits identifying this span.
+        parent_span_id: span_id of the enclosing span, if any.
+        start_ns: Start time in nanoseconds since the Unix epoch.
+        end_ns: End time in nanoseconds since the Unix epoch (0 while open).
+        attributes: Stage details such as band index or batch size.
+        error: Exception message if the stage raised.
+    """
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_span_id: str | None = None
+    start_ns: int = 0
+    end_ns: int = 0
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+    _perf_start: float = field(default=0.0, repr=False)
+
+    @property
+    def duration(self) -> float:
+        """Elapsed seconds (measured with a monotonic clock)."""
+        return (self.end_ns - self.start_ns) / 1e9
+
+    def set(self, **attributes: Any) -> None:
+        """Add or replace span attributes."""
+        self.attributes.update(attributes)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialise with OTLP JSON field names."""
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_span_id or "",
+            "name": self.name,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [
+                {"key": key, "value": _attribute_value(value)}
+                for key, value in self.attributes.items()
+            ],
+            "status": {"code": 2, "message": self.error} if self.error else {"code": 1},
+        }
+
+
+def _attribute_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class SpanExporter(Protocol):
+    """Receives each span when it ends."""
+
+    def export(self, span: Span) -> None:
+        """Handle a finished span."""
+        ...
+
+
+class RingBufferExporter:
+    """Keep the most recent finished spans in memory."""
+
+    def __init__(self, capacity: int = RING_BUFFER_SIZE) -> None:
+        self._spans: deque[Span] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        """Buffer a finished span, evicting the oldest when full."""
+        with self._lock:
+            self._spans.append(span)
+
+    def spans(self, trace_id: str | None = None) -> list[Span]:
+        """Return buffered spans, oldest first, optionally for one trace."""
+        with self._lock:
+            spans = list(self._spans)
+        if trace_id is None:
+            return spans
+        return [s for s in spans if s.trace_id == trace_id]
+
+    def clear(self) -> None:
+        """Drop all buffered spans."""
+        with self._lock:
+            self._spans.clear()
+
+
+class JsonlExporter:
+    """Append each finished span as one JSON line, keeping a ring buffer too."""
+
+    def __init__(self, path: str | Path, capacity: int = RING_BUFFER_SIZE) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._buffer = RingBufferExporter(capacity)
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        """Buffer a finished span and append it to the file."""
+        self._buffer.export(span)
+        line = json.dumps(span.to_dict(), separators=(",", ":"))
+        with self._lock, self.path.open("a", encoding="utf-8") as handle:
+            handle.write(line + "\n")
+
+    def spans(self, trace_id: str | None = None) -> list[Span]:
+        """Return recently exported spans, oldest first, optionally for one trace."""
+        return self._buffer.spans(trace_id)
+
+
+_CURRENT_SPAN: ContextVar[Span | None] = ContextVar("gdal_mcp_span", default=None)
+_EXPORTER_LOCK = threading.Lock()
+_EXPORTER: SpanExporter | None = None
+_EXPORTER_CONFIGURED = False
+
+
+def _configured_exporter() -> SpanExporter | None:
+    kind = get_trace_exporter()
+    if kind == "off":
+        return None
+    if kind == "jsonl":
+        return JsonlExporter(get_trace_file())
+    return RingBufferExporter()
+
+
+def get_exporter() -> SpanExporter | None:
+    """Return the active exporter (None when tracing is off)."""
+    global _EXPORTER, _EXPORTER_CONFIGURED
+    if not _EXPORTER_CONFIGURED:
+        with _EXPORTER_LOCK:
+            if not _EXPORTER_CONFIGURED:
+                _EXPORTER = _configured_exporter()
+                _EXPORTER_CONFIGURED = True
+    return _EXPORTER
+
+
+def set_exporter(exporter: SpanExporter | None) -> None:
+    """Replace the active exporter (None disables tracing)."""
+    global _EXPORTER, _EXPORTER_CONFIGURED
+    with _EXPORTER_LOCK:
+        _EXPORTER = exporter
+        _EXPORTER_CONFIGURED = True
+
+
+def current_span() -> Span | None:
+    """Return the innermost open span in this context, if any."""
+    return _CURRENT_SPAN.get()
+
+
+def recent_spans(trace_id: str | None = None) -> list[dict[str, Any]]:
+    """Return buffered spans as dictionaries (empty if the exporter keeps none)."""
+    exporter = get_exporter()
+    spans = getattr(exporter, "spans", None)
+    if spans is None:
+        return []
+    return [s.to_dict() for s in spans(trace_id)]
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span]:
+    """Time a stage as a child of the current span.
+
+    Yields the open span so callers can attach attributes discovered during
+    the stage. When tracing is off the span is neither timed nor exported.
+    """
+    exporter = get_exporter()
+    if exporter is None:
+        yield Span(name=name, trace_id="", span_id="", attributes=attributes)
+        return
+
+    parent = _CURRENT_SPAN.get()
+    current = Span(
+        name=name,
+        trace_id=parent.trace_id if parent else secrets.token_hex(16),
+        span_id=secrets.token_hex(8),
+        parent_span_id=parent.span_id if parent else None,
+        start_ns=time.time_ns(),
+        attributes=attributes,
+        _perf_start=time.perf_counter(),
+    )
+    token = _CURRENT_SPAN.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        _CURRENT_SPAN.reset(token)
+        elapsed_ns = int((time.perf_counter() - current._perf_start) * 1e9)
+        current.end_ns = current.start_ns + elapsed_ns
+        try:
+            exporter.export(current)
+        except OSError as e:
+            logger.warning("Failed to export span '%s': %s", name, e)
+
+
+def reset_tracing() -> None:
+    """Forget the configured exporter so it is rebuilt from the environment (testing helper)."""
+    global _EXPORTER, _EXPORTER_CONFIGURED
+    with _EXPORTER_LOCK:
+        _EXPORTER = None
+        _EXPORTER_CONFIGURED = False
@@ -5,16 +5,26 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pyogrio
+import shapely
 from fastmcp import Context
 from fastmcp.exceptions import ToolError
 
+from src.shared.projection import get_crs
+from src.shared.tracing import span
+from src.shared.vector.parallel import DEFAULT_CHUNK_SIZE, partitioned, union_partitioned
+from src.shared.vector.stream import iter_geometry_batches, stream_vector, write_geometries
+
 
 def buffer(
     input_path: str,
     output_path: str | Path,
     distance: float,
     resolution: int = 16,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    dissolve: bool = False,
     ctx: Context | None = None,
 ) -> dict[str, Any]:
     """Create buffer around vector geometries.
@@ -24,62 +34,66 @@ def buffer(
         output_path: Path for output vector file
         distance: Buffer distance in CRS units
         resolution: Segments per quadrant (default 16)
+        workers: Threads buffering in parallel (default: all cores)
+        chunk_size: Geometries per parallel chunk
+        dissolve: Union overlapping buffers and write one feature per
+            resulting polygon (source attributes are dropped)
         ctx: Optional FastMCP context for logging
 
     Returns:
         Dictionary with buffer metadata:
-        - feature_count: Number of features buffered
+        - feature_count: Number of features written
         - buffer_distance: Distance applied
         - resolution: Segments per quadrant
         - bounds: Output spatial extent
+        - dissolved: Whether buffers were dissolved
 
     Raises:
         ToolError: If buffering fails
     """
     try:
-        # Read source data
-        gdf = pyogrio.read_dataframe(input_path)
+        # Create buffers batch by batch, each batch split across worker threads
+        # resolution parameter: number of segments per quadrant
+        # Higher values create smoother circles but are slower
+        buffer_batch = partitioned(
+            lambda geoms: shapely.buffer(geoms, distance, quad_segs=resolution),
+            workers=workers,
+            chunk_size=chunk_size,
+        )
+
+        if dissolve:
+            # Union all buffers with a spatially partitioned cascade, then
+            # stream the resulting polygons out
+            with span("buffer"):
+                buffers = [buffer_batch(geoms) for geoms in iter_geometry_batches(input_path)]
+            with span("union"):
+                dissolved = union_partitioned(
+                    np.concatenate(buffers) if buffers else np.empty(0, dtype=object),
+                    workers=workers,
+                    chunk_size=chunk_size,
+                )
+            polygons = shapely.get_parts(dissolved)
+            with span("write", features=len(polygons)):
+                result = write_geometries(
+                    polygons[~shapely.is_empty(polygons)],
+                    output_path,
+                    crs=pyogrio.read_info(input_path).get("crs"),
+                )
+        else:
+            result = stream_vector(input_path, output_path, buffer_batch)
 
         # Check CRS - warn if geographic
         # Note: ctx logging would require async, so we just return info in result
         # The tool wrapper will handle warning the user
-        is_geographic = gdf.crs and gdf.crs.is_geographic
-
-        # Create buffers
-        # resolution parameter: number of segments per quadrant
-        # Higher values create smoother circles but are slower
-        gdf_buffered = gdf.copy()
-        gdf_buffered["geometry"] = gdf.geometry.buffer(distance, resolution=resolution)
-
-        # Determine output driver from extension
-        output_path_obj = Path(output_path)
-        extension = output_path_obj.suffix.lower()
-        driver_map = {
-            ".shp": "ESRI Shapefile",
-            ".gpkg": "GPKG",
-            ".geojson": "GeoJSON",
-            ".json": "GeoJSON",
-        }
-        driver = driver_map.get(extension, "GPKG")
-
-        # Write buffered data
-        pyogrio.write_dataframe(gdf_buffered, output_path, driver=driver)
-
-        # Get output metadata
-        output_info = pyogrio.read_info(str(output_path))
-
-        # Extract bounds
-        bounds_tuple = None
-        if "total_bounds" in output_info and output_info["total_bounds"] is not None:
-            b = output_info["total_bounds"]
-            bounds_tuple = [float(b[0]), float(b[1]), float(b[2]), float(b[3])]
+        is_geographic = bool(result.source_crs) and get_crs(result.source_crs).is_geographic
 
         return {
-            "feature_count": len(gdf_buffered),
+            "feature_count": result.feature_count,
             "buffer_distance": distance,
             "resolution": resolution,
-            "bounds": bounds_tuple,
+            "bounds": result.bounds,
             "is_geographic": is_geographic,
+            "dissolved": dissolve,
         }
 
     except Exception as e:
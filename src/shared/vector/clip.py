@@ -5,11 +5,15 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pyogrio
 import shapely
 from fastmcp import Context
 from fastmcp.exceptions import ToolError
 
+from src.shared.tracing import span
+from src.shared.vector.stream import stream_vector
+
 
 def clip(
     input_path: str,
@@ -50,63 +54,56 @@ def clip(
         )
 
     try:
-        # Read source data
-        gdf = pyogrio.read_dataframe(input_path)
-
         if bounds is not None:
             # Clip by bounding box
             minx, miny, maxx, maxy = bounds
             bbox = shapely.box(minx, miny, maxx, maxy)
 
-            # Clip geometries
-            gdf_clipped = gdf[gdf.intersects(bbox)].copy()
-            gdf_clipped["geometry"] = gdf_clipped.geometry.intersection(bbox)
+            # Push the bbox down to OGR so the driver's spatial index (GPKG R-tree,
+            # shapefile .qix) prunes features before they are decoded
+            read_kwargs: dict[str, Any] = {"bbox": (minx, miny, maxx, maxy)}
+
+            def transform(geoms: np.ndarray) -> np.ndarray:
+                out = np.full(len(geoms), None, dtype=object)
+                hits = shapely.intersects(geoms, bbox)
+                out[hits] = shapely.intersection(geoms[hits], bbox)
+                return out
 
             clip_method = "bbox"
 
         else:
             # Clip by mask geometry
-            mask_gdf = pyogrio.read_dataframe(mask)
-
-            # Union all mask geometries into single geometry
-            mask_geom = mask_gdf.geometry.union_all()
-
-            # Clip geometries
-            gdf_clipped = gdf[gdf.intersects(mask_geom)].copy()
-            gdf_clipped["geometry"] = gdf_clipped.geometry.intersection(mask_geom)
+            with span("mask"):
+                mask_gdf = pyogrio.read_dataframe(mask)
+
+                # Union all mask geometries into single geometry
+                mask_geom = mask_gdf.geometry.union_all()
+
+            # Only read source features within the mask envelope
+            if mask_geom.is_empty:
+                # Nothing can intersect; read no rows but keep the schema and CRS
+                read_kwargs = {"where": "1=0"}
+            else:
+                read_kwargs = {"bbox": tuple(mask_geom.bounds)}
+
+            # Clip geometries against an STRtree of the mask parts
+            def transform(geoms: np.ndarray) -> np.ndarray:
+                out = np.full(len(geoms), None, dtype=object)
+                kept, clipped = _clip_to_mask(geoms, mask_geom)
+                out[kept] = clipped
+                return out
 
             clip_method = "mask"
 
-        # Remove any empty geometries after clipping
-        gdf_clipped = gdf_clipped[~gdf_clipped.geometry.is_empty]
-
-        # Determine output driver from extension
-        output_path_obj = Path(output_path)
-        extension = output_path_obj.suffix.lower()
-        driver_map = {
-            ".shp": "ESRI Shapefile",
-            ".gpkg": "GPKG",
-            ".geojson": "GeoJSON",
-            ".json": "GeoJSON",
-        }
-        driver = driver_map.get(extension, "GPKG")
-
-        # Write clipped data
-        pyogrio.write_dataframe(gdf_clipped, output_path, driver=driver)
-
-        # Get output metadata
-        output_info = pyogrio.read_info(str(output_path))
-
-        # Extract bounds
-        bounds_tuple = None
-        if "total_bounds" in output_info and output_info["total_bounds"] is not None:
-            b = output_info["total_bounds"]
-            bounds_tuple = [float(b[0]), float(b[1]), float(b[2]), float(b[3])]
+        # Clip batch by batch, removing features that miss the clip area or become empty
+        result = stream_vector(
+            input_path, output_path, transform, drop_empty=True, read_kwargs=read_kwargs
+        )
 
         return {
-            "feature_count": len(gdf_clipped),
-            "geometry_type": output_info.get("geometry_type"),
-            "bounds": bounds_tuple,
+            "feature_count": result.feature_count,
+            "geometry_type": result.geometry_type,
+            "bounds": result.bounds,
             "clip_method": clip_method,
         }
 
@@ -125,3 +122,50 @@ def clip(
             ) from e
         else:
             raise ToolError(f"Vector clipping failed: {e}") from e
+
+
+def _clip_to_mask(geoms: np.ndarray, mask_geom: Any) -> tuple[np.ndarray, np.ndarray]:
+    """Intersect geometries with a mask using an STRtree over the mask parts.
+
+    Candidate (feature, part) pairs come from a single bulk tree query, so
+    each feature is only tested against the mask parts whose envelopes it
+    touches. Parts are prepared; a feature lying entirely inside one part is
+    returned unchanged without calling ``intersection``. Features split across
+    several parts have their pieces unioned.
+
+    Args:
+        geoms: Array of shapely geometries to clip
+        mask_geom: Unioned mask geometry (its parts are disjoint)
+
+    Returns:
+        Tuple of (indices of features that intersect the mask, clipped geometries)
+    """
+    parts = shapely.get_parts(mask_geom)
+    parts = parts[~shapely.is_empty(parts)]
+    if len(parts) == 0 or len(geoms) == 0:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=object)
+
+    shapely.prepare(parts)
+    tree = shapely.STRtree(parts)
+    feature_idx, part_idx = tree.query(geoms, predicate="intersects")
+    order = np.lexsort((part_idx, feature_idx))
+    feature_idx, part_idx = feature_idx[order], part_idx[order]
+
+    kept = np.unique(feature_idx)
+    # Default to the untouched geometry; only features crossing a part boundary are cut
+    clipped = geoms[kept].copy()
+
+    inside = shapely.contains_properly(parts[part_idx], geoms[feature_idx])
+    needs_cut = ~np.isin(feature_idx, feature_idx[inside])
+    cut_features = feature_idx[needs_cut]
+    if cut_features.size == 0:
+        return kept, clipped
+
+    pieces = shapely.intersection(geoms[cut_features], parts[part_idx[needs_cut]])
+    cut_ids, starts, counts = np.unique(cut_features, return_index=True, return_counts=True)
+    merged = pieces[starts]
+    for j in np.flatnonzero(counts > 1):
+        merged[j] = shapely.union_all(pieces[starts[j] : starts[j] + counts[j]])
+
+    clipped[np.searchsorted(kept, cut_ids)] = merged
+    return kept, clipped
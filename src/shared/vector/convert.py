@@ -9,6 +9,8 @@ import pyogrio
 from fastmcp import Context
 from fastmcp.exceptions import ToolError
 
+from src.shared.vector.stream import driver_for_path, stream_vector
+
 
 def convert(
     input_path: str,
@@ -44,52 +46,27 @@ def convert(
 
         # Determine output driver from extension if not specified
         output_path_obj = Path(output_path)
-        extension = output_path_obj.suffix.lower()
-
-        if driver is None:
-            # Auto-detect driver from file extension
-            driver_map = {
-                ".shp": "ESRI Shapefile",
-                ".gpkg": "GPKG",
-                ".geojson": "GeoJSON",
-                ".json": "GeoJSON",
-                ".kml": "KML",
-                ".gml": "GML",
-            }
-            dst_driver = driver_map.get(extension, "GPKG")  # Default to GeoPackage
-        else:
-            dst_driver = driver
+        dst_driver = driver or driver_for_path(output_path_obj)  # Default to GeoPackage
 
-        # Read entire dataset into GeoDataFrame
-        gdf = pyogrio.read_dataframe(input_path)
-
-        # Write to output format
         # Layer name for certain formats
         layer_name = output_path_obj.stem
 
-        # Build write options
-        write_kwargs: dict[str, Any] = {
-            "driver": dst_driver,
-        }
-
-        # Add encoding for drivers that support it
-        if dst_driver in ["ESRI Shapefile", "GML"]:
-            write_kwargs["encoding"] = encoding
-
-        # Add layer name for formats that support it
-        if dst_driver in ["GPKG", "GML"]:
-            write_kwargs["layer"] = layer_name
-
-        pyogrio.write_dataframe(gdf, output_path, **write_kwargs)
-
-        # Get output metadata
-        output_info = pyogrio.read_info(str(output_path))
+        # Arrow batches go straight from source to sink without decoding WKB or
+        # attributes; drivers that cannot take Arrow fall back to a GeoDataFrame.
+        # Encoding and layer name are passed only to the drivers that support them
+        result = stream_vector(
+            input_path,
+            output_path,
+            driver=dst_driver,
+            layer=layer_name if dst_driver in ["GPKG", "GML"] else None,
+            encoding=encoding if dst_driver in ["ESRI Shapefile", "GML"] else None,
+        )
 
         return {
             "src_driver": src_driver,
             "dst_driver": dst_driver,
-            "feature_count": int(output_info.get("features", 0) or 0),
-            "geometry_type": output_info.get("geometry_type"),
+            "feature_count": result.feature_count,
+            "geometry_type": result.geometry_type,
             "encoding": encoding,
         }
 
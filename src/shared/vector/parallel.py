@@ -0,0 +1,168 @@
+"""Partitioned execution of vectorised shapely operations across threads.
+
+Shapely 2 ufuncs release the GIL while GEOS works, so splitting a geometry
+array into chunks and running the same operation on each chunk in a thread
+pool scales across cores without copying geometries between processes.
+
+Every call shares one pool sized to the available cores; a call's ``workers``
+only caps how many of its chunks run at once.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, TypeVar
+
+import numpy as np
+import shapely
+
+from src.shared.chunking import DEFAULT_CHUNK_SIZE
+
+__all__ = [
+    "DEFAULT_CHUNK_SIZE",
+    "UNION_FAN_IN",
+    "default_workers",
+    "map_partitioned",
+    "partitioned",
+    "union_partitioned",
+]
+
+# Partial unions merged together per task at each level of the cascade
+UNION_FAN_IN = 8
+
+_T = TypeVar("_T")
+
+_EXECUTOR_LOCK = threading.Lock()
+_EXECUTOR: ThreadPoolExecutor | None = None
+
+
+def default_workers() -> int:
+    """Return the worker count used when none is requested (all available cores)."""
+    return os.cpu_count() or 1
+
+
+def _executor() -> ThreadPoolExecutor:
+    # One process-wide pool so per-batch calls do not pay thread start-up
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(
+                max_workers=default_workers(), thread_name_prefix="gdal-mcp-geom"
+            )
+        return _EXECUTOR
+
+
+def _bounded_map(func: Callable[[Any], _T], items: Iterable[Any], workers: int) -> list[_T]:
+    """Run ``func`` over ``items`` on the shared pool, at most ``workers`` at a time.
+
+    Results are returned in input order.
+    """
+    executor = _executor()
+    slots = threading.BoundedSemaphore(workers)
+    futures: list[Future[_T]] = []
+    for item in items:
+        slots.acquire()
+        future = executor.submit(func, item)
+        future.add_done_callback(lambda _: slots.release())
+        futures.append(future)
+    return [future.result() for future in futures]
+
+
+def map_partitioned(
+    func: Callable[[np.ndarray], np.ndarray],
+    geoms: np.ndarray,
+    *,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> np.ndarray:
+    """Apply a vectorised geometry function to contiguous chunks in parallel.
+
+    Args:
+        func: Function mapping a geometry array to an equally long array
+        geoms: Input geometries
+        workers: Maximum chunks processed at once (all cores if None)
+        chunk_size: Maximum geometries per chunk
+
+    Returns:
+        Output geometries in input order.
+    """
+    workers = workers or default_workers()
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+    if workers == 1 or len(geoms) <= chunk_size:
+        return func(geoms)
+
+    chunks = [geoms[start : start + chunk_size] for start in range(0, len(geoms), chunk_size)]
+    results = _bounded_map(func, chunks, workers)
+    return np.concatenate(results)
+
+
+def partitioned(
+    func: Callable[[np.ndarray], np.ndarray],
+    *,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Callable[[np.ndarray], np.ndarray]:
+    """Wrap a vectorised geometry function so it runs through :func:`map_partitioned`."""
+
+    def run(geoms: np.ndarray) -> np.ndarray:
+        return map_partitioned(func, geoms, workers=workers, chunk_size=chunk_size)
+
+    return run
+
+
+def union_partitioned(
+    geoms: np.ndarray,
+    *,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> shapely.Geometry:
+    """Union many geometries with a spatially partitioned, parallel cascade.
+
+    Geometries are ordered along a serpentine grid over their envelope
+    centres so that each contiguous chunk covers a compact area. Chunks are
+    unioned in parallel, then partial results are merged ``UNION_FAN_IN`` at
+    a time, level by level, until one geometry remains. Neighbouring pieces
+    are merged early, so each level mostly joins geometries along shared
+    borders instead of re-noding the whole layer.
+
+    Args:
+        geoms: Geometries to union
+        workers: Maximum unions run at once (all cores if None)
+        chunk_size: Geometries per first-level union
+
+    Returns:
+        The union of all non-empty geometries (an empty polygon if none).
+    """
+    geoms = geoms[~(shapely.is_missing(geoms) | shapely.is_empty(geoms))]
+    if len(geoms) == 0:
+        return shapely.Polygon()
+
+    ordered = geoms[_grid_order(geoms, max(1, len(geoms) // chunk_size))]
+    workers = workers or default_workers()
+    chunks = [ordered[start : start + chunk_size] for start in range(0, len(ordered), chunk_size)]
+    pieces = _bounded_map(shapely.union_all, chunks, workers)
+    while len(pieces) > 1:
+        groups = [
+            pieces[start : start + UNION_FAN_IN] for start in range(0, len(pieces), UNION_FAN_IN)
+        ]
+        pieces = _bounded_map(shapely.union_all, groups, workers)
+    return pieces[0]
+
+
+def _grid_order(geoms: np.ndarray, n_cells: int) -> np.ndarray:
+    """Return indices sorting geometries cell by cell along a serpentine grid."""
+    bounds = shapely.bounds(geoms)
+    cx = (bounds[:, 0] + bounds[:, 2]) / 2
+    cy = (bounds[:, 1] + bounds[:, 3]) / 2
+    side = max(1, int(np.ceil(np.sqrt(n_cells))))
+    span_x = max(float(np.ptp(cx)), np.finfo(float).tiny)
+    span_y = max(float(np.ptp(cy)), np.finfo(float).tiny)
+    col = np.minimum(((cx - cx.min()) / span_x * side).astype(np.intp), side - 1)
+    row = np.minimum(((cy - cy.min()) / span_y * side).astype(np.intp), side - 1)
+    # Reverse every other row so consecutive cells stay adjacent
+    col = np.where(row % 2 == 1, side - 1 - col, col)
+    return np.lexsort((cx, col, row))
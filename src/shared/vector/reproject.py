@@ -9,6 +9,9 @@ import pyogrio
 from fastmcp import Context
 from fastmcp.exceptions import ToolError
 
+from src.shared.projection import get_transformer, transform_geometries
+from src.shared.vector.stream import driver_for_path, stream_vector
+
 
 def reproject(
     input_path: str,
@@ -54,48 +57,23 @@ def reproject(
                 "Please specify src_crs parameter (e.g., 'EPSG:4326')."
             )
 
-        # Read geometries and attributes from source
-        # pyogrio returns: (geometry, field_data)
-        gdf = pyogrio.read_dataframe(input_path)
-
-        # Set CRS if override provided
-        if src_crs and str(gdf.crs) != src_crs:
-            gdf = gdf.set_crs(src_crs, allow_override=True)
-
-        # Reproject to destination CRS
-        gdf_reprojected = gdf.to_crs(dst_crs)
-
-        # Determine output driver from extension
-        output_path_obj = Path(output_path)
-        extension = output_path_obj.suffix.lower()
-        driver_map = {
-            ".shp": "ESRI Shapefile",
-            ".gpkg": "GPKG",
-            ".geojson": "GeoJSON",
-            ".json": "GeoJSON",
-            ".kml": "KML",
-            ".gml": "GML",
-        }
-        driver = driver_map.get(extension, "GPKG")  # Default to GeoPackage
-
-        # Write reprojected data
-        pyogrio.write_dataframe(gdf_reprojected, output_path, driver=driver)
-
-        # Get output metadata
-        output_info = pyogrio.read_info(str(output_path))
-
-        # Extract bounds
-        bounds_tuple = None
-        if "total_bounds" in output_info and output_info["total_bounds"] is not None:
-            b = output_info["total_bounds"]
-            bounds_tuple = [float(b[0]), float(b[1]), float(b[2]), float(b[3])]
+        # Reproject to destination CRS batch by batch with a cached transformer
+        transformer = get_transformer(used_src_crs, dst_crs)
+        driver = driver_for_path(output_path)
+        result = stream_vector(
+            input_path,
+            output_path,
+            lambda geoms: transform_geometries(geoms, transformer),
+            driver=driver,
+            crs=dst_crs,
+        )
 
         return {
             "src_crs": used_src_crs,
             "dst_crs": dst_crs,
-            "feature_count": int(output_info.get("features", 0) or 0),
-            "geometry_type": output_info.get("geometry_type"),
-            "bounds": bounds_tuple,
+            "feature_count": result.feature_count,
+            "geometry_type": result.geometry_type,
+            "bounds": result.bounds,
             "driver": driver,
             "output_path": str(output_path),
         }
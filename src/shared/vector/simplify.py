@@ -5,10 +5,20 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pyogrio
+import shapely
 from fastmcp import Context
 from fastmcp.exceptions import ToolError
 
+from src.shared.tracing import span
+from src.shared.vector.parallel import DEFAULT_CHUNK_SIZE, partitioned
+from src.shared.vector.stream import stream_vector
+from src.shared.vector.visvalingam import simplify_vw
+
+# Polygon, MultiPolygon
+_POLYGONAL_TYPE_IDS = (3, 6)
+
 
 def simplify(
     input_path: str,
@@ -16,16 +26,20 @@ def simplify(
     tolerance: float,
     method: str = "douglas-peucker",
     preserve_topology: bool = True,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
     ctx: Context | None = None,
 ) -> dict[str, Any]:
-    """Simplify vector geometries using Douglas-Peucker or Visvalingam algorithm.
+    """Simplify vector geometries using Douglas-Peucker, Visvalingam or coverage simplification.
 
     Args:
         input_path: Path to source vector dataset
         output_path: Path for output vector file
         tolerance: Simplification tolerance in CRS units
-        method: Algorithm choice (douglas-peucker or visvalingam)
+        method: Algorithm choice (douglas-peucker, visvalingam or coverage)
         preserve_topology: Ensure valid geometries (default True)
+        workers: Threads simplifying in parallel (default: all cores)
+        chunk_size: Geometries per parallel chunk
         ctx: Optional FastMCP context for logging
 
     Returns:
@@ -40,75 +54,54 @@ def simplify(
         ToolError: If simplification fails
     """
     try:
-        # Read source data
-        gdf = pyogrio.read_dataframe(input_path)
-
         # Apply simplification based on method
         if method == "douglas-peucker":
             # Standard Douglas-Peucker algorithm
             # preserve_topology ensures no self-intersections
-            gdf_simplified = gdf.copy()
-            gdf_simplified["geometry"] = gdf.geometry.simplify(
-                tolerance, preserve_topology=preserve_topology
-            )
+            def transform(geoms: np.ndarray) -> np.ndarray:
+                return shapely.simplify(geoms, tolerance, preserve_topology=preserve_topology)
+
         elif method == "visvalingam":
-            # Visvalingam-Whyatt algorithm (area-based)
-            # Note: shapely's simplify() with preserve_topology approximates VW
-            # True VW would require additional library (e.g., simplification)
-            gdf_simplified = gdf.copy()
-
-            # Use standard simplify for both methods
-            # Visvalingam method uses same simplify but with different interpretation
-            from shapely.geometry.base import BaseGeometry
-
-            def simplify_vw(geom: BaseGeometry) -> BaseGeometry:
-                if geom.geom_type in [
-                    "Polygon",
-                    "MultiPolygon",
-                    "LineString",
-                    "MultiLineString",
-                ]:
-                    # For now, use standard simplify
-                    # True VW would require additional library
-                    return geom.simplify(tolerance, preserve_topology=preserve_topology)
-                return geom
-
-            gdf_simplified["geometry"] = gdf.geometry.apply(simplify_vw)
+            # Visvalingam-Whyatt algorithm (area-based): vertices whose effective
+            # triangle area is below tolerance² are removed; lines and polygons
+            # only, other geometries pass through
+            def transform(geoms: np.ndarray) -> np.ndarray:
+                return simplify_vw(geoms, tolerance, preserve_topology=preserve_topology)
+
+        elif method == "coverage":
+            # Shared edges must be simplified once for the whole layer, so the
+            # coverage is simplified up front and batches take their slice of it
+            with span("coverage_simplify"):
+                simplified = _simplify_coverage(input_path, tolerance)
+            offset = 0
+
+            def take_simplified(geoms: np.ndarray) -> np.ndarray:
+                nonlocal offset
+                out = simplified[offset : offset + len(geoms)]
+                offset += len(geoms)
+                return out
+
         else:
             raise ToolError(
                 f"Unknown simplification method: {method}. "
-                f"Supported methods: douglas-peucker, visvalingam"
+                f"Supported methods: douglas-peucker, visvalingam, coverage"
             )
 
-        # Determine output driver from extension
-        output_path_obj = Path(output_path)
-        extension = output_path_obj.suffix.lower()
-        driver_map = {
-            ".shp": "ESRI Shapefile",
-            ".gpkg": "GPKG",
-            ".geojson": "GeoJSON",
-            ".json": "GeoJSON",
-        }
-        driver = driver_map.get(extension, "GPKG")
-
-        # Write simplified data
-        pyogrio.write_dataframe(gdf_simplified, output_path, driver=driver)
-
-        # Get output metadata
-        output_info = pyogrio.read_info(str(output_path))
-
-        # Extract bounds
-        bounds_tuple = None
-        if "total_bounds" in output_info and output_info["total_bounds"] is not None:
-            b = output_info["total_bounds"]
-            bounds_tuple = [float(b[0]), float(b[1]), float(b[2]), float(b[3])]
+        # Simplify and write batch by batch, each batch split across worker threads
+        result = stream_vector(
+            input_path,
+            output_path,
+            take_simplified
+            if method == "coverage"
+            else partitioned(transform, workers=workers, chunk_size=chunk_size),
+        )
 
         return {
-            "feature_count": len(gdf_simplified),
+            "feature_count": result.feature_count,
             "tolerance": tolerance,
             "method": method,
             "preserve_topology": preserve_topology,
-            "bounds": bounds_tuple,
+            "bounds": result.bounds,
         }
 
     except Exception as e:
@@ -120,3 +113,33 @@ def simplify(
             ) from e
         else:
             raise ToolError(f"Vector simplification failed: {e}") from e
+
+
+def _simplify_coverage(input_path: str, tolerance: float) -> np.ndarray:
+    """Simplify all polygons of a layer as one coverage.
+
+    GEOS extracts the edges shared by neighbouring polygons, simplifies each
+    edge once (Visvalingam-Whyatt) and rebuilds the polygons from them, so
+    neighbours stay gap-free and overlap-free.
+
+    Returns:
+        Simplified geometries in layer order.
+    """
+    if not hasattr(shapely, "coverage_simplify") or shapely.geos_version < (3, 12, 0):
+        raise ToolError(
+            "Coverage simplification requires shapely >= 2.1 built with GEOS >= 3.12 "
+            f"(found shapely {shapely.__version__}, GEOS {shapely.geos_version_string}). "
+            "Use method='visvalingam' or 'douglas-peucker' instead."
+        )
+
+    geoms = pyogrio.read_dataframe(input_path, columns=[]).geometry.to_numpy()
+    present = ~(shapely.is_missing(geoms) | shapely.is_empty(geoms))
+    if not np.isin(shapely.get_type_id(geoms[present]), _POLYGONAL_TYPE_IDS).all():
+        raise ToolError(
+            "Coverage simplification requires a polygon layer (Polygon/MultiPolygon). "
+            "Use method='visvalingam' or 'douglas-peucker' for points and lines."
+        )
+
+    out = geoms.copy()
+    out[present] = shapely.coverage_simplify(geoms[present], tolerance)
+    return out
@@ -0,0 +1,520 @@
+"""Chunked vector processing built on Arrow record batches.
+
+Layers are read with ``pyogrio.raw.open_arrow`` one record batch at a time.
+Only the geometry column is decoded to shapely; attribute columns stay in
+Arrow and are handed to ``pyogrio.write_arrow`` unchanged. The writer consumes
+a lazy ``RecordBatchReader``, so each batch is transformed and appended to the
+output as it is produced and memory stays bounded by the batch size rather
+than the layer size.
+
+When no geometry transform is given (format conversion), batches go from
+reader to writer without decoding geometries or materialising attributes.
+
+Feature count, geometry type and bounds are accumulated while batches are
+written, so callers never re-open the output to describe it.
+
+The layer geometry type is declared before the first row is written. As with
+``write_dataframe``, a type mixed with its multi-part form is declared as the
+multi-part type for drivers that cannot hold both (GPKG, FlatGeobuf), and the
+single parts are promoted. Pass-through conversion takes the type from the
+source layer; a source of unknown type, or a line or polygon layer bound for
+one of those drivers (shapefiles report a single-part type for mixed layers),
+has its geometries scanned first. Transformed streams take the type from the first
+batch, declaring the multi-part type for such sources so that multi-parts in
+later batches fit and single parts are promoted.
+
+When pyarrow (or GDAL >= 3.8 for Arrow writes) is unavailable, or the output
+driver cannot take Arrow batches, the same geometry transform is applied to a
+whole-layer GeoDataFrame instead.
+"""
+
+from __future__ import annotations
+
+import itertools
+from collections.abc import Callable, Iterator
+from contextlib import ExitStack
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import geopandas
+import numpy as np
+import pyogrio
+import shapely
+
+from src.shared.tracing import span
+
+try:  # Optional dependency
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - optional
+    pa = None  # type: ignore
+
+__all__ = [
+    "DEFAULT_BATCH_SIZE",
+    "GeometryTransform",
+    "StreamResult",
+    "arrow_streaming_available",
+    "arrow_write_supported",
+    "driver_for_path",
+    "iter_geometry_batches",
+    "stream_vector",
+    "write_geometries",
+]
+
+DEFAULT_BATCH_SIZE = 65_536
+
+# Geometries in, geometries out (same length); None marks a row to drop when drop_empty=True
+GeometryTransform = Callable[[np.ndarray], np.ndarray]
+
+# Indexed by shapely.get_type_id
+_GEOMETRY_TYPE_NAMES = (
+    "Point",
+    "LineString",
+    "LinearRing",
+    "Polygon",
+    "MultiPoint",
+    "MultiLineString",
+    "MultiPolygon",
+    "GeometryCollection",
+)
+
+# Single-part types that write_dataframe promotes to their multi-part form
+_PROMOTABLE_TYPES = {
+    "Point": shapely.multipoints,
+    "LineString": shapely.multilinestrings,
+    "Polygon": shapely.multipolygons,
+}
+
+# Drivers that cannot store single- and multi-part geometries in one layer
+# (mirrors pyogrio's DRIVERS_NO_MIXED_SINGLE_MULTI)
+_NO_MIXED_SINGLE_MULTI_DRIVERS = frozenset({"GPKG", "FlatGeobuf"})
+
+# Single-part layer types that may still hold multi-part features (a shapefile
+# reports Polygon or LineString for layers of mixed single and multi parts)
+_MAYBE_MIXED_SINGLE_TYPES = frozenset({"LineString", "Polygon"})
+
+# Drivers whose layers have no geometry field for an Arrow geometry column to
+# map onto; they serialise geometry through OGR features instead
+_ARROW_GEOMETRYLESS_DRIVERS = frozenset({"CSV", "ODS", "XLSX"})
+
+_DRIVER_MAP = {
+    ".shp": "ESRI Shapefile",
+    ".gpkg": "GPKG",
+    ".geojson": "GeoJSON",
+    ".json": "GeoJSON",
+    ".kml": "KML",
+    ".gml": "GML",
+}
+
+
+@dataclass(slots=True)
+class StreamResult:
+    """Summary of a streamed vector write.
+
+    Attributes:
+        feature_count: Number of features written.
+        geometry_type: Geometry type declared for the output layer.
+        batches: Number of record batches processed (1 for the fallback path).
+        crs: CRS the output was written with.
+        source_crs: CRS of the source layer.
+        bounds: Extent of the written geometries [minx, miny, maxx, maxy], or
+            None if nothing was written or geometries were passed through
+            without decoding.
+    """
+
+    feature_count: int
+    geometry_type: str
+    batches: int
+    crs: str | None
+    source_crs: str | None
+    bounds: list[float] | None = None
+
+
+def driver_for_path(output_path: str | Path, default: str = "GPKG") -> str:
+    """Return the OGR driver implied by an output file extension."""
+    return _DRIVER_MAP.get(Path(output_path).suffix.lower(), default)
+
+
+def arrow_streaming_available() -> bool:
+    """Return True if batches can be read and written through Arrow."""
+    return pa is not None and pyogrio.__gdal_version__ >= (3, 8, 0)
+
+
+def arrow_write_supported(driver: str) -> bool:
+    """Return True if ``driver`` can take record batches from ``pyogrio.write_arrow``."""
+    return arrow_streaming_available() and driver not in _ARROW_GEOMETRYLESS_DRIVERS
+
+
+def stream_vector(
+    input_path: str,
+    output_path: str | Path,
+    transform: GeometryTransform | None = None,
+    *,
+    driver: str | None = None,
+    layer: str | None = None,
+    crs: str | None = None,
+    encoding: str | None = None,
+    drop_empty: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    read_kwargs: dict[str, Any] | None = None,
+) -> StreamResult:
+    """Read, transform and write a vector layer batch by batch.
+
+    Args:
+        input_path: Path to source vector dataset
+        output_path: Path for output vector file
+        transform: Function mapping an array of geometries to an equally long
+            array of output geometries. None copies geometries unchanged.
+        driver: Output driver (auto-detected from extension if None)
+        layer: Output layer name (driver default if None)
+        crs: CRS of the transformed geometries (source CRS if None)
+        encoding: Output encoding, for drivers that support it
+        drop_empty: Drop rows whose output geometry is None or empty
+        batch_size: Maximum features per record batch
+        read_kwargs: Extra read options such as ``bbox`` or ``where``
+
+    Returns:
+        StreamResult describing what was written.
+    """
+    driver = driver or driver_for_path(output_path)
+    read_kwargs = read_kwargs or {}
+    write_kwargs: dict[str, Any] = {"driver": driver}
+    if layer is not None:
+        write_kwargs["layer"] = layer
+    if encoding is not None:
+        write_kwargs["encoding"] = encoding
+
+    if not arrow_write_supported(driver):
+        return _write_dataframe(
+            input_path, output_path, transform, crs, drop_empty, read_kwargs, write_kwargs
+        )
+
+    with ExitStack() as stack:
+        with span("open"):
+            meta, reader = stack.enter_context(
+                pyogrio.raw.open_arrow(
+                    input_path, batch_size=batch_size, use_pyarrow=True, **read_kwargs
+                )
+            )
+        geometry_name = meta.get("geometry_name") or "wkb_geometry"
+        schema = reader.schema
+        geometry_index = schema.get_field_index(geometry_name)
+        # Drop the geoarrow extension metadata: it embeds the source CRS
+        out_schema = schema.set(geometry_index, pa.field(geometry_name, pa.binary()))
+        out_crs = crs or meta.get("crs")
+
+        source_type = meta.get("geometry_type") or "Unknown"
+        # Multi-part type that single parts are promoted to, once it is known
+        promote_type: str | None = None
+        geometry_type = source_type
+        mixed_source = source_type == "Unknown" or (
+            source_type in _MAYBE_MIXED_SINGLE_TYPES and driver in _NO_MIXED_SINGLE_MULTI_DRIVERS
+        )
+        if transform is None and mixed_source:
+            with span("scan_types"):
+                names = _scan_geometry_types(input_path, batch_size, read_kwargs)
+            geometry_type = _declared_geometry_type(names, driver, source_type)
+            if len(names) > 1 and geometry_type.startswith("Multi"):
+                promote_type = geometry_type
+
+        counters = {"features": 0, "batches": 0}
+        batch_iter = iter(reader)
+        running_bounds: list[float] | None = None
+
+        def batches() -> Iterator[pa.RecordBatch]:
+            nonlocal running_bounds
+            while True:
+                with span("read", batch=counters["batches"]):
+                    batch = next(batch_iter, None)
+                if batch is None:
+                    return
+                counters["batches"] += 1
+                with span("transform", rows=batch.num_rows):
+                    out, geoms = _transform_batch(
+                        batch, geometry_index, out_schema, transform, drop_empty, promote_type
+                    )
+                    if geoms is not None:
+                        running_bounds = _merge_bounds(running_bounds, geoms)
+                if out.num_rows:
+                    counters["features"] += out.num_rows
+                    yield out
+
+        produced = batches()
+        first = next(produced, None)
+        if first is None:
+            stream = out_schema.empty_table()
+        elif transform is None:
+            # Untouched geometries keep the source layer type; no WKB is decoded
+            # unless single parts of a mixed source are promoted
+            stream = pa.RecordBatchReader.from_batches(
+                out_schema, itertools.chain([first], produced)
+            )
+        else:
+            # Transformed types are only known from the output, so the first batch
+            # decides; a source that may hold multi-parts declares the multi-part type
+            first_geoms = shapely.from_wkb(
+                first.column(geometry_index).to_numpy(zero_copy_only=False)
+            )
+            geometry_type = _declared_geometry_type(
+                _geometry_type_names(first_geoms),
+                driver,
+                source_type,
+                promote=mixed_source or source_type.startswith("Multi"),
+            )
+            if geometry_type.startswith("Multi"):
+                promote_type = geometry_type
+                first = _replace_geometries(
+                    first,
+                    geometry_index,
+                    out_schema,
+                    _promote_to_multi(first_geoms, geometry_type),
+                )
+            stream = pa.RecordBatchReader.from_batches(
+                out_schema, itertools.chain([first], produced)
+            )
+
+        # Remaining batches are read and transformed as the writer pulls them
+        with span("write", driver=driver):
+            pyogrio.write_arrow(
+                stream,
+                str(output_path),
+                geometry_name=geometry_name,
+                geometry_type=geometry_type,
+                crs=out_crs,
+                **write_kwargs,
+            )
+
+    return StreamResult(
+        feature_count=counters["features"],
+        geometry_type=geometry_type,
+        batches=counters["batches"],
+        crs=out_crs,
+        source_crs=meta.get("crs"),
+        bounds=running_bounds,
+    )
+
+
+def iter_geometry_batches(
+    input_path: str,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    read_kwargs: dict[str, Any] | None = None,
+) -> Iterator[np.ndarray]:
+    """Yield the geometries of a layer as arrays of at most ``batch_size`` items.
+
+    Attribute columns are not read. Without Arrow support the whole layer is
+    yielded as a single array.
+    """
+    read_kwargs = read_kwargs or {}
+    if not arrow_streaming_available():
+        yield pyogrio.read_dataframe(input_path, columns=[], **read_kwargs).geometry.to_numpy()
+        return
+
+    with pyogrio.raw.open_arrow(
+        input_path, columns=[], batch_size=batch_size, use_pyarrow=True, **read_kwargs
+    ) as (meta, reader):
+        geometry_name = meta.get("geometry_name") or "wkb_geometry"
+        for batch in reader:
+            wkb = batch.column(batch.schema.get_field_index(geometry_name))
+            yield shapely.from_wkb(wkb.to_numpy(zero_copy_only=False))
+
+
+def write_geometries(
+    geoms: np.ndarray,
+    output_path: str | Path,
+    *,
+    crs: str | None = None,
+    driver: str | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> StreamResult:
+    """Write an array of geometries (no attributes) in record batches.
+
+    Args:
+        geoms: Geometries to write, one feature each
+        output_path: Path for output vector file
+        crs: CRS of the geometries
+        driver: Output driver (auto-detected from extension if None)
+        batch_size: Maximum features per record batch
+
+    Returns:
+        StreamResult describing what was written.
+    """
+    driver = driver or driver_for_path(output_path)
+    geometry_type = _declared_geometry_type(_geometry_type_names(geoms), driver, "Unknown")
+    geoms = _promote_to_multi(geoms, geometry_type)
+
+    if not arrow_write_supported(driver):
+        gdf = geopandas.GeoDataFrame(geometry=geoms, crs=crs)
+        pyogrio.write_dataframe(gdf, str(output_path), driver=driver)
+        return StreamResult(len(geoms), geometry_type, 1, crs, crs, _merge_bounds(None, geoms))
+
+    schema = pa.schema([pa.field("geometry", pa.binary())])
+
+    def batches() -> Iterator[pa.RecordBatch]:
+        for start in range(0, len(geoms), batch_size):
+            wkb = shapely.to_wkb(geoms[start : start + batch_size])
+            yield pa.record_batch([pa.array(wkb, type=pa.binary())], schema=schema)
+
+    pyogrio.write_arrow(
+        pa.RecordBatchReader.from_batches(schema, batches()),
+        str(output_path),
+        driver=driver,
+        geometry_name="geometry",
+        geometry_type=geometry_type,
+        crs=crs,
+    )
+    return StreamResult(
+        feature_count=len(geoms),
+        geometry_type=geometry_type,
+        batches=-(-len(geoms) // batch_size),
+        crs=crs,
+        source_crs=crs,
+        bounds=_merge_bounds(None, geoms),
+    )
+
+
+def _transform_batch(
+    batch: Any,
+    geometry_index: int,
+    out_schema: Any,
+    transform: GeometryTransform | None,
+    drop_empty: bool,
+    promote_type: str | None = None,
+) -> tuple[Any, np.ndarray | None]:
+    """Apply the geometry transform to one record batch, leaving attributes in Arrow.
+
+    Returns:
+        The output batch and its geometries (None when passed through undecoded).
+    """
+    if transform is None and promote_type is None:
+        # Zero-copy: reuse the source buffers under the output schema
+        return pa.RecordBatch.from_arrays(batch.columns, schema=out_schema), None
+
+    geoms = shapely.from_wkb(batch.column(geometry_index).to_numpy(zero_copy_only=False))
+    if transform is not None:
+        geoms = transform(geoms)
+    if promote_type is not None:
+        geoms = _promote_to_multi(geoms, promote_type)
+    out = _replace_geometries(batch, geometry_index, out_schema, geoms)
+    if drop_empty:
+        keep = ~(shapely.is_missing(geoms) | shapely.is_empty(geoms))
+        if not keep.all():
+            out = out.filter(pa.array(keep))
+    return out, geoms
+
+
+def _replace_geometries(batch: Any, geometry_index: int, out_schema: Any, geoms: np.ndarray) -> Any:
+    """Return ``batch`` under the output schema with its geometry column replaced."""
+    columns = list(batch.columns)
+    columns[geometry_index] = pa.array(shapely.to_wkb(geoms), type=pa.binary())
+    return pa.RecordBatch.from_arrays(columns, schema=out_schema)
+
+
+def _merge_bounds(bounds: list[float] | None, geoms: np.ndarray) -> list[float] | None:
+    """Extend running bounds by the extent of ``geoms`` (missing and empty ignored)."""
+    if not len(geoms):
+        return bounds
+    batch_bounds = shapely.total_bounds(geoms)
+    if np.isnan(batch_bounds).any():
+        return bounds
+    if bounds is None:
+        return [float(v) for v in batch_bounds]
+    return [
+        min(bounds[0], float(batch_bounds[0])),
+        min(bounds[1], float(batch_bounds[1])),
+        max(bounds[2], float(batch_bounds[2])),
+        max(bounds[3], float(batch_bounds[3])),
+    ]
+
+
+def _geometry_type_names(geoms: np.ndarray) -> set[str]:
+    """Return the geometry type names present in ``geoms`` (missing ignored)."""
+    type_ids = np.unique(shapely.get_type_id(geoms[~shapely.is_missing(geoms)]))
+    return {_GEOMETRY_TYPE_NAMES[i] for i in type_ids}
+
+
+def _scan_geometry_types(input_path: str, batch_size: int, read_kwargs: dict[str, Any]) -> set[str]:
+    """Read only the geometry column to find every geometry type in a layer."""
+    names: set[str] = set()
+    for geoms in iter_geometry_batches(input_path, batch_size=batch_size, read_kwargs=read_kwargs):
+        names |= _geometry_type_names(geoms)
+    return names
+
+
+def _declared_geometry_type(
+    names: set[str], driver: str, default: str, *, promote: bool = False
+) -> str:
+    """Choose the layer geometry type for a set of geometry type names.
+
+    Follows ``write_dataframe``: a single type is declared as such, and a type
+    mixed with its multi-part form is declared as the multi-part type for
+    drivers that cannot store both (``Unknown`` elsewhere). Anything more varied
+    is ``Unknown``. ``promote`` declares the multi-part type for a single
+    promotable type too, when later rows may hold multi-parts.
+    """
+    if not names:
+        return default
+    bases = {name.replace("Multi", "") for name in names}
+    if len(bases) > 1:
+        return "Unknown"
+    (base,) = bases
+    if (
+        base in _PROMOTABLE_TYPES
+        and driver in _NO_MIXED_SINGLE_MULTI_DRIVERS
+        and (promote or len(names) > 1)
+    ):
+        return f"Multi{base}"
+    if len(names) > 1:
+        return "Unknown"
+    (name,) = names
+    return name
+
+
+def _promote_to_multi(geoms: np.ndarray, geometry_type: str) -> np.ndarray:
+    """Wrap single-part geometries in the declared multi-part type."""
+    base = geometry_type.removeprefix("Multi")
+    if base == geometry_type or base not in _PROMOTABLE_TYPES:
+        return geoms
+    single = shapely.get_type_id(geoms) == _GEOMETRY_TYPE_NAMES.index(base)
+    if not single.any():
+        return geoms
+    promoted = geoms.copy()
+    promoted[single] = _PROMOTABLE_TYPES[base](
+        geoms[single], indices=np.arange(np.count_nonzero(single))
+    )
+    return promoted
+
+
+def _write_dataframe(
+    input_path: str,
+    output_path: str | Path,
+    transform: GeometryTransform | None,
+    crs: str | None,
+    drop_empty: bool,
+    read_kwargs: dict[str, Any],
+    write_kwargs: dict[str, Any],
+) -> StreamResult:
+    """Whole-layer fallback for environments or drivers without Arrow writes."""
+    gdf = pyogrio.read_dataframe(input_path, use_arrow=pa is not None, **read_kwargs)
+    source_crs = str(gdf.crs) if gdf.crs else None
+    if transform is not None:
+        geoms = transform(gdf.geometry.to_numpy())
+        gdf = gdf.copy()
+        gdf["geometry"] = geopandas.GeoSeries(geoms, index=gdf.index, crs=crs or gdf.crs)
+        if drop_empty:
+            gdf = gdf[~(shapely.is_missing(geoms) | shapely.is_empty(geoms))]
+    elif crs is not None:
+        gdf = gdf.set_crs(crs, allow_override=True)
+
+    pyogrio.write_dataframe(gdf, str(output_path), **write_kwargs)
+    geoms = gdf.geometry.to_numpy()
+    return StreamResult(
+        feature_count=len(gdf),
+        geometry_type=_declared_geometry_type(
+            _geometry_type_names(geoms), write_kwargs["driver"], "Unknown"
+        ),
+        batches=1,
+        crs=crs or source_crs,
+        source_crs=source_crs,
+        bounds=_merge_bounds(None, geoms),
+    )
@@ -0,0 +1,375 @@
+"""Visvalingam-Whyatt simplification over flat coordinate arrays.
+
+Every line and polygon ring in the input is flattened into one coordinate
+array with per-ring offsets (``shapely.get_coordinates`` with ring indices),
+and triangle ("effective") areas are computed for all vertices at once.
+Elimination then repeatedly removes the smallest-area vertex of each ring and
+updates only its two neighbours:
+
+- short rings and lines are padded into 2-D arrays and advance in lockstep,
+  one vertex per sequence per numpy step;
+- long sequences share a single heap of effective areas, into which only
+  vertices below the threshold are ever pushed.
+
+Rings and lines are rebuilt in bulk with ``shapely.linearrings`` and
+``shapely.linestrings`` and regrouped into their original geometries.
+
+This is not as fast as shapely's compiled Douglas-Peucker. At a similar
+output size it measured about 5-20x slower on layers of many short rings and
+12-230x slower on single rings of hundreds of thousands of vertices, whose
+heap loop runs in Python. Removing a vertex can change effective areas along
+arbitrarily long chains of neighbours, so the heap cannot be split into exact
+numpy steps. The ``vector_simplify[...,visvalingam]`` benchmark cases, including
+one long ring per preset, track the gap.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+
+import numpy as np
+import shapely
+
+__all__ = ["simplify_vw", "LOCKSTEP_MAX_COORDS", "MAX_TOPOLOGY_RETRIES"]
+
+# Times a feature that became invalid is retried with half the tolerance
+MAX_TOPOLOGY_RETRIES = 4
+
+# shapely.get_type_id values
+_LINESTRING = 1
+_POLYGON = 3
+_MULTILINESTRING = 5
+_MULTIPOLYGON = 6
+_SIMPLIFIABLE = (_LINESTRING, _POLYGON, _MULTILINESTRING, _MULTIPOLYGON)
+
+# Sequences longer than this use the heap instead of lockstep elimination,
+# whose per-step cost grows with the padded sequence length
+LOCKSTEP_MAX_COORDS = 1024
+
+# Fewest coordinates that keep a line (2) or a closed ring (4) constructible
+_MIN_LINE_COORDS = 2
+_MIN_RING_COORDS = 4
+
+
+def simplify_vw(
+    geoms: np.ndarray,
+    tolerance: float,
+    preserve_topology: bool = True,
+) -> np.ndarray:
+    """Simplify geometries with the Visvalingam-Whyatt algorithm.
+
+    Args:
+        geoms: Array of shapely geometries
+        tolerance: Distance tolerance in CRS units; vertices whose effective
+            area is below ``tolerance ** 2`` are removed
+        preserve_topology: Retry features that become invalid with a smaller
+            tolerance, keeping the original geometry as a last resort
+
+    Returns:
+        Array of simplified geometries (points and collections unchanged).
+    """
+    geoms = np.asarray(geoms, dtype=object)
+    out = geoms.copy()
+    type_ids = shapely.get_type_id(geoms)
+    has_z = shapely.has_z(geoms)
+    selected = np.isin(type_ids, _SIMPLIFIABLE) & ~shapely.is_empty(geoms)
+
+    for include_z in (False, True):
+        subset = np.flatnonzero(selected & (has_z == include_z))
+        if subset.size:
+            out[subset] = _simplify_subset(geoms[subset], tolerance**2, include_z)
+
+    if preserve_topology:
+        _repair_invalid(geoms, out, selected, tolerance)
+    return out
+
+
+def _repair_invalid(
+    geoms: np.ndarray, out: np.ndarray, selected: np.ndarray, tolerance: float
+) -> None:
+    # Only features that were valid before simplification are expected to stay valid
+    broken = np.flatnonzero(selected & shapely.is_valid(geoms) & ~shapely.is_valid(out))
+    for attempt in range(1, MAX_TOPOLOGY_RETRIES + 1):
+        if broken.size == 0:
+            return
+        retry = simplify_vw(geoms[broken], tolerance / 2**attempt, preserve_topology=False)
+        out[broken] = retry
+        broken = broken[~shapely.is_valid(retry)]
+    out[broken] = geoms[broken]
+
+
+def _simplify_subset(geoms: np.ndarray, threshold: float, include_z: bool) -> np.ndarray:
+    """Simplify geometries of one dimensionality through a single flat coordinate array."""
+    # Explode to single parts, then to rings (polygons) or lines
+    parts, part_owner = shapely.get_parts(geoms, return_index=True)
+    is_polygon = shapely.get_type_id(parts) == _POLYGON
+    non_empty = ~shapely.is_empty(parts)
+
+    # Empty parts of multi-part geometries are carried through untouched
+    polygon_parts = np.flatnonzero(is_polygon & non_empty)
+    rings, ring_owner = shapely.get_rings(parts[polygon_parts], return_index=True)
+    line_parts = np.flatnonzero(~is_polygon & non_empty)
+
+    # One coordinate sequence per ring or line, rings first
+    sequences = np.concatenate([rings, parts[line_parts]])
+    min_coords = np.concatenate(
+        [
+            np.full(len(rings), _MIN_RING_COORDS),
+            np.full(len(line_parts), _MIN_LINE_COORDS),
+        ]
+    )
+
+    coords, sequence_idx = shapely.get_coordinates(
+        sequences, include_z=include_z, return_index=True
+    )
+    keep = _eliminate(coords[:, :2], sequence_idx, len(sequences), min_coords, threshold)
+
+    # Rebuild rings and lines, then polygons, then the original geometries
+    kept_coords, kept_idx = coords[keep], sequence_idx[keep]
+    n_rings = len(rings)
+    ring_mask = kept_idx < n_rings
+    new_parts = parts.copy()
+    if n_rings:
+        new_rings = shapely.linearrings(kept_coords[ring_mask], indices=kept_idx[ring_mask])
+        new_parts[polygon_parts] = shapely.polygons(new_rings, indices=ring_owner)
+    if line_parts.size:
+        new_lines = shapely.linestrings(
+            kept_coords[~ring_mask], indices=kept_idx[~ring_mask] - n_rings
+        )
+        new_parts[line_parts] = new_lines
+
+    return _regroup(geoms, new_parts, part_owner)
+
+
+def _regroup(geoms: np.ndarray, parts: np.ndarray, part_owner: np.ndarray) -> np.ndarray:
+    """Reassemble simplified parts into geometries of the original types."""
+    out = np.empty(len(geoms), dtype=object)
+    type_ids = shapely.get_type_id(geoms)
+    single = np.isin(type_ids, (_LINESTRING, _POLYGON))
+
+    # Single-part geometries map one-to-one onto their only part
+    single_rows = np.flatnonzero(single[part_owner])
+    out[part_owner[single_rows]] = parts[single_rows]
+
+    for type_id, build in (
+        (_MULTILINESTRING, shapely.multilinestrings),
+        (_MULTIPOLYGON, shapely.multipolygons),
+    ):
+        rows = np.flatnonzero(type_ids[part_owner] == type_id)
+        if rows.size:
+            owners, dense = np.unique(part_owner[rows], return_inverse=True)
+            out[owners] = build(parts[rows], indices=dense)
+    return out
+
+
+def _triangle_areas(
+    xy: np.ndarray, prev: np.ndarray, curr: np.ndarray, nxt: np.ndarray
+) -> np.ndarray:
+    a, b, c = xy[prev], xy[curr], xy[nxt]
+    return 0.5 * np.abs(
+        (b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1]) - (c[:, 0] - a[:, 0]) * (b[:, 1] - a[:, 1])
+    )
+
+
+def _eliminate(
+    xy: np.ndarray,
+    sequence_idx: np.ndarray,
+    n_sequences: int,
+    min_coords: np.ndarray,
+    threshold: float,
+) -> np.ndarray:
+    """Return a keep-mask over ``xy`` after Visvalingam-Whyatt elimination.
+
+    Each sequence (ring or line) keeps its first and last coordinate and at
+    least ``min_coords`` coordinates. Effective areas never decrease below
+    the area of a vertex already removed, as in the original algorithm.
+
+    Sequences are independent, so short ones are eliminated in lockstep and
+    long ones through a heap; both remove the smallest area first, breaking
+    ties by position, and so give identical results.
+    """
+    keep = np.ones(len(xy), dtype=bool)
+    if len(xy) == 0:
+        return keep
+
+    counts = np.bincount(sequence_idx, minlength=n_sequences)
+    starts = np.r_[0, np.cumsum(counts)[:-1]]
+    is_long = counts > LOCKSTEP_MAX_COORDS
+
+    # Bucket short sequences by padded length to bound wasted columns
+    # (sequences of two coordinates have no removable vertex)
+    width = np.maximum(8, 2 ** np.ceil(np.log2(np.maximum(counts, 1)))).astype(np.intp)
+    short = ~is_long & (counts > _MIN_LINE_COORDS)
+    for bucket_width in np.unique(width[short]):
+        rows = np.flatnonzero(short & (width == bucket_width))
+        flat, valid = _padded_index(starts[rows], counts[rows], int(bucket_width))
+        keep[flat[valid]] = _eliminate_lockstep(
+            xy, flat, valid, counts[rows], min_coords[rows], threshold
+        )[valid]
+
+    long_rows = np.flatnonzero(is_long)
+    if long_rows.size:
+        subset = np.flatnonzero(is_long[sequence_idx])
+        dense = np.searchsorted(long_rows, sequence_idx[subset])
+        keep[subset] = _eliminate_heap(
+            xy[subset], dense, long_rows.size, min_coords[long_rows], threshold
+        )
+    return keep
+
+
+def _padded_index(
+    starts: np.ndarray, counts: np.ndarray, width: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return (rows x width) flat coordinate indices and the mask of real entries."""
+    columns = np.arange(width)
+    valid = columns[None, :] < counts[:, None]
+    flat = np.where(valid, starts[:, None] + columns[None, :], 0)
+    return flat, valid
+
+
+def _eliminate_lockstep(
+    xy: np.ndarray,
+    flat: np.ndarray,
+    valid: np.ndarray,
+    counts: np.ndarray,
+    min_coords: np.ndarray,
+    threshold: float,
+) -> np.ndarray:
+    """Eliminate vertices of many short sequences at once, one vertex per sequence per step.
+
+    Each step removes, in every still-active sequence, the vertex with the
+    smallest effective area (first by position on ties), exactly the vertex a
+    per-sequence heap would pop next.
+    """
+    n_rows, width = flat.shape
+    x = np.where(valid, xy[flat, 0], np.nan)
+    y = np.where(valid, xy[flat, 1], np.nan)
+    columns = np.broadcast_to(np.arange(width), (n_rows, width))
+    prev = np.where(columns > 0, columns - 1, -1)
+    nxt = np.where(columns < counts[:, None] - 1, columns + 1, -1)
+
+    area = np.full((n_rows, width), np.inf)
+    interior = (prev >= 0) & (nxt >= 0)
+    r, c = np.nonzero(interior)
+    area[r, c] = _row_triangle_areas(x, y, r, prev[r, c], c, nxt[r, c])
+
+    keep = valid.copy()
+    remaining = counts.copy()
+    active = np.arange(n_rows)
+    while active.size:
+        col = np.argmin(area[active], axis=1)
+        removed_area = area[active, col]
+        ok = (removed_area < threshold) & (remaining[active] > min_coords[active])
+        # A sequence that cannot remove its smallest vertex is finished for good
+        active, col, removed_area = active[ok], col[ok], removed_area[ok]
+        if not active.size:
+            break
+
+        keep[active, col] = False
+        area[active, col] = np.inf
+        remaining[active] -= 1
+        p = prev[active, col]
+        q = nxt[active, col]
+        nxt[active, p] = q
+        prev[active, q] = p
+
+        for vertex in (p, q):
+            before = prev[active, vertex]
+            after = nxt[active, vertex]
+            inner = (before >= 0) & (after >= 0)
+            rows = active[inner]
+            new_area = _row_triangle_areas(x, y, rows, before[inner], vertex[inner], after[inner])
+            area[rows, vertex[inner]] = np.maximum(new_area, removed_area[inner])
+    return keep
+
+
+def _row_triangle_areas(
+    x: np.ndarray,
+    y: np.ndarray,
+    rows: np.ndarray,
+    prev: np.ndarray,
+    curr: np.ndarray,
+    nxt: np.ndarray,
+) -> np.ndarray:
+    ax, ay = x[rows, prev], y[rows, prev]
+    return 0.5 * np.abs(
+        (x[rows, curr] - ax) * (y[rows, nxt] - ay) - (x[rows, nxt] - ax) * (y[rows, curr] - ay)
+    )
+
+
+def _eliminate_heap(
+    xy: np.ndarray,
+    sequence_idx: np.ndarray,
+    n_sequences: int,
+    min_coords: np.ndarray,
+    threshold: float,
+) -> np.ndarray:
+    """Eliminate vertices of (long) sequences with one heap of effective areas."""
+    n = len(xy)
+    keep = np.ones(n, dtype=bool)
+    if n == 0:
+        return keep
+
+    counts = np.bincount(sequence_idx, minlength=n_sequences)
+    index = np.arange(n)
+    prev = index - 1
+    nxt = index + 1
+    starts = np.flatnonzero(np.r_[True, sequence_idx[1:] != sequence_idx[:-1]])
+    ends = np.r_[starts[1:], n] - 1
+    prev[starts] = -1
+    nxt[ends] = -1
+
+    interior = (prev >= 0) & (nxt >= 0)
+    area = np.full(n, np.inf)
+    inner = np.flatnonzero(interior)
+    area[inner] = _triangle_areas(xy, prev[inner], inner, nxt[inner])
+
+    candidates = inner[area[inner] < threshold]
+    if candidates.size == 0:
+        return keep
+
+    heap = list(zip(area[candidates].tolist(), candidates.tolist(), strict=True))
+    heapq.heapify(heap)
+    remaining = counts.tolist()
+    minimum = min_coords.tolist()
+    owner = sequence_idx.tolist()
+    prev_l, next_l, area_l = prev.tolist(), nxt.tolist(), area.tolist()
+    x, y = xy[:, 0].tolist(), xy[:, 1].tolist()
+    removed: list[int] = []
+    pop, push, inf = heapq.heappop, heapq.heappush, math.inf
+
+    while heap:
+        removed_area, i = pop(heap)
+        if removed_area != area_l[i]:
+            continue  # stale entry, or vertex already removed
+        seq = owner[i]
+        if remaining[seq] <= minimum[seq]:
+            continue
+
+        removed.append(i)
+        area_l[i] = inf
+        remaining[seq] -= 1
+        p = prev_l[i]
+        q = next_l[i]
+        next_l[p] = q
+        prev_l[q] = p
+
+        # Recompute both neighbours; endpoints (no prev/next) are never removed
+        pp = prev_l[p]
+        if pp >= 0:
+            a = 0.5 * abs((x[p] - x[pp]) * (y[q] - y[pp]) - (x[q] - x[pp]) * (y[p] - y[pp]))
+            a = max(a, removed_area)
+            area_l[p] = a
+            if a < threshold:
+                push(heap, (a, p))
+        qq = next_l[q]
+        if qq >= 0:
+            a = 0.5 * abs((x[q] - x[p]) * (y[qq] - y[p]) - (x[qq] - x[p]) * (y[q] - y[p]))
+            a = max(a, removed_area)
+            area_l[q] = a
+            if a < threshold:
+                push(heap, (a, q))
+
+    keep[removed] = False
+    return keep
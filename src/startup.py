@@ -0,0 +1,393 @@
+"""Server startup: import-time profiling and optional warm start.
+
+Tool and resource modules only import FastMCP, pydantic models and the
+standard library; GDAL bindings and the array/geometry stack are imported
+inside the functions that use them, which keeps stdio start-up fast.
+:func:`profile_startup` (``gdal --profile-startup``) runs a fresh interpreter
+with ``-X importtime`` so the numbers match a cold ``uvx`` start.
+
+Long-running HTTP deployments want the opposite: :func:`start_warmup`
+(``gdal --warm`` or GDAL_MCP_WARM=1) loads the heavy libraries, registers
+GDAL/OGR drivers, initialises PROJ, builds the catalog extension tables and
+scans the workspaces in a background thread while the server accepts
+connections. :func:`health` reports progress for the health resource.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import subprocess
+import sys
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+__all__ = [
+    "HEAVY_MODULES",
+    "ImportRecord",
+    "StartupProfile",
+    "Warmup",
+    "format_profile",
+    "get_warmup",
+    "health",
+    "profile_startup",
+    "start_warmup",
+]
+
+logger = logging.getLogger(__name__)
+
+# Libraries that must not load before the first tool call
+HEAVY_MODULES = (
+    "rasterio",
+    "pyogrio",
+    "fiona",
+    "geopandas",
+    "shapely",
+    "numpy",
+    "pyproj",
+    "pandas",
+    "pyarrow",
+)
+
+# Fields in an importtime line: self time, cumulative time, module name
+_IMPORTTIME_FIELDS = 3
+
+# Implementation packages imported on the first raster/vector call
+DEFERRED_MODULES = ("src.shared.raster", "src.shared.vector", "src.shared.projection")
+
+_CHILD = """
+import asyncio, json, sys, time
+started = time.perf_counter()
+from src.server import mcp
+server_seconds = time.perf_counter() - started
+loaded = [name for name in {heavy!r} if name in sys.modules]
+tools = asyncio.run(mcp.get_tools())
+resources = asyncio.run(mcp.get_resources())
+templates = asyncio.run(mcp.get_resource_templates())
+started = time.perf_counter()
+for name in {deferred!r}:
+    __import__(name)
+deferred_seconds = time.perf_counter() - started
+print(json.dumps({{
+    "server_seconds": server_seconds,
+    "deferred_seconds": deferred_seconds,
+    "heavy_loaded": loaded,
+    "tools": len(tools),
+    "resources": len(resources) + len(templates),
+}}))
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class ImportRecord:
+    """One line of ``-X importtime`` output (times in seconds)."""
+
+    module: str
+    self_seconds: float
+    cumulative_seconds: float
+    depth: int
+
+
+@dataclass(slots=True)
+class StartupProfile:
+    """Result of :func:`profile_startup`.
+
+    Attributes:
+        server_seconds: Wall time to import ``src.server`` (registers every tool).
+        deferred_seconds: Wall time of the implementation imports paid on first call.
+        heavy_loaded: Heavy libraries imported during startup (should be empty).
+        tools: Registered tools.
+        resources: Registered resources and resource templates.
+        imports: Every import made during startup, in completion order.
+    """
+
+    server_seconds: float
+    deferred_seconds: float
+    heavy_loaded: list[str]
+    tools: int
+    resources: int
+    imports: list[ImportRecord] = field(default_factory=list)
+
+    def slowest(self, limit: int = 15) -> list[ImportRecord]:
+        """Return the imports with the largest cumulative time, one line per module."""
+        # importtime repeats a package when a submodule import re-enters it
+        largest: dict[str, ImportRecord] = {}
+        for record in self.imports:
+            seen = largest.get(record.module)
+            if seen is None or record.cumulative_seconds > seen.cumulative_seconds:
+                largest[record.module] = record
+        return sorted(largest.values(), key=lambda r: r.cumulative_seconds, reverse=True)[:limit]
+
+    def by_package(self, limit: int = 10) -> list[tuple[str, float]]:
+        """Return self time summed per top-level package, largest first."""
+        totals: dict[str, float] = defaultdict(float)
+        for record in self.imports:
+            totals[record.module.split(".", 1)[0]] += record.self_seconds
+        return sorted(totals.items(), key=lambda item: item[1], reverse=True)[:limit]
+
+
+def parse_importtime(stderr: str) -> list[ImportRecord]:
+    """Parse ``-X importtime`` lines ("import time: self | cumulative | name")."""
+    records = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        # Skip the header row
+        if len(parts) != _IMPORTTIME_FIELDS or not parts[0].strip().isdigit():
+            continue
+        name = parts[2].rstrip()
+        module = name.lstrip()
+        records.append(
+            ImportRecord(
+                module=module,
+                self_seconds=int(parts[0]) / 1e6,
+                cumulative_seconds=int(parts[1]) / 1e6,
+                depth=(len(name) - len(module) - 1) // 2,
+            )
+        )
+    return records
+
+
+def profile_startup() -> StartupProfile:
+    """Import the server in a fresh interpreter and profile every import.
+
+    Raises:
+        RuntimeError: If the server fails to import.
+    """
+    code = _CHILD.format(heavy=HEAVY_MODULES, deferred=DEFERRED_MODULES)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError("Server import failed:\n" + proc.stderr[-2000:])
+
+    summary = json.loads(proc.stdout.strip().splitlines()[-1])
+    # Only count imports made before the deferred implementation imports
+    imports = parse_importtime(proc.stderr)
+    server_end = next(
+        (i for i, r in enumerate(imports) if r.module == "src.server" and r.depth == 0),
+        len(imports) - 1,
+    )
+    return StartupProfile(imports=imports[: server_end + 1], **summary)
+
+
+def format_profile(profile: StartupProfile, limit: int = 15) -> str:
+    """Render a profile as plain text for the terminal."""
+    deferred = [name for name in HEAVY_MODULES if name not in profile.heavy_loaded]
+    lines = [
+        f"Server import: {profile.server_seconds:.3f}s "
+        f"({profile.tools} tools, {profile.resources} resources registered)",
+        f"Deferred to first call: {profile.deferred_seconds:.3f}s "
+        f"({', '.join(deferred) or 'nothing'})",
+        f"Heavy libraries loaded at startup: {', '.join(profile.heavy_loaded) or 'none'}",
+        "",
+        "Slowest imports (cumulative):",
+    ]
+    lines += [f"  {r.cumulative_seconds:7.3f}s  {r.module}" for r in profile.slowest(limit)]
+    lines += ["", "Self time by top-level package:"]
+    lines += [f"  {seconds:7.3f}s  {package}" for package, seconds in profile.by_package()]
+    return "\n".join(lines)
+
+
+# ---------------------------------------------------------------------------
+# Warm start
+# ---------------------------------------------------------------------------
+
+StageStatus = Literal["pending", "running", "done", "failed"]
+
+_STARTED_AT = time.monotonic()
+
+
+def _warm_implementations() -> dict[str, Any]:
+    for name in DEFERRED_MODULES:
+        __import__(name)
+    return {"modules": list(DEFERRED_MODULES)}
+
+
+def _warm_drivers() -> dict[str, Any]:
+    import pyogrio
+
+    from src.shared.gdal_env import gdal_env
+
+    # Entering an environment registers every GDAL/OGR driver
+    with gdal_env() as env:
+        raster_drivers = len(env.drivers())
+    return {"gdal_drivers": raster_drivers, "ogr_drivers": len(pyogrio.list_drivers())}
+
+
+def _warm_proj() -> dict[str, Any]:
+    from rasterio.warp import transform_bounds
+
+    from src.shared.projection import get_raster_crs, get_transformer
+
+    # Opens the PROJ database for both pyproj and GDAL's own PROJ context
+    get_transformer("EPSG:4326", "EPSG:3857").transform(0.0, 0.0)
+    transform_bounds(get_raster_crs("EPSG:4326"), get_raster_crs("EPSG:3857"), 0, 0, 1, 1)
+    return {}
+
+
+def _warm_extensions() -> dict[str, Any]:
+    from src.shared.catalog.scanner import (
+        RASTER_EXTENSIONS,
+        VECTOR_EXTENSIONS,
+        ensure_dynamic_extensions,
+    )
+
+    ensure_dynamic_extensions()
+    return {
+        "raster_extensions": len(RASTER_EXTENSIONS),
+        "vector_extensions": len(VECTOR_EXTENSIONS),
+    }
+
+
+def _warm_catalog() -> dict[str, Any]:
+    from src.shared.catalog import scan
+
+    return {"entries": len(scan(kind="all"))}
+
+
+# Later stages reuse what earlier ones loaded
+WARMUP_STAGES: tuple[tuple[str, Callable[[], dict[str, Any]]], ...] = (
+    ("implementations", _warm_implementations),
+    ("drivers", _warm_drivers),
+    ("proj", _warm_proj),
+    ("extensions", _warm_extensions),
+    ("catalog", _warm_catalog),
+)
+
+
+@dataclass(slots=True)
+class WarmupStage:
+    """Progress of one warm-up stage."""
+
+    name: str
+    status: StageStatus = "pending"
+    seconds: float = 0.0
+    detail: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+
+class Warmup:
+    """Run the warm-up stages once, in order, on a daemon thread.
+
+    A failed stage is recorded and the remaining stages still run: the server
+    stays usable, the affected work is simply paid for on first call.
+    """
+
+    def __init__(
+        self, stages: tuple[tuple[str, Callable[[], dict[str, Any]]], ...] = WARMUP_STAGES
+    ) -> None:
+        self._stages = stages
+        self.stages = [WarmupStage(name) for name, _ in stages]
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+        self._done = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> Warmup:
+        """Start the background thread (no-op if already started)."""
+        if self._thread is None:
+            self.started_at = time.monotonic()
+            self._thread = threading.Thread(target=self._run, name="gdal-mcp-warmup", daemon=True)
+            self._thread.start()
+        return self
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until every stage has finished; return False on timeout."""
+        return self._done.wait(timeout)
+
+    @property
+    def ready(self) -> bool:
+        """Whether every stage has finished (successfully or not)."""
+        return self._done.is_set()
+
+    def _run(self) -> None:
+        try:
+            for stage, (_, warm) in zip(self.stages, self._stages, strict=True):
+                stage.status = "running"
+                started = time.perf_counter()
+                try:
+                    stage.detail = warm() or {}
+                    stage.status = "done"
+                except Exception as e:
+                    stage.status = "failed"
+                    stage.error = f"{type(e).__name__}: {e}"
+                    logger.warning("Warm-up stage '%s' failed: %s", stage.name, stage.error)
+                stage.seconds = time.perf_counter() - started
+            logger.info(
+                "Warm-up finished in %.2fs (%s)",
+                sum(stage.seconds for stage in self.stages),
+                ", ".join(f"{stage.name}={stage.seconds:.2f}s" for stage in self.stages),
+            )
+        finally:
+            self.finished_at = time.monotonic()
+            self._done.set()
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return stage progress as a dictionary."""
+        return {
+            "ready": self.ready,
+            "seconds": round((self.finished_at or time.monotonic()) - (self.started_at or 0), 6)
+            if self.started_at
+            else 0.0,
+            "stages": {
+                stage.name: {
+                    "status": stage.status,
+                    "seconds": round(stage.seconds, 6),
+                    **({"detail": stage.detail} if stage.detail else {}),
+                    **({"error": stage.error} if stage.error else {}),
+                }
+                for stage in self.stages
+            },
+        }
+
+
+_WARMUP: Warmup | None = None
+_WARMUP_LOCK = threading.Lock()
+
+
+def start_warmup() -> Warmup:
+    """Start the process-wide warm-up (once) and return it."""
+    global _WARMUP
+    with _WARMUP_LOCK:
+        if _WARMUP is None:
+            _WARMUP = Warmup().start()
+        return _WARMUP
+
+
+def get_warmup() -> Warmup | None:
+    """Return the process-wide warm-up, if one was started."""
+    return _WARMUP
+
+
+def health() -> dict[str, Any]:
+    """Report readiness.
+
+    Status is "warming" while a warm start is in progress, "degraded" if a
+    warm-up stage failed, and "ready" otherwise. Without ``--warm`` the
+    server is ready immediately and libraries load on the first call.
+    """
+    warmup = get_warmup()
+    if warmup is None:
+        status = "ready"
+    elif not warmup.ready:
+        status = "warming"
+    elif any(stage.status == "failed" for stage in warmup.stages):
+        status = "degraded"
+    else:
+        status = "ready"
+    return {
+        "status": status,
+        "warm_start": warmup is not None,
+        "uptime_seconds": round(time.monotonic() - _STARTED_AT, 3),
+        "loaded_libraries": [name for name in HEAVY_MODULES if name in sys.modules],
+        "warmup": warmup.snapshot() if warmup is not None else None,
+    }
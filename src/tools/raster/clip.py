@@ -0,0 +1,144 @@
+"""Raster clipping tool using windowed Rasterio reads."""
+
+from __future__ import annotations
+
+from fastmcp import Context
+from fastmcp.exceptions import ToolError
+
+from src.app import mcp
+from src.config import resolve_path
+from src.middleware.paths import validate_output_path
+from src.models.raster.clip import Params, Result, Window
+from src.models.resourceref import ResourceRef
+from src.shared.tracing import span
+
+
+async def _clip(
+    uri: str,
+    output: str,
+    params: Params,
+    ctx: Context | None = None,
+) -> Result:
+    """Core logic: Clip a raster to a bounding box or vector mask.
+
+    Args:
+        uri: Path/URI to the source raster dataset (relative or absolute).
+        output: Path for the output GeoTIFF, or a ``.vrt`` for a virtual subset.
+        params: Clipping parameters (bounds or mask).
+        ctx: Optional MCP context for logging and progress reporting.
+
+    Returns:
+        Result: Metadata about the clipped raster with ResourceRef.
+
+    Raises:
+        ToolError: If the inputs cannot be read, the extent misses the raster,
+            or the output cannot be written.
+    """
+    from src.shared.raster.clip import clip as clip_raster, mask_sidecar_path
+
+    uri_path = str(resolve_path(uri))
+    output_path = resolve_path(output)
+    params_dict = params.model_dump()
+    if params.mask:
+        params_dict["mask"] = str(resolve_path(params.mask))
+        if output_path.suffix.lower() == ".vrt":
+            # The mask raster is a second output, so it must pass the same workspace check
+            validate_output_path(str(mask_sidecar_path(output_path)))
+
+    if ctx:
+        await ctx.info(f"📂 Opening source raster: {uri_path}")
+        if params.bounds:
+            crs_note = f" ({params.bounds_crs})" if params.bounds_crs else ""
+            await ctx.debug(f"Clipping by bounds: {params.bounds}{crs_note}")
+        else:
+            await ctx.debug(f"Clipping by mask: {params_dict['mask']}")
+        await ctx.report_progress(0, 100)
+
+    try:
+        data = clip_raster(uri_path, str(output_path), params_dict, ctx)
+        with span("stat"):
+            size_bytes = output_path.stat().st_size
+    except ToolError:
+        raise
+    except Exception as e:
+        raise ToolError(f"Unexpected error during raster clipping: {e}") from e
+
+    if ctx:
+        await ctx.report_progress(100, 100)
+        await ctx.info(
+            f"✓ Clip complete: {output_path} ({data['width']}x{data['height']} pixels, "
+            f"{size_bytes:,} bytes)"
+        )
+
+    # Build ResourceRef per ADR-0012
+    resource_ref = ResourceRef(
+        uri=output_path.as_uri(),
+        path=str(output_path.absolute()),
+        size=size_bytes,
+        driver=data["driver"],
+        meta={
+            "clip_method": data["clip_method"],
+            "mask_path": data["mask_path"],
+        },
+    )
+    return Result(
+        output=resource_ref,
+        driver=data["driver"],
+        window=Window(**data["window"]),
+        width=data["width"],
+        height=data["height"],
+        bounds=data["bounds"],
+        crs=data["crs"],
+        clip_method=data["clip_method"],
+    )
+
+
+@mcp.tool(
+    name="raster_clip",
+    description=(
+        "Clip (subset) a raster to a bounding box or a polygon mask, reading only the "
+        "blocks that intersect it. "
+        "USE WHEN: Need a study-area subset of a large raster, want to crop before "
+        "reprojecting, converting or analysing, or need to cut a raster to a boundary. "
+        "Prefer this over converting or reprojecting the full file and cropping afterwards. "
+        "REQUIRES: uri (source raster path), output (destination path: .tif for a GeoTIFF "
+        "copy, .vrt for a virtual subset that copies no pixels). "
+        "ONE OF: bounds=[minx, miny, maxx, maxy] (with optional bounds_crs, e.g. 'EPSG:4326', "
+        "default the raster CRS) OR mask=<polygon vector path> (reprojected automatically; "
+        "pixels outside the polygons become nodata). "
+        "OPTIONAL: all_touched (mask: keep every touched pixel, default False), nodata (value "
+        "for masked pixels when the source has none, must fit the raster data type; otherwise "
+        "a mask band is written), "
+        "compression (GeoTIFF compression, default same as source). "
+        "OUTPUT: RasterClipResult with ResourceRef, driver, source pixel window, output "
+        "width/height, bounds in the raster CRS, crs and clip_method. "
+        "SIDE EFFECTS: Creates new file at output path (VRT mask clips also write "
+        "<output>.mask.tif and refuse to replace one they did not create). "
+        "NOTE: The extent is rounded outward to whole pixels; no resampling is performed. "
+        "A VRT references the source by absolute path, so keep the source in place."
+    ),
+)
+async def clip(
+    uri: str,
+    output: str,
+    bounds: list[float] | None = None,
+    bounds_crs: str | None = None,
+    mask: str | None = None,
+    all_touched: bool = False,
+    nodata: float | None = None,
+    compression: str | None = None,
+    ctx: Context | None = None,
+) -> Result:
+    """MCP tool wrapper for raster clipping with flattened parameters."""
+    try:
+        params = Params(
+            bounds=bounds,
+            bounds_crs=bounds_crs,
+            mask=mask,
+            all_touched=all_touched,
+            nodata=nodata,
+            compression=compression,  # type: ignore[arg-type]
+        )
+    except ValueError as e:
+        raise ToolError(f"Invalid raster_clip parameters: {e}") from e
+    return await _clip(uri, output, params, ctx)
@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-import rasterio
 from fastmcp import Context
 from fastmcp.exceptions import ToolError
-from rasterio.enums import Resampling
 
 from src.app import mcp
 from src.config import resolve_path
+from src.middleware.admission import CONVERT_WINDOW_ROWS
+from src.middleware.tool_call import current_tool_call
 from src.models.raster.convert import Options, Result
 from src.models.resourceref import ResourceRef
+from src.shared.gdal_env import gdal_env
+from src.shared.tracing import span
 
 
 async def _convert(
@@ -33,6 +35,10 @@ async def _convert(
     Raises:
         ToolError: If raster cannot be opened or conversion fails.
     """
+    import rasterio
+    from rasterio.enums import Resampling
+    from rasterio.windows import Window
+
     # Resolve paths to absolute
     uri_path = str(resolve_path(uri))
     output_path = resolve_path(output)
@@ -48,11 +54,17 @@ async def _convert(
             f"compression={options.compression}, tiled={options.tiled}"
         )
 
-    # Per ADR-0013: wrap in rasterio.Env for per-request config isolation
+    # Admission control downgrades to strip copies when a whole band does not fit
+    call = current_tool_call()
+    windowed = call is not None and call.admission is not None and call.admission.mode == "windowed"
+
+    # Per ADR-0013: per-request rasterio.Env carrying the GDAL tuning profile
     try:
-        with rasterio.Env():
+        with gdal_env(), span("raster_convert", uri=uri_path, driver=options.driver):
             # Open source dataset
-            with rasterio.open(uri_path) as src:
+            with span("open"):
+                src = rasterio.open(uri_path)
+            with src:
                 if ctx:
                     await ctx.info(
                         f"✓ Source: {src.driver}, {src.width}x{src.height}, "
@@ -89,16 +101,36 @@ async def _convert(
                     await ctx.info(f"📝 Writing output: {output_path}")
 
                 # Write output dataset
-                with rasterio.open(str(output_path), "w", **profile) as dst:
-                    # Copy all bands with progress reporting
-                    for band_idx in range(1, src.count + 1):
-                        if ctx:
-                            progress = int((band_idx / src.count) * 80)  # Reserve 20% for overviews
-                            await ctx.report_progress(progress, 100)
-                            await ctx.debug(f"Copying band {band_idx}/{src.count}")
-
-                        data = src.read(band_idx)
-                        dst.write(data, band_idx)
+                with span("create", width=src.width, height=src.height):
+                    dst = rasterio.open(str(output_path), "w", **profile)
+                with dst:
+                    if windowed:
+                        # Copy all bands a strip of rows at a time
+                        for row in range(0, src.height, CONVERT_WINDOW_ROWS):
+                            if ctx:
+                                progress = int((row / src.height) * 80)
+                                await ctx.report_progress(progress, 100)
+
+                            window = Window(
+                                0, row, src.width, min(CONVERT_WINDOW_ROWS, src.height - row)
+                            )
+                            with span("read", row=row):
+                                data = src.read(window=window)
+                            with span("write", row=row):
+                                dst.write(data, window=window)
+                    else:
+                        # Copy all bands with progress reporting
+                        for band_idx in range(1, src.count + 1):
+                            if ctx:
+                                # Reserve 20% for overviews
+                                progress = int((band_idx / src.count) * 80)
+                                await ctx.report_progress(progress, 100)
+                                await ctx.debug(f"Copying band {band_idx}/{src.count}")
+
+                            with span("read", band=band_idx):
+                                data = src.read(band_idx)
+                            with span("write", band=band_idx):
+                                dst.write(data, band_idx)
 
                     # Copy tags
                     dst.update_tags(**src.tags())
@@ -107,6 +139,10 @@ async def _convert(
                     for band_idx in range(1, src.count + 1):
                         dst.update_tags(band_idx, **src.tags(band_idx))
 
+                    # Closing flushes cached blocks: compression and final writes
+                    with span("flush", compression=options.compression or "none"):
+                        dst.close()
+
             if ctx:
                 await ctx.report_progress(80, 100)
 
@@ -116,7 +152,10 @@ async def _convert(
                 if ctx:
                     await ctx.info(f"🔨 Building overviews: {options.overviews}")
 
-                with rasterio.open(str(output_path), "r+") as dst:
+                with (
+                    span("overviews", levels=len(options.overviews)),
+                    rasterio.open(str(output_path), "r+") as dst,
+                ):
                     # Map resampling string to Resampling enum
                     resampling_map = {
                         "nearest": Resampling.nearest,
@@ -138,7 +177,8 @@ async def _convert(
                     await ctx.debug(f"✓ Overviews built: {overviews_built}")
 
             # Get output file size
-            size_bytes = output_path.stat().st_size
+            with span("stat"):
+                size_bytes = output_path.stat().st_size
 
             if ctx:
                 await ctx.report_progress(100, 100)
@@ -7,7 +7,6 @@ from fastmcp import Context
 from src.app import mcp
 from src.config import resolve_path
 from src.models.raster.info import Info
-from src.shared.raster.info import extract_raster_info
 
 
 async def _info(
@@ -16,6 +15,8 @@ async def _info(
     ctx: Context | None = None,
 ) -> Info:
     """Return structured metadata for a raster dataset using shared extractor."""
+    from src.shared.raster.info import extract_raster_info
+
     # Resolve path to absolute
     uri_path = str(resolve_path(uri))
 
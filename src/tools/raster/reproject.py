@@ -2,16 +2,15 @@
 
 from __future__ import annotations
 
-import rasterio
 from fastmcp import Context
 from fastmcp.exceptions import ToolError
-from rasterio.enums import Resampling
-from rasterio.warp import calculate_default_transform, reproject as rio_reproject
 
 from src.app import mcp
 from src.config import resolve_path
 from src.models.raster.reproject import Params, Result
 from src.models.resourceref import ResourceRef
+from src.shared.gdal_env import gdal_env
+from src.shared.tracing import span
 
 
 async def _reproject(
@@ -34,6 +33,12 @@ async def _reproject(
     Raises:
         ToolError: If raster cannot be opened or reprojection fails.
     """
+    import rasterio
+    from rasterio.enums import Resampling
+    from rasterio.warp import calculate_default_transform, reproject as rio_reproject
+
+    from src.shared.projection import get_raster_crs
+
     # Resolve paths to absolute
     uri_path = str(resolve_path(uri))
     output_path = resolve_path(output)
@@ -42,12 +47,16 @@ async def _reproject(
         await ctx.info("📂 Opening source raster: " + uri_path)
         await ctx.debug("Target CRS: " + params.dst_crs + ", Resampling: " + params.resampling)
 
-    # Per ADR-0013: wrap in rasterio.Env for per-request config isolation
+    # Per ADR-0013: per-request rasterio.Env carrying the GDAL tuning profile
     try:
-        with rasterio.Env():
-            with rasterio.open(uri_path) as src:
-                # Determine source CRS (use override if provided)
-                src_crs = params.src_crs if params.src_crs else src.crs
+        with gdal_env(), span("raster_reproject", uri=uri_path, dst_crs=params.dst_crs):
+            with span("open"):
+                src = rasterio.open(uri_path)
+            with src:
+                # Determine source CRS (use override if provided); parsed CRS
+                # objects are cached across calls
+                src_crs = get_raster_crs(params.src_crs) if params.src_crs else src.crs
+                dst_crs = get_raster_crs(params.dst_crs)
                 if src_crs is None:
                     raise ToolError(
                         "Source CRS not found in raster '" + uri + "' and not provided in params. "
@@ -93,36 +102,37 @@ async def _reproject(
                 if ctx:
                     await ctx.info("📐 Calculating output transform and dimensions...")
 
-                if params.resolution:
-                    # Use specified resolution
-                    dst_transform, dst_width, dst_height = calculate_default_transform(
-                        src_crs,
-                        params.dst_crs,
-                        src.width,
-                        src.height,
-                        *src.bounds,
-                        resolution=params.resolution,
-                    )
-                elif params.width and params.height:
-                    # Use specified dimensions
-                    dst_transform, _, _ = calculate_default_transform(
-                        src_crs,
-                        params.dst_crs,
-                        src.width,
-                        src.height,
-                        *src.bounds,
-                    )
-                    dst_width = params.width
-                    dst_height = params.height
-                else:
-                    # Auto-calculate optimal transform and dimensions
-                    dst_transform, dst_width, dst_height = calculate_default_transform(
-                        src_crs,
-                        params.dst_crs,
-                        src.width,
-                        src.height,
-                        *src.bounds,
-                    )
+                with span("transform"):
+                    if params.resolution:
+                        # Use specified resolution
+                        dst_transform, dst_width, dst_height = calculate_default_transform(
+                            src_crs,
+                            dst_crs,
+                            src.width,
+                            src.height,
+                            *src.bounds,
+                            resolution=params.resolution,
+                        )
+                    elif params.width and params.height:
+                        # Use specified dimensions
+                        dst_transform, _, _ = calculate_default_transform(
+                            src_crs,
+                            dst_crs,
+                            src.width,
+                            src.height,
+                            *src.bounds,
+                        )
+                        dst_width = params.width
+                        dst_height = params.height
+                    else:
+                        # Auto-calculate optimal transform and dimensions
+                        dst_transform, dst_width, dst_height = calculate_default_transform(
+                            src_crs,
+                            dst_crs,
+                            src.width,
+                            src.height,
+                            *src.bounds,
+                        )
 
                 if ctx:
                     await ctx.info(
@@ -140,7 +150,7 @@ async def _reproject(
                 profile = src.profile.copy()
                 profile.update(
                     {
-                        "crs": params.dst_crs,
+                        "crs": dst_crs,
                         "transform": dst_transform,
                         "width": dst_width,
                         "height": dst_height,
@@ -155,7 +165,9 @@ async def _reproject(
                     await ctx.info("📝 Writing reprojected output: " + str(output_path))
 
                 # Write reprojected dataset
-                with rasterio.open(str(output_path), "w", **profile) as dst:
+                with span("create", width=dst_width, height=dst_height):
+                    dst = rasterio.open(str(output_path), "w", **profile)
+                with dst:
                     for band_idx in range(1, src.count + 1):
                         # Progress: 10% setup, 80% reprojection (distributed), 10% finalize
                         progress_start = 10 + int(((band_idx - 1) / src.count) * 80)
@@ -173,28 +185,35 @@ async def _reproject(
                                 + " resampling)"
                             )
 
-                        rio_reproject(
-                            source=rasterio.band(src, band_idx),
-                            destination=rasterio.band(dst, band_idx),
-                            src_transform=src.transform,
-                            src_crs=src_crs,
-                            dst_transform=dst_transform,
-                            dst_crs=params.dst_crs,
-                            resampling=resampling_method,
-                        )
+                        # Reads, warps and writes the band in GDAL-managed chunks
+                        with span("warp", band=band_idx):
+                            rio_reproject(
+                                source=rasterio.band(src, band_idx),
+                                destination=rasterio.band(dst, band_idx),
+                                src_transform=src.transform,
+                                src_crs=src_crs,
+                                dst_transform=dst_transform,
+                                dst_crs=dst_crs,
+                                resampling=resampling_method,
+                            )
 
                     # Copy tags
                     dst.update_tags(**src.tags())
 
+                    # Closing flushes cached blocks: compression and final writes
+                    with span("flush"):
+                        dst.close()
+
                 if ctx:
                     await ctx.report_progress(90, 100)
 
-            # Get output file size
-            size_bytes = output_path.stat().st_size
+            with span("stat"):
+                # Get output file size
+                size_bytes = output_path.stat().st_size
 
-            # Calculate output bounds in destination CRS
-            with rasterio.open(str(output_path)) as dst:
-                dst_bounds = dst.bounds
+                # Calculate output bounds in destination CRS
+                with rasterio.open(str(output_path)) as dst:
+                    dst_bounds = dst.bounds
 
             if ctx:
                 await ctx.report_progress(100, 100)
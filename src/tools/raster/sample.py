@@ -0,0 +1,147 @@
+"""Raster point sampling tool using block-grouped Rasterio reads."""
+
+from __future__ import annotations
+
+from fastmcp import Context
+from fastmcp.exceptions import ToolError
+
+from src.app import mcp
+from src.config import resolve_path
+from src.models.raster.sample import Params, Result, Sample
+from src.models.resourceref import ResourceRef
+from src.shared.tracing import span
+
+
+async def _sample(
+    uri: str,
+    params: Params,
+    output: str | None = None,
+    ctx: Context | None = None,
+) -> Result:
+    """Core logic: sample raster bands at many points.
+
+    Args:
+        uri: Path/URI to the raster dataset (relative or absolute).
+        params: Points (inline or from a file), their CRS and bands to sample.
+        output: Optional CSV path; samples are written there instead of returned.
+        ctx: Optional MCP context for logging.
+
+    Returns:
+        Result: Per-point values for every requested band, or a ResourceRef to the CSV.
+
+    Raises:
+        ToolError: If the raster or points cannot be read or a parameter is invalid.
+    """
+    import numpy as np
+
+    from src.shared.raster.sample import read_points, sample, write_samples_csv
+
+    uri_path = str(resolve_path(uri))
+    if params.points_file:
+        points_path = str(resolve_path(params.points_file))
+        try:
+            with span("read_points"):
+                xs, ys, ids, points_crs = read_points(points_path, params.id_field)
+        except ToolError:
+            raise
+        except Exception as e:
+            raise ToolError(
+                f"Cannot read points from '{points_path}'. Ensure the file exists and is a "
+                f"valid vector format. Original error: {e}"
+            ) from e
+    else:
+        coords = np.asarray(params.points, dtype=np.float64).reshape(-1, 2)
+        xs, ys = coords[:, 0], coords[:, 1]
+        ids = list(range(len(coords)))
+        points_crs = params.points_crs
+
+    if ctx:
+        await ctx.info(f"📍 Sampling {len(ids):,} points from {uri_path}")
+    data = sample(uri_path, xs, ys, {"bands": params.bands, "points_crs": points_crs}, ctx)
+    if ctx:
+        await ctx.info(
+            f"✓ {data['inside_count']:,} points inside the raster, "
+            f"{data['blocks_read']:,} blocks read"
+        )
+
+    result = Result(
+        path=data["path"],
+        bands=data["bands"],
+        crs=data["crs"],
+        point_count=len(ids),
+        inside_count=data["inside_count"],
+        blocks_read=data["blocks_read"],
+    )
+    if output is not None:
+        output_path = resolve_path(output)
+        try:
+            with span("write", rows=len(ids)):
+                write_samples_csv(output_path, ids, xs, ys, data)
+        except OSError as e:
+            raise ToolError(f"Failed to write samples to '{output}': {e}") from e
+        result.output = ResourceRef(
+            uri=output_path.as_uri(),
+            path=str(output_path.absolute()),
+            size=output_path.stat().st_size,
+            driver="CSV",
+            meta={"rows": len(ids), "bands": data["bands"]},
+        )
+        return result
+
+    result.samples = [
+        Sample(
+            id=point_id,
+            x=float(xs[i]),
+            y=float(ys[i]),
+            row=data["rows"][i],
+            col=data["cols"][i],
+            values=[band[i] for band in data["values"]],
+        )
+        for i, point_id in enumerate(ids)
+    ]
+    return result
+
+
+@mcp.tool(
+    name="raster_sample",
+    description=(
+        "Sample raster values at many points in one call (e.g. elevation at 100k GPS fixes, "
+        "land cover at survey sites). Points are reprojected in bulk and grouped by raster "
+        "block, so each block is read once. "
+        "USE WHEN: Need pixel values at specific locations. Never loop raster_stats or "
+        "raster_clip per point. "
+        "REQUIRES: uri (raster path) and ONE OF: points ([[x, y], ...] inline; x = longitude "
+        "in geographic CRSs) OR points_file (Point vector layer path). "
+        "OPTIONAL: points_crs (CRS of inline points, e.g. 'EPSG:4326'; default the raster "
+        "CRS; files use their own CRS), id_field (points_file attribute echoed as id; default "
+        "feature index), bands (1-based list, default all), output (CSV path: write samples "
+        "there and return only the summary; recommended for more than a few thousand points). "
+        "OUTPUT: RasterSampleResult with bands, crs, point_count, inside_count, blocks_read and "
+        "samples (id, x, y, row, col, values with one entry per band; null for nodata or "
+        "points outside the raster), or output ResourceRef when a CSV was written. "
+        "SIDE EFFECTS: Creates the CSV when output is given; otherwise read-only. "
+        "NOTE: Values are taken from the pixel containing each point (no interpolation)."
+    ),
+)
+async def sample(
+    uri: str,
+    points: list[list[float]] | None = None,
+    points_crs: str | None = None,
+    points_file: str | None = None,
+    id_field: str | None = None,
+    bands: list[int] | None = None,
+    output: str | None = None,
+    ctx: Context | None = None,
+) -> Result:
+    """MCP tool wrapper for raster point sampling with flattened parameters."""
+    try:
+        params = Params(
+            points=points,
+            points_crs=points_crs,
+            points_file=points_file,
+            id_field=id_field,
+            bands=bands,
+        )
+    except ValueError as e:
+        raise ToolError(f"Invalid raster_sample parameters: {e}") from e
+    return await _sample(uri, params, output, ctx)
@@ -6,8 +6,9 @@ from fastmcp import Context
 
 from src.app import mcp
 from src.config import resolve_path
+from src.middleware.admission import STATS_SAMPLE_PIXELS
+from src.middleware.tool_call import current_tool_call
 from src.models.raster.stats import Band, Histogram, Params, Result
-from src.shared.raster.stats import stats as extract_raster_stats
 
 
 async def _stats(
@@ -16,10 +17,18 @@ async def _stats(
     ctx: Context | None = None,
 ) -> Result:
     """Compute statistics using shared extractor and map to Result model."""
+    from src.shared.raster.stats import stats as extract_raster_stats
+
     # Resolve path to absolute
     uri_path = str(resolve_path(uri))
 
-    params_dict = params.model_dump() if params is not None else None
+    params_dict = params.model_dump() if params is not None else {}
+    call = current_tool_call()
+    if call is not None and call.admission is not None and call.admission.mode == "sampled":
+        # Admission control could not fit full-resolution bands in the memory budget
+        params_dict["max_pixels"] = STATS_SAMPLE_PIXELS
+        if ctx:
+            await ctx.info("Memory budget is tight: computing statistics on a decimated read")
     data = extract_raster_stats(uri_path, params_dict, ctx)
 
     band_models: list[Band] = []
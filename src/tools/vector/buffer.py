@@ -9,7 +9,8 @@ from src.app import mcp
 from src.config import resolve_path
 from src.models.resourceref import ResourceRef
 from src.models.vector.buffer import Params, Result
-from src.shared import vector
+from src.shared.chunking import DEFAULT_CHUNK_SIZE
+from src.shared.tracing import span
 
 
 async def _buffer(
@@ -32,6 +33,8 @@ async def _buffer(
     Raises:
         ToolError: If vector cannot be opened or buffering fails.
     """
+    from src.shared import vector
+
     # Resolve paths to absolute
     uri_path = str(resolve_path(uri))
     output_path = resolve_path(output)
@@ -47,27 +50,32 @@ async def _buffer(
             await ctx.info("🎯 Creating buffers...")
             await ctx.report_progress(20, 100)
 
-        # Call shared buffer logic
-        result_data = vector.buffer(
-            input_path=uri_path,
-            output_path=str(output_path),
-            distance=params.distance,
-            resolution=params.resolution,
-            ctx=ctx,
-        )
-
-        # Warn if geographic CRS
-        if ctx and result_data.get("is_geographic"):
-            await ctx.info(
-                "⚠️  Geographic CRS detected. Buffer distance is in degrees. "
-                "For metric buffers, reproject to projected CRS (e.g., UTM) first."
+        with span("vector_buffer", uri=uri_path):
+            # Call shared buffer logic
+            result_data = vector.buffer(
+                input_path=uri_path,
+                output_path=str(output_path),
+                distance=params.distance,
+                resolution=params.resolution,
+                workers=params.workers,
+                chunk_size=params.chunk_size,
+                dissolve=params.dissolve,
+                ctx=ctx,
             )
 
-        if ctx:
-            await ctx.report_progress(90, 100)
+            # Warn if geographic CRS
+            if ctx and result_data.get("is_geographic"):
+                await ctx.info(
+                    "⚠️  Geographic CRS detected. Buffer distance is in degrees. "
+                    "For metric buffers, reproject to projected CRS (e.g., UTM) first."
+                )
+
+            if ctx:
+                await ctx.report_progress(90, 100)
 
-        # Get output file size
-        size_bytes = output_path.stat().st_size
+            # Get output file size
+            with span("stat"):
+                size_bytes = output_path.stat().st_size
 
         if ctx:
             await ctx.report_progress(100, 100)
@@ -85,6 +93,7 @@ async def _buffer(
             meta={
                 "buffer_distance": params.distance,
                 "resolution": params.resolution,
+                "dissolved": params.dissolve,
             },
         )
 
@@ -95,6 +104,7 @@ async def _buffer(
             buffer_distance=result_data["buffer_distance"],
             resolution=result_data["resolution"],
             bounds=result_data.get("bounds"),
+            dissolved=result_data.get("dissolved", False),
         )
 
     except ToolError:
@@ -116,8 +126,12 @@ async def _buffer(
         "distance (buffer distance in CRS units). "
         "OPTIONAL: resolution (segments per quadrant, 4-64, default 16). "
         "Higher resolution = smoother circles but slower performance. "
+        "OPTIONAL: workers (threads, default all cores), chunk_size (geometries per "
+        "parallel chunk, default 4096), dissolve (True merges overlapping buffers into "
+        "one feature per resulting polygon using a parallel partitioned union; source "
+        "attributes are dropped). "
         "OUTPUT: VectorBufferResult with ResourceRef (output file URI/path/size/metadata), "
-        "feature_count, buffer_distance applied, resolution used, bounds. "
+        "feature_count, buffer_distance applied, resolution used, bounds, dissolved. "
         "SIDE EFFECTS: Creates new file at output path. Output geometry type is Polygon. "
         "SUPPORTS: Shapefile, GeoPackage, GeoJSON and other OGR formats. "
         "IMPORTANT: Distance in CRS units - meters for projected (UTM, State Plane), "
@@ -131,6 +145,9 @@ async def buffer(
     output: str,
     distance: float,
     resolution: int = 16,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    dissolve: bool = False,
     ctx: Context | None = None,
 ) -> Result:
     """MCP tool wrapper for vector buffering with flattened parameters.
@@ -141,5 +158,8 @@ async def buffer(
     params = Params(
         distance=distance,
         resolution=resolution,
+        workers=workers,
+        chunk_size=chunk_size,
+        dissolve=dissolve,
     )
     return await _buffer(uri, output, params, ctx)
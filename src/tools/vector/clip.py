@@ -9,7 +9,7 @@ from src.app import mcp
 from src.config import resolve_path
 from src.models.resourceref import ResourceRef
 from src.models.vector.clip import Params, Result
-from src.shared import vector
+from src.shared.tracing import span
 
 
 async def _clip(
@@ -32,6 +32,8 @@ async def _clip(
     Raises:
         ToolError: If vector cannot be opened or clipping fails.
     """
+    from src.shared import vector
+
     # Resolve paths to absolute
     uri_path = str(resolve_path(uri))
     output_path = resolve_path(output)
@@ -53,20 +55,22 @@ async def _clip(
             await ctx.info("✂️ Clipping features...")
             await ctx.report_progress(20, 100)
 
-        # Call shared clipping logic
-        result_data = vector.clip(
-            input_path=uri_path,
-            output_path=str(output_path),
-            bounds=params.bounds,
-            mask=mask_path,
-            ctx=ctx,
-        )
+        with span("vector_clip", uri=uri_path):
+            # Call shared clipping logic
+            result_data = vector.clip(
+                input_path=uri_path,
+                output_path=str(output_path),
+                bounds=params.bounds,
+                mask=mask_path,
+                ctx=ctx,
+            )
 
-        if ctx:
-            await ctx.report_progress(90, 100)
+            if ctx:
+                await ctx.report_progress(90, 100)
 
-        # Get output file size
-        size_bytes = output_path.stat().st_size
+            # Get output file size
+            with span("stat"):
+                size_bytes = output_path.stat().st_size
 
         if ctx:
             await ctx.report_progress(100, 100)
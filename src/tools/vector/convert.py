@@ -9,7 +9,7 @@ from src.app import mcp
 from src.config import resolve_path
 from src.models.resourceref import ResourceRef
 from src.models.vector.convert import Params, Result
-from src.shared import vector
+from src.shared.tracing import span
 
 
 async def _convert(
@@ -32,6 +32,8 @@ async def _convert(
     Raises:
         ToolError: If vector cannot be opened or conversion fails.
     """
+    from src.shared import vector
+
     # Resolve paths to absolute
     uri_path = str(resolve_path(uri))
     output_path = resolve_path(output)
@@ -50,20 +52,22 @@ async def _convert(
             await ctx.info("🔄 Converting format...")
             await ctx.report_progress(20, 100)
 
-        # Call shared conversion logic
-        result_data = vector.convert(
-            input_path=uri_path,
-            output_path=str(output_path),
-            driver=params.driver,
-            encoding=params.encoding,
-            ctx=ctx,
-        )
+        with span("vector_convert", uri=uri_path):
+            # Call shared conversion logic
+            result_data = vector.convert(
+                input_path=uri_path,
+                output_path=str(output_path),
+                driver=params.driver,
+                encoding=params.encoding,
+                ctx=ctx,
+            )
 
-        if ctx:
-            await ctx.report_progress(90, 100)
+            if ctx:
+                await ctx.report_progress(90, 100)
 
-        # Get output file size
-        size_bytes = output_path.stat().st_size
+            # Get output file size
+            with span("stat"):
+                size_bytes = output_path.stat().st_size
 
         if ctx:
             await ctx.report_progress(100, 100)
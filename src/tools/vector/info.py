@@ -2,13 +2,7 @@
 
 from __future__ import annotations
 
-try:
-    import pyogrio  # noqa: F401
-
-    HAS_PYOGRIO = True
-except ImportError:
-    HAS_PYOGRIO = False
-    import fiona  # noqa: F401
+from importlib.util import find_spec
 
 from fastmcp import Context
 from fastmcp.exceptions import ToolError
@@ -16,7 +10,9 @@ from fastmcp.exceptions import ToolError
 from src.app import mcp
 from src.config import resolve_path
 from src.models.vector.info import Info
-from src.shared import vector
+
+# Checked without importing: the backend is loaded on the first call
+HAS_PYOGRIO = find_spec("pyogrio") is not None
 
 
 async def _info(
@@ -24,6 +20,8 @@ async def _info(
     ctx: Context | None = None,
 ) -> Info:
     """Return structured metadata for a vector dataset using shared extractor."""
+    from src.shared import vector
+
     # Resolve path to absolute
     uri_path = str(resolve_path(uri))
 
@@ -9,7 +9,7 @@ from src.app import mcp
 from src.config import resolve_path
 from src.models.resourceref import ResourceRef
 from src.models.vector.reproject import Params, Result
-from src.shared import vector
+from src.shared.tracing import span
 
 
 async def _reproject(
@@ -32,6 +32,8 @@ async def _reproject(
     Raises:
         ToolError: If vector cannot be opened or reprojection fails.
     """
+    from src.shared import vector
+
     # Resolve paths to absolute
     uri_path = str(resolve_path(uri))
     output_path = resolve_path(output)
@@ -49,20 +51,22 @@ async def _reproject(
             await ctx.info("🔄 Reprojecting features...")
             await ctx.report_progress(20, 100)
 
-        # Call shared reprojection logic
-        result_data = vector.reproject(
-            input_path=uri_path,
-            output_path=str(output_path),
-            dst_crs=params.dst_crs,
-            src_crs=params.src_crs,
-            ctx=ctx,
-        )
+        with span("vector_reproject", uri=uri_path):
+            # Call shared reprojection logic
+            result_data = vector.reproject(
+                input_path=uri_path,
+                output_path=str(output_path),
+                dst_crs=params.dst_crs,
+                src_crs=params.src_crs,
+                ctx=ctx,
+            )
 
-        if ctx:
-            await ctx.report_progress(90, 100)
+            if ctx:
+                await ctx.report_progress(90, 100)
 
-        # Get output file size
-        size_bytes = output_path.stat().st_size
+            # Get output file size
+            with span("stat"):
+                size_bytes = output_path.stat().st_size
 
         if ctx:
             await ctx.report_progress(100, 100)
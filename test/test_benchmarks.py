@@ -0,0 +1,101 @@
+"""Tests for the benchmark data generators and baseline comparison."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pyogrio
+import pytest
+import rasterio
+
+from benchmarks.generators import (
+    GeometryKind,
+    RasterSpec,
+    VectorSpec,
+    write_raster,
+    write_vector,
+)
+from benchmarks.suite import Preset, compare, run_suite
+
+
+def test_write_raster_is_deterministic(tmp_path: Path):
+    """Generated rasters have the requested layout, a nodata mask and stable values."""
+    spec = RasterSpec(size=64, bands=2, block=16)
+    first = write_raster(tmp_path / "a.tif", spec)
+    second = write_raster(tmp_path / "b.tif", spec)
+
+    with rasterio.open(first) as a, rasterio.open(second) as b:
+        assert (a.width, a.height, a.count) == (64, 64, 2)
+        assert a.block_shapes[0] == (16, 16)
+        assert a.nodata == 0
+        data = a.read()
+        assert (data == 0).any()
+        assert (data != 0).mean() > 0.9
+        np.testing.assert_array_equal(data, b.read())
+
+
+@pytest.mark.parametrize(
+    ("kind", "geometry_type"),
+    [("point", "Point"), ("line", "LineString"), ("polygon", "Polygon")],
+)
+def test_write_vector_kinds(tmp_path: Path, kind: GeometryKind, geometry_type: str):
+    """Each geometry kind writes the requested number of features."""
+    path = write_vector(tmp_path / f"{kind}.gpkg", VectorSpec(kind, 50, vertices=8))
+
+    info = pyogrio.read_info(path)
+    assert info["features"] == 50
+    assert info["geometry_type"] == geometry_type
+    assert "value" in info["fields"]
+
+
+def test_compare_flags_regressions():
+    """Cases slower than the threshold are regressions; unknown cases are new."""
+    baseline = {"results": {"a": {"median": 1.0}, "b": {"median": 1.0}, "gone": {"median": 1.0}}}
+    current = {
+        "results": {
+            "a": {"median": 1.5, "error": None},
+            "b": {"median": 1.05, "error": None},
+            "c": {"median": 0.2, "error": None},
+        }
+    }
+
+    status = {row["case"]: row["status"] for row in compare(current, baseline, threshold=0.1)}
+
+    assert status == {"a": "regression", "b": "ok", "c": "new", "gone": "missing"}
+
+
+def test_run_suite_tiny_preset(tmp_path: Path):
+    """A tiny preset runs end to end and reuses cached inputs on the next run."""
+    preset = Preset(
+        rasters=(RasterSpec(size=64, bands=1, block=16),),
+        vectors=(VectorSpec("point", 20),),
+    )
+
+    results = run_suite(preset, tmp_path, repeat=1, only=["raster_stats", "vector_info"])
+
+    assert set(results["results"]) == {
+        "raster_stats[raster_64px_1b_uint16_tiled16]",
+        "vector_info[point_20f_16v]",
+    }
+    for case in results["results"].values():
+        assert case["error"] is None
+        assert len(case["runs"]) == 1
+
+    raster = tmp_path / "raster_64px_1b_uint16_tiled16.tif"
+    mtime = raster.stat().st_mtime_ns
+    run_suite(preset, tmp_path, repeat=1, only=["raster_stats"])
+    assert raster.stat().st_mtime_ns == mtime
+
+
+def test_run_suite_times_both_simplify_methods(tmp_path: Path):
+    """Long rings are simplified with Douglas-Peucker and Visvalingam-Whyatt."""
+    preset = Preset(rasters=(), vectors=(VectorSpec("polygon", 1, vertices=2_000),))
+
+    results = run_suite(preset, tmp_path, repeat=1, only=["vector_simplify"])
+
+    assert set(results["results"]) == {
+        "vector_simplify[polygon_1f_2000v]",
+        "vector_simplify[polygon_1f_2000v,visvalingam]",
+    }
+    assert all(case["error"] is None for case in results["results"].values())
@@ -0,0 +1,64 @@
+"""Tests for the GDAL runtime tuning profile."""
+
+from __future__ import annotations
+
+import rasterio
+
+from src.shared.gdal_env import GdalProfile, gdal_env, load_gdal_profile, reset_gdal_profile
+
+
+def test_profile_layers_preset_environment_and_overrides(monkeypatch):
+    """Environment GDAL options beat the preset, GDAL_MCP_GDAL_OPTIONS beats both."""
+    monkeypatch.setenv("GDAL_MCP_GDAL_PROFILE", "network-storage")
+    monkeypatch.setenv("GDAL_CACHEMAX", "256")
+    monkeypatch.setenv(
+        "GDAL_MCP_GDAL_OPTIONS", "GDAL_NUM_THREADS=4;VSI_CACHE=maybe;garbage;CPL_DEBUG=ON"
+    )
+
+    profile = load_gdal_profile()
+
+    assert profile.name == "network-storage"
+    assert profile.options["GDAL_DISABLE_READDIR_ON_OPEN"] == "EMPTY_DIR"
+    assert profile.sources["GDAL_DISABLE_READDIR_ON_OPEN"] == "preset"
+    assert (profile.options["GDAL_CACHEMAX"], profile.sources["GDAL_CACHEMAX"]) == (
+        "256",
+        "environment",
+    )
+    assert (profile.options["GDAL_NUM_THREADS"], profile.sources["GDAL_NUM_THREADS"]) == (
+        "4",
+        "override",
+    )
+    # Invalid values keep the preset; unknown options pass through
+    assert profile.options["VSI_CACHE"] == "TRUE"
+    assert profile.rejected == {"VSI_CACHE": "maybe"}
+    assert profile.options["CPL_DEBUG"] == "ON"
+
+
+def test_unknown_profile_falls_back_to_default(monkeypatch):
+    monkeypatch.setenv("GDAL_MCP_GDAL_PROFILE", "turbo")
+    monkeypatch.delenv("GDAL_CACHEMAX", raising=False)
+    monkeypatch.delenv("CPL_VSIL_CURL_ALLOWED_EXTENSIONS", raising=False)
+    monkeypatch.delenv("GDAL_MCP_GDAL_OPTIONS", raising=False)
+
+    profile = load_gdal_profile()
+
+    assert profile.name == "default"
+    assert profile.options == {}
+
+
+def test_gdal_env_applies_profile_options():
+    """Options of the active profile are set inside every gdal_env block."""
+    reset_gdal_profile(
+        GdalProfile(
+            name="low-memory",
+            options={"GDAL_NUM_THREADS": "1", "VSI_CACHE": "FALSE"},
+            sources={"GDAL_NUM_THREADS": "preset", "VSI_CACHE": "preset"},
+        )
+    )
+    try:
+        with gdal_env(VSI_CACHE="TRUE"):
+            config = rasterio.env.getenv()
+        assert config["GDAL_NUM_THREADS"] == "1"
+        assert config["VSI_CACHE"] == "TRUE"
+    finally:
+        reset_gdal_profile()
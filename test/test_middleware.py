@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
@@ -224,3 +225,367 @@ async def test_middleware_includes_tool_name_in_error(
 
     # Cleanup
     del os.environ["GDAL_MCP_WORKSPACES"]
+
+
+def test_validate_path_caches_resolution(tmp_path, monkeypatch):
+    """Repeated validation of the same path is served from the cache."""
+    from src.middleware import paths
+
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    test_file = workspace / "dem.tif"
+    test_file.touch()
+    allowed = [workspace.resolve()]
+    paths.clear_path_cache()
+
+    calls = []
+    original_resolve = Path.resolve
+
+    def counting_resolve(self, strict=False):
+        calls.append(self)
+        return original_resolve(self, strict=strict)
+
+    monkeypatch.setattr(Path, "resolve", counting_resolve)
+
+    first = paths.validate_path(str(test_file), allowed)
+    second = paths.validate_path(str(test_file), allowed)
+
+    assert len(calls) == 1
+    assert first == second == test_file.resolve()
+
+
+def test_validate_path_detects_symlink_swap(tmp_path, monkeypatch):
+    """A cached file swapped for a symlink escaping the workspace is denied."""
+    from src.middleware import paths
+
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    outside = tmp_path / "secret.tif"
+    outside.touch()
+    test_file = workspace / "dem.tif"
+    test_file.touch()
+    paths.clear_path_cache()
+    monkeypatch.setattr(paths, "PATH_REVALIDATE_SECONDS", 0.0)
+
+    allowed = [workspace.resolve()]
+    paths.validate_path(str(test_file), allowed)
+
+    test_file.unlink()
+    test_file.symlink_to(outside)
+
+    with pytest.raises(ToolError, match="Access denied"):
+        paths.validate_path(str(test_file), allowed)
+
+
+def test_validate_output_path_detects_parent_symlink_swap(tmp_path, monkeypatch):
+    """A cached output path whose parent becomes a symlink out of the workspace is denied."""
+    from src.middleware import paths
+
+    workspace = tmp_path / "workspace"
+    subdir = workspace / "sub"
+    subdir.mkdir(parents=True)
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    output = subdir / "new.tif"
+    paths.clear_path_cache()
+    monkeypatch.setattr(paths, "PATH_REVALIDATE_SECONDS", 0.0)
+
+    allowed = [workspace.resolve()]
+    assert paths.validate_output_path(str(output), allowed) == output.resolve()
+
+    subdir.rmdir()
+    subdir.symlink_to(outside)
+
+    with pytest.raises(ToolError, match="Access denied"):
+        paths.validate_output_path(str(output), allowed)
+
+
+def test_validate_path_does_not_cache_symlinked_paths(tmp_path):
+    """Paths through a symlink are resolved on every call."""
+    from src.middleware import paths
+
+    workspace = tmp_path / "workspace"
+    (workspace / "data").mkdir(parents=True)
+    link = workspace / "link"
+    link.symlink_to(workspace / "data")
+    paths.clear_path_cache()
+
+    allowed = [workspace.resolve()]
+    paths.validate_path(str(link / "dem.tif"), allowed)
+
+    assert paths._fingerprint(str(link / "dem.tif")) is None
+    assert not paths._DECISIONS
+
+
+def test_workspace_trie_matches_nested_paths():
+    from src.middleware.paths import _WorkspaceTrie
+
+    trie = _WorkspaceTrie((Path("/data/projects"), Path("/home/user/gis")))
+
+    assert trie.match(Path("/data/projects/dem.tif")) == Path("/data/projects")
+    assert trie.match(Path("/home/user/gis")) == Path("/home/user/gis")
+    assert trie.match(Path("/data/projects-other/dem.tif")) is None
+    assert trie.match(Path("/data")) is None
+
+
+@pytest.mark.asyncio
+async def test_pipeline_shares_call_state_with_tool(mock_context, tmp_path, monkeypatch):
+    """Pipeline resolves paths once and exposes them to the running tool."""
+    from src.middleware import ToolCallPipeline, current_tool_call
+
+    def fail_store():
+        raise AssertionError("reflection store must not be touched for this tool")
+
+    monkeypatch.setattr("src.middleware.reflection_transform.get_store", fail_store)
+
+    input_file = tmp_path / "input.tif"
+    input_file.touch()
+    mock_context.message.name = "raster_info"
+    mock_context.message.arguments = {"uri": str(input_file)}
+
+    seen = {}
+
+    async def call_next(ctx):
+        call = current_tool_call()
+        seen["paths"] = dict(call.resolved_paths)
+        return {"status": "success"}
+
+    pipeline = ToolCallPipeline()
+    result = await pipeline.on_call_tool(mock_context, call_next)
+
+    assert result == {"status": "success"}
+    assert seen["paths"] == {"uri": input_file.resolve()}
+    assert current_tool_call() is None
+    assert pipeline.calls == 1
+    assert set(pipeline.overhead()) == {"paths", "reflection"}
+
+
+@pytest.mark.asyncio
+async def test_pipeline_blocks_missing_reflection(
+    mock_context, mock_call_next, tmp_path, monkeypatch
+):
+    """Tools listed in TOOL_REFLECTIONS still require cached justifications."""
+    from src.middleware import DiskStore, ToolCallPipeline
+
+    store = DiskStore(root=str(tmp_path / "reflections"))
+    monkeypatch.setattr("src.middleware.reflection_transform.get_store", lambda: store)
+
+    mock_context.message.name = "vector_reproject"
+    mock_context.message.arguments = {"dst_crs": "EPSG:3857"}
+
+    with pytest.raises(ToolError, match="Epistemic preflight required"):
+        await ToolCallPipeline().on_call_tool(mock_context, mock_call_next)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_validates_paths_without_tool_name(
+    mock_context, mock_call_next, tmp_path, monkeypatch
+):
+    """A call whose tool name cannot be read still gets its paths checked."""
+    from src.middleware import ToolCallPipeline
+
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    monkeypatch.setenv("GDAL_MCP_WORKSPACES", str(workspace))
+    reset_workspaces_cache()
+
+    mock_context.message.name = None
+    mock_context.message.arguments = {"output": str(tmp_path / "outside.tif")}
+
+    with pytest.raises(ToolError, match="outside allowed workspaces"):
+        await ToolCallPipeline().on_call_tool(mock_context, mock_call_next)
+
+    mock_context.message.arguments = {"output": str(workspace / "inside.tif")}
+    assert await ToolCallPipeline().on_call_tool(mock_context, mock_call_next) == {
+        "status": "success"
+    }
+
+
+def test_latency_histogram_percentiles_within_one_percent():
+    """HDR-style buckets keep quantiles within 1% across orders of magnitude."""
+    from src.middleware.metrics import LatencyHistogram
+
+    histogram = LatencyHistogram()
+    values = [i / 1000 for i in range(1, 10_001)]  # 1 ms .. 10 s
+    for value in values:
+        histogram.record(value)
+
+    assert histogram.count == len(values)
+    assert histogram.percentile(0.5) == pytest.approx(5.0, rel=0.01)
+    assert histogram.percentile(0.99) == pytest.approx(9.9, rel=0.01)
+    assert histogram.snapshot()["max"] == pytest.approx(10.0)
+
+
+@pytest.mark.asyncio
+async def test_metrics_middleware_records_tool_calls(mock_context, tmp_path):
+    """Tool calls record latency, input/output bytes and errors."""
+    from src.middleware import ToolCallPipeline
+    from src.middleware.metrics import MetricsMiddleware, MetricsRegistry
+
+    registry = MetricsRegistry()
+    middleware = MetricsMiddleware(registry)
+    pipeline = ToolCallPipeline()
+    input_file = tmp_path / "input.tif"
+    input_file.write_bytes(b"x" * 100)
+    mock_context.message.name = "raster_convert"
+    mock_context.message.arguments = {
+        "uri": str(input_file),
+        "output": str(tmp_path / "out.tif"),
+    }
+
+    async def tool(ctx):
+        return {"output": {"uri": "file:///out.tif", "size": 40}}
+
+    async def failing_tool(ctx):
+        raise ToolError("boom")
+
+    async def call_next(ctx):
+        return await pipeline.on_call_tool(ctx, tool)
+
+    async def failing_call_next(ctx):
+        return await pipeline.on_call_tool(ctx, failing_tool)
+
+    await middleware.on_call_tool(mock_context, call_next)
+    with pytest.raises(ToolError):
+        await middleware.on_call_tool(mock_context, failing_call_next)
+
+    stats = registry.snapshot()["tools"]["raster_convert"]
+    assert stats["calls"] == 2
+    assert stats["errors"] == 1
+    assert stats["bytes_read"] == 200
+    assert stats["bytes_written"] == 40
+    assert stats["wall_seconds"]["count"] == 2
+
+    text = registry.to_prometheus()
+    assert 'gdal_mcp_errors_total{kind="tool",name="raster_convert"} 1' in text
+    assert 'gdal_mcp_duration_seconds_count{kind="tool",name="raster_convert"} 2' in text
+
+
+@pytest.mark.asyncio
+async def test_metrics_never_stat_paths_outside_workspaces(mock_context, tmp_path, monkeypatch):
+    """Input sizes come from validated paths only, so denied calls reveal nothing."""
+    from src.middleware import ToolCallPipeline
+    from src.middleware.metrics import MetricsMiddleware, MetricsRegistry
+
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    secret = tmp_path / "secret.tif"
+    secret.write_bytes(b"x" * 100)
+    monkeypatch.setenv("GDAL_MCP_WORKSPACES", str(workspace))
+
+    registry = MetricsRegistry()
+    middleware = MetricsMiddleware(registry)
+    pipeline = ToolCallPipeline()
+    mock_context.message.name = "raster_info"
+
+    async def tool(ctx):
+        raise AssertionError("denied call must not run")
+
+    async def call_next(ctx):
+        return await pipeline.on_call_tool(ctx, tool)
+
+    async def without_pipeline(ctx):
+        return None
+
+    for path in (str(secret), str(tmp_path / "missing.tif")):
+        mock_context.message.arguments = {"uri": path}
+        with pytest.raises(ToolError, match="denied"):
+            await middleware.on_call_tool(mock_context, call_next)
+    # Without a pipeline the raw argument is never stat'ed either
+    mock_context.message.arguments = {"uri": str(secret)}
+    await middleware.on_call_tool(mock_context, without_pipeline)
+
+    assert registry.snapshot()["tools"]["raster_info"]["bytes_read"] == 0
+
+
+def test_metrics_resource_keys_collapse_file_paths():
+    """Resource metrics are keyed by URI family, not by each file."""
+    from src.middleware.metrics import _resource_key
+
+    assert _resource_key("metadata://data/dem.tif/raster") == "metadata://{file}/raster"
+    assert _resource_key("catalog://workspace/all/sub?limit=5") == "catalog://workspace/all"
+    assert _resource_key("metrics://server") == "metrics://server"
+
+
+@pytest.mark.asyncio
+async def test_memory_budget_admits_downgrades_and_queues():
+    """Calls run in full when they fit, downgrade when a cheaper mode fits, else wait."""
+    import asyncio
+
+    from src.shared.budget import Estimate, MemoryBudget
+
+    budget = MemoryBudget(total_bytes=1000, queue_timeout=5)
+
+    first = await budget.admit(Estimate(600))
+    assert (first.mode, first.reserved_bytes) == ("full", 600)
+
+    second = await budget.admit(Estimate(600, reduced_bytes=100, reduced_mode="sampled"))
+    assert (second.mode, second.reserved_bytes) == ("sampled", 100)
+
+    waiting = asyncio.create_task(budget.admit(Estimate(950)))
+    await asyncio.sleep(0.01)
+    assert budget.queued == 1 and not waiting.done()
+
+    budget.release(first)
+    await asyncio.sleep(0)
+    assert budget.queued == 1  # 100 + 950 still exceeds the budget
+    budget.release(second)
+    third = await waiting
+    assert third.mode == "full"
+    assert third.queued_seconds > 0
+    assert budget.in_use == 950
+
+    budget.release(third)
+    held = await budget.admit(Estimate(1000))
+    budget.queue_timeout = 0.01
+    with pytest.raises(ToolError, match="memory is busy"):
+        await budget.admit(Estimate(10))
+    budget.release(held)
+    assert budget.in_use == 0 and budget.queued == 0
+
+
+@pytest.mark.asyncio
+async def test_admission_middleware_downgrades_raster_convert(mock_context, tmp_path, monkeypatch):
+    """A raster too large for the budget is copied in strips and the result reports it."""
+    import numpy as np
+    import rasterio
+    from fastmcp.tools.tool import ToolResult
+    from mcp.types import TextContent
+    from rasterio.transform import from_origin
+
+    from src.middleware import AdmissionMiddleware, ToolCallPipeline
+    from src.shared.budget import MemoryBudget
+    from src.tools.raster.convert import _convert
+
+    # 20 x 600 uint8: 12,000 bytes per band, 5,120 per 256-row strip
+    source = tmp_path / "tall.tif"
+    data = np.arange(20 * 600, dtype=np.uint32).reshape(1, 600, 20).astype(np.uint8)
+    profile = {"driver": "GTiff", "width": 20, "height": 600, "count": 1, "dtype": "uint8"}
+    with rasterio.open(
+        source, "w", crs="EPSG:4326", transform=from_origin(0, 60, 0.1, 0.1), **profile
+    ) as dst:
+        dst.write(data)
+
+    monkeypatch.setattr("src.middleware.reflection_transform.get_store", MagicMock())
+    output = tmp_path / "converted.tif"
+    mock_context.message.name = "raster_convert"
+    mock_context.message.arguments = {"uri": str(source), "output": str(output)}
+
+    async def run_tool(ctx):
+        result = await _convert(str(source), str(output))
+        return ToolResult(
+            content=[TextContent(type="text", text="converted")],
+            structured_content=result.model_dump(),
+        )
+
+    admission = AdmissionMiddleware(MemoryBudget(total_bytes=6000, queue_timeout=1))
+    result = await ToolCallPipeline(stages=()).on_call_tool(
+        mock_context, lambda ctx: admission.on_call_tool(ctx, run_tool)
+    )
+
+    assert result.structured_content["admission"]["mode"] == "windowed"
+    assert result.structured_content["admission"]["queued_seconds"] == 0
+    assert result.content == [TextContent(type="text", text="converted")]
+    assert admission.budget.in_use == 0
+    with rasterio.open(source) as src, rasterio.open(output) as dst:
+        assert (src.read() == dst.read()).all()
@@ -4,17 +4,21 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from src.models.raster.convert import Options as ConvertOptions
 from src.models.raster.reproject import Params as ReprojectParams
 from src.models.raster.stats import Params as StatsParams
+from src.models.raster.zonal_stats import Params as ZonalParams
+from src.tools.raster.clip import _clip
 from src.tools.raster.convert import _convert
 
 # Import the core logic functions (not the @mcp.tool wrapped versions)
 from src.tools.raster.info import _info
 from src.tools.raster.reproject import _reproject
 from src.tools.raster.stats import _stats
+from src.tools.raster.zonal_stats import _zonal_stats
 
 
 @pytest.mark.asyncio
@@ -215,3 +219,369 @@ async def test_raster_stats_percentiles(tiny_raster_gtiff: Path):
     band_stat = result.band_stats[0]
     assert band_stat.median is not None
     # Custom percentiles computed internally
+
+
+def test_raster_stats_decimated_read_scales_counts(tiny_raster_with_nodata: Path):
+    """Sampled mode reads a decimated band but reports counts for the full raster."""
+    from src.shared.raster.stats import stats as extract_raster_stats
+
+    full = extract_raster_stats(str(tiny_raster_with_nodata))
+    sampled = extract_raster_stats(str(tiny_raster_with_nodata), {"max_pixels": 25})
+
+    band = sampled["band_stats"][0]
+    assert sampled["total_pixels"] == full["total_pixels"] == 100
+    assert band["valid_count"] + band["nodata_count"] == 100
+    assert band["valid_count"] == full["band_stats"][0]["valid_count"] == 96
+    assert full["band_stats"][0]["min"] <= band["min"] <= band["max"] <= 254
+
+
+@pytest.mark.asyncio
+async def test_raster_reproject_records_stage_spans(tiny_raster_gtiff: Path, test_data_dir: Path):
+    """Reprojection records one trace with open, transform, warp, flush and stat spans."""
+    import json
+
+    from src.shared.tracing import JsonlExporter, reset_tracing, set_exporter
+
+    trace_file = test_data_dir / "spans.jsonl"
+    exporter = JsonlExporter(trace_file)
+    set_exporter(exporter)
+    try:
+        await _reproject(
+            uri=str(tiny_raster_gtiff),
+            output=str(test_data_dir / "traced.tif"),
+            params=ReprojectParams(dst_crs="EPSG:3857", resampling="nearest"),
+        )
+    finally:
+        reset_tracing()
+
+    spans = exporter.spans()
+    by_name = {s.name: s for s in spans}
+    root = by_name["raster_reproject"]
+    assert {"open", "transform", "create", "warp", "flush", "stat"} <= set(by_name)
+    assert {s.trace_id for s in spans} == {root.trace_id}
+    assert root.parent_span_id is None
+    assert by_name["warp"].attributes == {"band": 1}
+    assert all(s.duration <= root.duration for s in spans)
+
+    lines = [json.loads(line) for line in trace_file.read_text().splitlines()]
+    assert [line["name"] for line in lines] == [s.name for s in spans]
+    assert lines[-1]["status"] == {"code": 1}
+
+
+def _write_zones(path: Path, zones: list[tuple[str, tuple[float, float, float, float]]], crs: str):
+    import fiona
+    import shapely
+    from pyproj import Transformer
+
+    to_crs = Transformer.from_crs("EPSG:4326", crs, always_xy=True)
+    schema = {"geometry": "Polygon", "properties": {"landuse": "str"}}
+    with fiona.open(path, "w", driver="GPKG", schema=schema, crs=crs) as dst:
+        for name, bbox in zones:
+            geom = shapely.transform(
+                shapely.box(*bbox), lambda xy: np.column_stack(to_crs.transform(*xy.T))
+            )
+            dst.write({"geometry": shapely.geometry.mapping(geom), "properties": {"landuse": name}})
+
+
+@pytest.mark.asyncio
+async def test_raster_zonal_stats_matches_per_zone_numpy(test_data_dir: Path):
+    """Block-parallel aggregation equals direct NumPy statistics per zone."""
+    import rasterio
+    from rasterio.transform import from_origin
+
+    rng = np.random.default_rng(7)
+    data = rng.normal(100, 15, size=(2, 64, 64)).astype(np.float32)
+    data[0, :3, :] = -9999
+    data[1, 10, 10] = np.nan
+    raster = test_data_dir / "tiled.tif"
+    with rasterio.open(
+        raster,
+        "w",
+        driver="GTiff",
+        width=64,
+        height=64,
+        count=2,
+        dtype="float32",
+        crs="EPSG:4326",
+        transform=from_origin(0, 64, 1, 1),
+        nodata=-9999,
+        tiled=True,
+        blockxsize=16,
+        blockysize=16,
+    ) as dst:
+        dst.write(data)
+
+    # Two features form zone "farm"; zones are stored in another CRS
+    zones = test_data_dir / "zones.gpkg"
+    _write_zones(
+        zones,
+        [("farm", (0, 0, 20, 64)), ("forest", (20, 30, 64, 64)), ("farm", (40, 0, 50, 10))],
+        "EPSG:3857",
+    )
+
+    cols, rows = np.meshgrid(np.arange(64) + 0.5, 64 - (np.arange(64) + 0.5))
+    expected_masks = {
+        "farm": (cols < 20) | ((cols > 40) & (cols < 50) & (rows < 10)),
+        "forest": (cols > 20) & (rows > 30),
+    }
+
+    for workers in (1, 4):
+        result = await _zonal_stats(
+            str(raster), str(zones), ZonalParams(zone_field="landuse", workers=workers)
+        )
+
+        assert [zone.zone for zone in result.zones] == ["farm", "forest"]
+        assert result.total_pixels == 64 * 64
+        for zone in result.zones:
+            assert isinstance(zone.zone, str)
+            for stats in zone.band_stats:
+                band = data[stats.band - 1]
+                values = band[expected_masks[zone.zone] & (band != -9999) & ~np.isnan(band)]
+                assert stats.count == values.size
+                assert stats.sum == pytest.approx(values.sum(dtype=np.float64))
+                assert stats.min == pytest.approx(values.min())
+                assert stats.max == pytest.approx(values.max())
+                assert stats.mean == pytest.approx(values.mean(dtype=np.float64))
+                assert stats.std == pytest.approx(values.std(dtype=np.float64))
+
+
+@pytest.mark.asyncio
+async def test_raster_zonal_stats_per_feature_and_empty_zone(
+    tiny_raster_with_nodata: Path, test_data_dir: Path
+):
+    """Without zone_field each feature is a zone; zones off the raster report no pixels."""
+    zones = test_data_dir / "zones.gpkg"
+    _write_zones(zones, [("a", (0, 8, 2, 10)), ("b", (50, 50, 60, 60))], "EPSG:4326")
+
+    result = await _zonal_stats(str(tiny_raster_with_nodata), str(zones))
+
+    assert [zone.zone for zone in result.zones] == [0, 1]
+    # Top-left 2x2 corner is entirely nodata
+    assert result.zones[0].band_stats[0].count == 0
+    assert result.zones[0].band_stats[0].mean is None
+    assert result.zones[1].band_stats[0].count == 0
+    assert result.zoned_pixels == 4
+
+
+@pytest.mark.asyncio
+async def test_raster_clip_bbox_in_other_crs(tiny_raster_gtiff: Path, test_data_dir: Path):
+    """A bbox in another CRS becomes a whole-pixel window; only that window is copied."""
+    import rasterio
+    from pyproj import Transformer
+
+    from src.models.raster.clip import Params as ClipParams
+
+    to_3857 = Transformer.from_crs("EPSG:4326", "EPSG:3857", always_xy=True)
+    left, bottom = to_3857.transform(2.5, 3.2)
+    right, top = to_3857.transform(5.0, 6.0)
+    output = test_data_dir / "clip.tif"
+
+    result = await _clip(
+        str(tiny_raster_gtiff),
+        str(output),
+        ClipParams(bounds=[left, bottom, right, top], bounds_crs="EPSG:3857"),
+    )
+
+    # Raster rows count down from y=10: y 3.2..6.0 -> rows 4..6, x 2.5..5.0 -> cols 2..4
+    assert result.window.model_dump() == {"col_off": 2, "row_off": 4, "width": 3, "height": 3}
+    assert result.bounds == pytest.approx([2.0, 3.0, 5.0, 6.0])
+    with rasterio.open(output) as dst:
+        expected = np.arange(100, dtype=np.uint8).reshape(10, 10)[4:7, 2:5]
+        np.testing.assert_array_equal(dst.read(1), expected)
+
+
+@pytest.mark.asyncio
+async def test_raster_clip_mask_to_tiff_and_vrt(tiny_raster_gtiff: Path, test_data_dir: Path):
+    """Mask clips blank pixels outside the polygon; VRT output references the source."""
+    import rasterio
+
+    from src.models.raster.clip import Params as ClipParams
+
+    zones = test_data_dir / "mask.gpkg"
+    _write_zones(zones, [("a", (1, 1, 4, 4)), ("b", (6, 1, 9, 4))], "EPSG:4326")
+    source = np.arange(100, dtype=np.uint8).reshape(10, 10)[6:9, 1:9]
+    inside = np.zeros_like(source, dtype=bool)
+    inside[:, :3] = inside[:, 5:] = True
+
+    tif = await _clip(
+        str(tiny_raster_gtiff), str(test_data_dir / "m.tif"), ClipParams(mask=str(zones))
+    )
+    vrt = await _clip(
+        str(tiny_raster_gtiff), str(test_data_dir / "m.vrt"), ClipParams(mask=str(zones))
+    )
+
+    assert tif.clip_method == vrt.clip_method == "mask"
+    assert vrt.driver == "VRT"
+    assert vrt.output.size is not None
+    assert vrt.output.size < 10_000
+    with rasterio.open(test_data_dir / "m.tif") as dst:
+        np.testing.assert_array_equal(dst.read(1), np.where(inside, source, 255))
+    with rasterio.open(test_data_dir / "m.vrt") as dst:
+        np.testing.assert_array_equal(dst.read(1), source)
+        np.testing.assert_array_equal(dst.read_masks(1) > 0, inside)
+    assert vrt.bounds == tif.bounds
+
+
+@pytest.mark.asyncio
+async def test_raster_clip_rejects_extent_outside_raster(
+    tiny_raster_gtiff: Path, test_data_dir: Path
+):
+    from fastmcp.exceptions import ToolError
+
+    from src.models.raster.clip import Params as ClipParams
+
+    with pytest.raises(ToolError, match="does not intersect"):
+        await _clip(
+            str(tiny_raster_gtiff),
+            str(test_data_dir / "x.tif"),
+            ClipParams(bounds=[20, 20, 30, 30]),
+        )
+
+
+@pytest.mark.asyncio
+async def test_raster_clip_rejects_nodata_outside_dtype(tiny_raster_rgb: Path, test_data_dir: Path):
+    from fastmcp.exceptions import ToolError
+
+    from src.models.raster.clip import Params as ClipParams
+
+    zones = test_data_dir / "mask.gpkg"
+    _write_zones(zones, [("a", (1, 1, 4, 4))], "EPSG:4326")
+    for nodata in (0.5, -1, 256):
+        with pytest.raises(ToolError, match="uint8"):
+            await _clip(
+                str(tiny_raster_rgb),
+                str(test_data_dir / "n.tif"),
+                ClipParams(mask=str(zones), nodata=nodata),
+            )
+    assert not (test_data_dir / "n.tif").exists()
+
+
+@pytest.mark.asyncio
+async def test_raster_clip_vrt_keeps_foreign_mask_sidecar(
+    tiny_raster_gtiff: Path, test_data_dir: Path
+):
+    """A VRT mask clip replaces its own sidecar but not an unrelated file."""
+    from fastmcp.exceptions import ToolError
+
+    from src.models.raster.clip import Params as ClipParams
+
+    zones = test_data_dir / "mask.gpkg"
+    _write_zones(zones, [("a", (1, 1, 4, 4))], "EPSG:4326")
+    params = ClipParams(mask=str(zones))
+    sidecar = test_data_dir / "own.mask.tif"
+
+    await _clip(str(tiny_raster_gtiff), str(test_data_dir / "own.vrt"), params)
+    await _clip(str(tiny_raster_gtiff), str(test_data_dir / "own.vrt"), params)
+    assert sidecar.exists()
+
+    sidecar.write_bytes(b"keep")
+    (test_data_dir / "own.vrt").unlink()
+    with pytest.raises(ToolError, match="already exists"):
+        await _clip(str(tiny_raster_gtiff), str(test_data_dir / "own.vrt"), params)
+    assert sidecar.read_bytes() == b"keep"
+
+
+@pytest.mark.asyncio
+async def test_raster_sample_matches_direct_indexing(test_data_dir: Path):
+    """Reprojected points read each block once and match direct array lookups."""
+    import rasterio
+    from pyproj import Transformer
+    from rasterio.transform import from_origin
+
+    from src.models.raster.sample import Params as SampleParams
+    from src.tools.raster.sample import _sample
+
+    rng = np.random.default_rng(11)
+    data = rng.integers(0, 1000, size=(2, 64, 64)).astype(np.int16)
+    data[0, 5, 7] = -1
+    raster = test_data_dir / "tiled.tif"
+    with rasterio.open(
+        raster,
+        "w",
+        driver="GTiff",
+        width=64,
+        height=64,
+        count=2,
+        dtype="int16",
+        crs="EPSG:4326",
+        transform=from_origin(0, 64, 1, 1),
+        nodata=-1,
+        tiled=True,
+        blockxsize=16,
+        blockysize=16,
+    ) as dst:
+        dst.write(data)
+
+    rows = rng.integers(0, 64, size=200)
+    cols = rng.integers(0, 64, size=200)
+    rows[0], cols[0] = 5, 7
+    lon, lat = cols + 0.5, 64 - (rows + 0.5)
+    to_3857 = Transformer.from_crs("EPSG:4326", "EPSG:3857", always_xy=True)
+    xs, ys = to_3857.transform(np.r_[lon, 100.5], np.r_[lat, 10.5])
+
+    result = await _sample(
+        str(raster),
+        SampleParams(points=np.column_stack([xs, ys]).tolist(), points_crs="EPSG:3857"),
+    )
+
+    assert result.point_count == 201
+    assert result.inside_count == 200
+    assert result.blocks_read == len(set(zip(rows // 16, cols // 16, strict=True)))
+    for i, sample in enumerate(result.samples[:200]):
+        assert (sample.row, sample.col) == (rows[i], cols[i])
+        expected = [int(v) for v in data[:, rows[i], cols[i]]]
+        assert sample.values == [None if v == -1 and b == 0 else v for b, v in enumerate(expected)]
+    assert result.samples[0].values[0] is None
+    assert result.samples[-1].row is None
+    assert result.samples[-1].values == [None, None]
+
+
+@pytest.mark.asyncio
+async def test_raster_sample_points_file_to_csv(tiny_raster_gtiff: Path, test_data_dir: Path):
+    """Points from a vector file keep their ids; CSV output replaces inline samples."""
+    import csv
+
+    import fiona
+
+    from src.models.raster.sample import Params as SampleParams
+    from src.tools.raster.sample import _sample
+
+    points = test_data_dir / "points.gpkg"
+    schema = {"geometry": "Point", "properties": {"site": "str"}}
+    with fiona.open(points, "w", driver="GPKG", schema=schema, crs="EPSG:4326") as dst:
+        for site, xy in [("a", (2.5, 7.5)), ("b", (9.9, 0.1)), ("c", (-1.0, 5.0))]:
+            dst.write(
+                {"geometry": {"type": "Point", "coordinates": xy}, "properties": {"site": site}}
+            )
+
+    output = test_data_dir / "samples.csv"
+    result = await _sample(
+        str(tiny_raster_gtiff),
+        SampleParams(points_file=str(points), id_field="site"),
+        str(output),
+    )
+
+    assert result.samples == []
+    assert result.output is not None
+    assert result.output.driver == "CSV"
+    with output.open() as handle:
+        rows = list(csv.DictReader(handle))
+    # Rows count down from y=10: (2.5, 7.5) -> row 2, col 2 -> value 22
+    assert [(r["id"], r["row"], r["col"], r["band_1"]) for r in rows] == [
+        ("a", "2", "2", "22.0"),
+        ("b", "9", "9", "99.0"),
+        ("c", "", "", ""),
+    ]
+
+
+def test_raster_sample_params_require_one_point_source():
+    from pydantic import ValidationError
+
+    from src.models.raster.sample import Params as SampleParams
+
+    with pytest.raises(ValidationError):
+        SampleParams()
+    with pytest.raises(ValidationError):
+        SampleParams(points=[[1.0, 2.0]], points_file="points.gpkg")
+    with pytest.raises(ValidationError):
+        SampleParams(points=[[1.0, 2.0, 3.0]])
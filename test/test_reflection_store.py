@@ -3,7 +3,8 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-from src.middleware.reflection_store import DiskStore
+from src.middleware.reflection_sqlite import SQLiteStore
+from src.middleware.reflection_store import DiskStore, IndexedDiskStore
 from src.prompts.justification import Alternative, Choice, Justification
 
 
@@ -47,3 +48,110 @@ def test_disk_store_missing(tmp_path: Path) -> None:
     store = DiskStore(root=str(tmp_path / "justifications"))
     missing = store.get(str(tmp_path / "justifications" / "missing.json"))
     assert missing is None
+
+
+def test_indexed_store_round_trip(tmp_path: Path) -> None:
+    store = IndexedDiskStore(root=str(tmp_path / "justifications"))
+    try:
+        path = store.put("hash123", make_sample_justification(), "crs_datum")
+
+        assert store.has("hash123", "crs_datum")
+        assert not store.has("hash123", "resampling")
+        loaded = store.get(str(path))
+        assert loaded is not None
+        assert loaded["confidence"] == "medium"
+
+        store.flush()
+        assert path.exists()
+        assert json.loads(path.read_text(encoding="utf-8"))["confidence"] == "medium"
+    finally:
+        store.close()
+
+
+def test_indexed_store_loads_existing_and_sees_other_writers(tmp_path: Path) -> None:
+    root = str(tmp_path / "justifications")
+    DiskStore(root=root).put("existing", make_sample_justification(), "crs_datum")
+
+    store = IndexedDiskStore(root=root)
+    try:
+        assert store.has("existing", "crs_datum")
+        assert not store.has("later", "crs_datum")
+
+        # Another process writing to the shared directory
+        DiskStore(root=root).put("later", make_sample_justification(), "crs_datum")
+
+        assert store.has("later", "crs_datum")
+    finally:
+        store.close()
+
+
+def test_indexed_store_drops_deleted_entries(tmp_path: Path) -> None:
+    root = str(tmp_path / "justifications")
+    disk = DiskStore(root=root)
+    first = disk.put("first", make_sample_justification(), "crs_datum")
+    second = disk.put("second", make_sample_justification(), "crs_datum")
+
+    store = IndexedDiskStore(root=root)
+    try:
+        # A read that finds the file gone drops the key
+        first.unlink()
+        assert store.get(str(first)) is None
+        assert not store.has("first", "crs_datum")
+
+        # Re-listing after another process changed the directory drops it too
+        second.unlink()
+        assert not store.has("missing", "crs_datum")
+        assert not store.has("second", "crs_datum")
+    finally:
+        store.close()
+
+
+def test_sqlite_store_round_trip(tmp_path: Path) -> None:
+    store = SQLiteStore(str(tmp_path / "justifications.sqlite3"))
+    path = store.put("hash123", make_sample_justification(), "crs_datum")
+
+    assert store.has("hash123", "crs_datum")
+    assert not store.has("hash123", "resampling")
+    loaded = store.get(str(path))
+    assert loaded is not None
+    assert loaded["intent"] == "Preserve distance accuracy for hydrologic flow calculations"
+    assert "_meta" in loaded
+
+    written = store.put_many(
+        [
+            ("a", make_sample_justification(), "resampling"),
+            ("b", make_sample_justification(), "resampling"),
+        ]
+    )
+    assert written == 2
+    assert store.count() == 3
+
+
+def test_sqlite_store_ttl_and_prune(tmp_path: Path) -> None:
+    store = SQLiteStore(str(tmp_path / "justifications.sqlite3"), ttl_seconds=3600)
+    path = store.put("fresh", make_sample_justification(), "crs_datum")
+    store._connect().execute(
+        "UPDATE justifications SET created_at = created_at - 7200 WHERE hash = 'fresh'"
+    )
+
+    # Expired entries are misses on every read, before any prune runs
+    assert not store.has("fresh", "crs_datum")
+    assert store.get(str(path)) is None
+    assert store.prune() == 1
+    assert store.count() == 0
+
+
+def test_sqlite_store_migrates_directory_layout(tmp_path: Path) -> None:
+    root = tmp_path / "justifications"
+    disk = DiskStore(root=str(root))
+    disk.put("one", make_sample_justification(), "crs_datum")
+    disk.put("two", make_sample_justification(), "resampling")
+
+    store = SQLiteStore(str(tmp_path / "justifications.sqlite3"))
+    assert store.migrate_from_directory(str(root)) == 2
+    assert store.has("one", "crs_datum")
+    assert store.has("two", "resampling")
+
+    # Re-running keeps existing rows
+    store.migrate_from_directory(str(root))
+    assert store.count() == 2
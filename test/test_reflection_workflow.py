@@ -268,6 +268,36 @@ async def test_cache_hit_workflow(tmp_path):
     assert result == "success"
 
 
+@pytest.mark.asyncio
+async def test_decorator_trusts_pipeline_verification(monkeypatch):
+    """Reflections the pipeline already verified are not hashed or looked up again."""
+    from src.middleware import preflight
+    from src.middleware.tool_call import _CURRENT_CALL, ToolCall
+
+    def fail(*args, **kwargs):
+        raise AssertionError("verified reflections must not be re-hashed")
+
+    @preflight.requires_reflection(
+        {
+            "prompt_name": "justify_crs_selection",
+            "domain": "crs_datum",
+            "args_fn": lambda _args: {"target_crs": "EPSG:3857"},
+        }
+    )
+    async def mock_verified_tool() -> str:
+        return "success"
+
+    monkeypatch.setattr(preflight, "_build_spec_state", fail)
+    monkeypatch.setattr(preflight, "get_store", fail)
+    call = ToolCall(name="mock_verified_tool", arguments={})
+    call.reflection_hashes["crs_datum"] = "sha256:verified"
+    token = _CURRENT_CALL.set(call)
+    try:
+        assert await mock_verified_tool() == "success"
+    finally:
+        _CURRENT_CALL.reset(token)
+
+
 def test_invalid_justification_schema():
     """Verify pydantic validates justification schema correctly."""
 
@@ -297,3 +327,26 @@ def test_low_confidence_accepted() -> None:
     store = get_store()
     path = store.put("sha256:test_low", just, "test_domain")
     assert path.exists()
+
+
+def test_prompt_hash_computed_once(monkeypatch):
+    """Verify prompt sources are read once and then served from the cache."""
+
+    from src.middleware import preflight
+
+    calls: list[str] = []
+
+    def fetch() -> str:
+        calls.append("justify_crs_selection")
+        return "def register(mcp): ..."
+
+    monkeypatch.setitem(preflight._PROMPT_SOURCE_FETCHERS, "justify_crs_selection", fetch)
+    preflight.reset_prompt_hash_cache()
+    try:
+        first = preflight._hash_prompt_content("justify_crs_selection")
+        second = preflight._hash_prompt_content("justify_crs_selection")
+    finally:
+        preflight.reset_prompt_hash_cache()
+
+    assert first == second
+    assert calls == ["justify_crs_selection"]
@@ -0,0 +1,116 @@
+"""Tests for lazy heavy imports and the startup profile."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+from src import startup
+from src.startup import HEAVY_MODULES, StartupProfile, format_profile, parse_importtime
+
+
+def test_server_import_defers_heavy_libraries():
+    """Registering every tool and resource loads no GDAL or array/geometry library."""
+    code = (
+        "import json, sys; import src.server; "
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert json.loads(proc.stdout.strip().splitlines()[-1]) == []
+
+
+def test_parse_importtime_and_format_profile():
+    """importtime output is parsed into per-module records and summarised."""
+    stderr = "\n".join(
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:       100 |        100 |     fastmcp.tools",
+            "import time:       200 |        300 |   fastmcp",
+            "import time:        50 |        350 | src.server",
+            "unrelated warning line",
+        ]
+    )
+
+    records = parse_importtime(stderr)
+
+    assert [(r.module, r.depth) for r in records] == [
+        ("fastmcp.tools", 2),
+        ("fastmcp", 1),
+        ("src.server", 0),
+    ]
+    assert records[2].cumulative_seconds == 350e-6
+
+    profile = StartupProfile(
+        server_seconds=0.5,
+        deferred_seconds=0.7,
+        heavy_loaded=[],
+        tools=11,
+        resources=17,
+        imports=records,
+    )
+    package, seconds = profile.by_package()[0]
+    assert package == "fastmcp"
+    assert seconds == pytest.approx(300e-6)
+    text = format_profile(profile)
+    assert "11 tools" in text
+    assert "Heavy libraries loaded at startup: none" in text
+
+
+def test_warmup_runs_stages_and_reports_health(tmp_path, monkeypatch):
+    """Warm-up completes every stage, fills the catalog cache and flips health to ready."""
+    from src.config import reset_workspaces_cache
+    from src.shared.catalog import clear_cache, scanner
+
+    monkeypatch.setenv("GDAL_MCP_WORKSPACES", str(tmp_path))
+    reset_workspaces_cache()
+    (tmp_path / "dem.tif").write_bytes(b"")
+    (tmp_path / "roads.gpkg").write_bytes(b"")
+    clear_cache()
+
+    warmup = startup.Warmup()
+    monkeypatch.setattr(startup, "_WARMUP", warmup)
+    assert startup.health()["status"] == "warming"
+
+    assert warmup.start().wait(timeout=60)
+
+    snapshot = warmup.snapshot()
+    assert all(stage["status"] == "done" for stage in snapshot["stages"].values())
+    assert snapshot["stages"]["catalog"]["detail"] == {"entries": 2}
+    assert snapshot["stages"]["drivers"]["detail"]["gdal_drivers"] > 0
+    assert scanner._CACHE
+    report = startup.health()
+    assert report["status"] == "ready"
+    assert "rasterio" in report["loaded_libraries"]
+    clear_cache()
+    reset_workspaces_cache()
+
+
+def test_warmup_failure_is_degraded_not_fatal(monkeypatch):
+    """A failing stage is recorded and later stages still run."""
+
+    def broken() -> dict:
+        raise RuntimeError("no PROJ database")
+
+    warmup = startup.Warmup(stages=(("proj", broken), ("noop", dict)))
+    monkeypatch.setattr(startup, "_WARMUP", warmup)
+    assert warmup.start().wait(timeout=10)
+
+    report = startup.health()
+    assert report["status"] == "degraded"
+    stages = report["warmup"]["stages"]
+    assert stages["proj"]["error"] == "RuntimeError: no PROJ database"
+    assert stages["noop"]["status"] == "done"
+
+
+def test_health_is_ready_without_warm_start(monkeypatch):
+    monkeypatch.setattr(startup, "_WARMUP", None)
+
+    report = startup.health()
+
+    assert report["status"] == "ready"
+    assert report["warm_start"] is False
+    assert report["warmup"] is None
@@ -44,3 +44,536 @@ async def test_vector_info_bounds(tiny_vector_geojson: Path):
         minx, miny, maxx, maxy = result.bounds
         assert minx <= maxx
         assert miny <= maxy
+
+
+@pytest.mark.asyncio
+async def test_vector_clip_bbox_pushdown(
+    tiny_vector_geojson: Path, test_data_dir: Path, monkeypatch
+):
+    """vector.clip passes the clip bounds to the OGR read as a spatial filter."""
+    import pyogrio.raw
+
+    from src.models.vector.clip import Params as ClipParams
+    from src.tools.vector.clip import _clip
+
+    read_kwargs = []
+    original_open = pyogrio.raw.open_arrow
+
+    def spy_open(path, **kwargs):
+        read_kwargs.append(kwargs)
+        return original_open(path, **kwargs)
+
+    monkeypatch.setattr(pyogrio.raw, "open_arrow", spy_open)
+
+    output = test_data_dir / "clipped.gpkg"
+    result = await _clip(
+        str(tiny_vector_geojson),
+        str(output),
+        ClipParams(bounds=[-0.5, -0.5, 1.5, 1.5]),
+    )
+
+    assert result.feature_count == 2
+    assert result.clip_method == "bbox"
+    assert read_kwargs[0]["bbox"] == (-0.5, -0.5, 1.5, 1.5)
+
+
+@pytest.mark.asyncio
+async def test_vector_clip_mask(tiny_vector_geojson: Path, test_data_dir: Path):
+    """vector.clip keeps only features intersecting the mask geometry."""
+    import geopandas as gpd
+    import shapely
+
+    from src.models.vector.clip import Params as ClipParams
+    from src.tools.vector.clip import _clip
+
+    mask_path = test_data_dir / "mask.geojson"
+    mask = gpd.GeoDataFrame(geometry=[shapely.box(-2.0, 0.0, 0.5, 1.0)], crs="EPSG:4326")
+    mask.to_file(mask_path, driver="GeoJSON")
+
+    output = test_data_dir / "masked.gpkg"
+    result = await _clip(str(tiny_vector_geojson), str(output), ClipParams(mask=str(mask_path)))
+
+    assert result.feature_count == 2
+    assert result.clip_method == "mask"
+
+
+@pytest.mark.asyncio
+async def test_vector_clip_empty_mask_writes_empty_layer(
+    tiny_vector_geojson: Path, test_data_dir: Path
+):
+    """An empty mask yields a valid 0-feature output with the source schema and CRS."""
+    import geopandas as gpd
+    import pyogrio
+
+    from src.models.vector.clip import Params as ClipParams
+    from src.tools.vector.clip import _clip
+
+    mask_path = test_data_dir / "empty_mask.gpkg"
+    gpd.GeoDataFrame(geometry=gpd.GeoSeries([], crs="EPSG:4326")).to_file(mask_path)
+
+    output = test_data_dir / "empty.gpkg"
+    result = await _clip(str(tiny_vector_geojson), str(output), ClipParams(mask=str(mask_path)))
+
+    info = pyogrio.read_info(output)
+    assert result.feature_count == 0
+    assert info["features"] == 0
+    assert list(info["fields"]) == list(pyogrio.read_info(tiny_vector_geojson)["fields"])
+    assert info["crs"] == "EPSG:4326"
+
+
+def test_clip_to_mask_matches_naive_intersection():
+    """STRtree mask clipping yields the same features and areas as a full intersection."""
+    import numpy as np
+    import shapely
+
+    from src.shared.vector.clip import _clip_to_mask
+
+    rng = np.random.default_rng(0)
+    geoms = shapely.buffer(shapely.points(rng.uniform(0, 100, (500, 2))), rng.uniform(0.5, 5, 500))
+    mask = shapely.union_all(shapely.buffer(shapely.points(rng.uniform(0, 100, (10, 2))), 8))
+
+    kept, clipped = _clip_to_mask(geoms, mask)
+
+    expected = np.flatnonzero(shapely.intersects(geoms, mask))
+    np.testing.assert_array_equal(kept, expected)
+    np.testing.assert_allclose(
+        shapely.area(clipped), shapely.area(shapely.intersection(geoms[kept], mask))
+    )
+
+
+@pytest.mark.parametrize("arrow", [True, False])
+def test_stream_vector_batches_match_whole_layer(test_data_dir: Path, monkeypatch, arrow: bool):
+    """stream_vector writes the same features in small batches and in the fallback path."""
+    import geopandas as gpd
+    import numpy as np
+    import pyogrio
+    import shapely
+
+    from src.shared.vector import stream
+
+    if not arrow:
+        monkeypatch.setattr(stream, "arrow_streaming_available", lambda: False)
+
+    src = test_data_dir / "points.gpkg"
+    gpd.GeoDataFrame(
+        {"id": np.arange(10), "name": [f"p{i}" for i in range(10)]},
+        geometry=shapely.points(np.arange(10.0), np.arange(10.0)),
+        crs="EPSG:3857",
+    ).to_file(src)
+
+    def buffer_low_x(geoms: np.ndarray) -> np.ndarray:
+        # None marks the rows to drop
+        out = np.full(len(geoms), None, dtype=object)
+        keep = shapely.get_x(geoms) < 7
+        out[keep] = shapely.buffer(geoms[keep], 1.0)
+        return out
+
+    out = test_data_dir / "buffered.gpkg"
+    result = stream.stream_vector(
+        str(src),
+        out,
+        buffer_low_x,
+        drop_empty=True,
+        batch_size=3,
+    )
+
+    written = pyogrio.read_dataframe(out)
+    assert result.feature_count == 7
+    assert result.batches == (4 if arrow else 1)
+    assert result.geometry_type == "Polygon"
+    assert written["id"].tolist() == list(range(7))
+    assert written["name"].tolist() == [f"p{i}" for i in range(7)]
+    assert written.crs == "EPSG:3857"
+    np.testing.assert_allclose(
+        written.geometry.area, shapely.area(shapely.buffer(shapely.Point(0, 0), 1.0))
+    )
+
+
+def test_reproject_streaming_matches_geopandas(tiny_vector_geojson: Path, test_data_dir: Path):
+    """Streamed reprojection yields the same coordinates as GeoDataFrame.to_crs."""
+    import numpy as np
+    import pyogrio
+    import shapely
+
+    from src.shared.vector.reproject import reproject
+
+    output = test_data_dir / "reprojected.gpkg"
+    result = reproject(str(tiny_vector_geojson), output, "EPSG:3857")
+
+    expected = pyogrio.read_dataframe(tiny_vector_geojson).to_crs("EPSG:3857")
+    written = pyogrio.read_dataframe(output)
+    assert result["feature_count"] == len(expected)
+    assert written.crs == "EPSG:3857"
+    np.testing.assert_allclose(
+        shapely.get_coordinates(written.geometry.to_numpy()),
+        shapely.get_coordinates(expected.geometry.to_numpy()),
+    )
+
+
+def test_convert_arrow_path_skips_geometry_decoding(
+    tiny_vector_geojson: Path, test_data_dir: Path, monkeypatch
+):
+    """vector.convert passes WKB through untouched when the driver takes Arrow."""
+    import pyogrio
+    import shapely
+
+    from src.shared.vector import stream
+    from src.shared.vector.convert import convert
+
+    def fail(*args, **kwargs):
+        raise AssertionError("geometries should not be materialised")
+
+    monkeypatch.setattr(shapely, "from_wkb", fail)
+    monkeypatch.setattr(pyogrio, "read_dataframe", fail)
+
+    output = test_data_dir / "converted.gpkg"
+    result = convert(str(tiny_vector_geojson), output)
+
+    monkeypatch.undo()
+    assert stream.arrow_write_supported("GPKG")
+    assert result["feature_count"] == 3
+    assert result["geometry_type"] == pyogrio.read_info(tiny_vector_geojson)["geometry_type"]
+    written = pyogrio.read_dataframe(output)
+    assert written.geometry.geom_equals(pyogrio.read_dataframe(tiny_vector_geojson).geometry).all()
+
+
+def test_convert_promotes_mixed_single_and_multi_types(test_data_dir: Path):
+    """Mixed Polygon/MultiPolygon input becomes a MultiPolygon layer, as write_dataframe does."""
+    import geopandas as gpd
+    import numpy as np
+    import pyogrio
+    import shapely
+
+    from src.shared.vector.stream import stream_vector
+
+    polygons = [shapely.box(i, 0, i + 0.5, 1) for i in range(5)]
+    polygons[3] = shapely.MultiPolygon([polygons[3], shapely.box(3, 2, 3.5, 3)])
+    src = test_data_dir / "mixed.geojson"
+    gpd.GeoDataFrame({"id": range(5)}, geometry=polygons, crs="EPSG:4326").to_file(src)
+    assert pyogrio.read_info(src)["geometry_type"] == "Unknown"
+
+    def identity(geoms: np.ndarray) -> np.ndarray:
+        return geoms
+
+    # Pass-through (format conversion) and transformed streams
+    for transform in (None, identity):
+        output = test_data_dir / f"mixed_{transform is None}.gpkg"
+        result = stream_vector(str(src), output, transform, batch_size=2)
+
+        written = pyogrio.read_dataframe(output)
+        assert result.geometry_type == "MultiPolygon"
+        assert pyogrio.read_info(output)["geometry_type"] == "MultiPolygon"
+        assert set(written.geom_type) == {"MultiPolygon"}
+        assert written["id"].tolist() == list(range(5))
+        assert written.geometry.geom_equals(gpd.GeoSeries(polygons)).all()
+
+
+def test_convert_promotes_shapefile_with_multi_parts(test_data_dir: Path):
+    """A shapefile reports Polygon for mixed parts; GPKG and FlatGeobuf get MultiPolygon."""
+    import geopandas as gpd
+    import pyogrio
+    import shapely
+
+    from src.shared.vector.convert import convert
+
+    polygons = [shapely.box(i, 0, i + 0.5, 1) for i in range(5)]
+    polygons[3] = shapely.MultiPolygon([polygons[3], shapely.box(3, 2, 3.5, 3)])
+    src = test_data_dir / "mixed.shp"
+    gpd.GeoDataFrame({"id": range(5)}, geometry=polygons, crs="EPSG:4326").to_file(src)
+    assert pyogrio.read_info(src)["geometry_type"] == "Polygon"
+
+    for driver, suffix in (("GPKG", "gpkg"), ("FlatGeobuf", "fgb")):
+        output = test_data_dir / f"mixed.{suffix}"
+        result = convert(str(src), output, driver=driver)
+
+        # FlatGeobuf's spatial index reorders features
+        written = pyogrio.read_dataframe(output).sort_values("id", ignore_index=True)
+        assert result["geometry_type"] == "MultiPolygon"
+        assert pyogrio.read_info(output)["geometry_type"] == "MultiPolygon"
+        assert set(written.geom_type) == {"MultiPolygon"}
+        assert written.geometry.geom_equals(gpd.GeoSeries(polygons)).all()
+
+
+def test_transform_promotes_multi_parts_in_later_batches(test_data_dir: Path):
+    """A single-typed shapefile whose multi-parts come after the first batch still fits."""
+    import geopandas as gpd
+    import pyogrio
+    import shapely
+
+    from src.shared.vector.stream import stream_vector
+
+    polygons = [shapely.box(i, 0, i + 0.5, 1) for i in range(120)]
+    polygons[80] = shapely.MultiPolygon([polygons[80], shapely.box(80, 2, 80.5, 3)])
+    src = test_data_dir / "late_multi.shp"
+    gpd.GeoDataFrame({"id": range(120)}, geometry=polygons, crs="EPSG:4326").to_file(src)
+
+    for driver, suffix in (("GPKG", "gpkg"), ("FlatGeobuf", "fgb")):
+        output = test_data_dir / f"buffered.{suffix}"
+        result = stream_vector(
+            str(src), output, lambda g: shapely.buffer(g, 0.01), driver=driver, batch_size=50
+        )
+
+        written = pyogrio.read_dataframe(output)
+        assert result.batches == 3
+        assert result.geometry_type == "MultiPolygon"
+        assert pyogrio.read_info(output)["geometry_type"] == "MultiPolygon"
+        assert set(written.geom_type) == {"MultiPolygon"}
+        assert len(written) == 120
+
+
+def test_arrow_write_supported_excludes_geometryless_drivers():
+    """Drivers that store geometry outside a geometry field use the GeoDataFrame path."""
+    from src.shared.vector.stream import arrow_write_supported
+
+    assert not arrow_write_supported("CSV")
+    assert not arrow_write_supported("XLSX")
+
+
+def test_transformer_cache_reuses_and_bounds_entries(monkeypatch):
+    """get_transformer builds each (src, dst, always_xy, aoi) pipeline once and evicts LRU."""
+    from src.shared import projection
+
+    projection.clear_transformer_cache()
+    monkeypatch.setattr(projection, "TRANSFORMER_CACHE_SIZE", 2)
+
+    first = projection.get_transformer("EPSG:4326", "EPSG:3857")
+    assert projection.get_transformer("EPSG:4326", "EPSG:3857") is first
+    assert projection.get_transformer("EPSG:4326", "EPSG:3857", always_xy=False) is not first
+
+    projection.get_transformer("EPSG:4326", "EPSG:32610")
+    assert projection.get_transformer("EPSG:4326", "EPSG:3857") is not first
+    projection.clear_transformer_cache()
+
+
+def test_map_partitioned_preserves_order_across_workers():
+    """Chunked parallel execution reassembles results in input order."""
+    import numpy as np
+    import shapely
+
+    from src.shared.vector.parallel import map_partitioned
+
+    rng = np.random.default_rng(1)
+    geoms = shapely.points(rng.uniform(0, 100, (1000, 2)))
+
+    expected = shapely.buffer(geoms, 2.0, quad_segs=4)
+    result = map_partitioned(
+        lambda g: shapely.buffer(g, 2.0, quad_segs=4), geoms, workers=4, chunk_size=37
+    )
+
+    assert len(result) == len(geoms)
+    assert shapely.equals_exact(result, expected).all()
+
+
+def test_map_partitioned_shares_one_bounded_pool(monkeypatch):
+    """Every worker count runs on the same pool; workers caps chunks in flight."""
+    import threading
+    import time
+
+    import numpy as np
+    import shapely
+
+    from src.shared.vector import parallel
+
+    monkeypatch.setattr(parallel, "default_workers", lambda: 4)
+    monkeypatch.setattr(parallel, "_EXECUTOR", None)
+    geoms = shapely.points(np.arange(64.0), np.arange(64.0))
+    lock = threading.Lock()
+    active = [0]
+    peak = [0]
+
+    def track(chunk: np.ndarray) -> np.ndarray:
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.01)
+        with lock:
+            active[0] -= 1
+        return chunk
+
+    pools = set()
+    for workers in (2, 3, 200):
+        peak[0] = 0
+        parallel.map_partitioned(track, geoms, workers=workers, chunk_size=4)
+        pools.add(id(parallel._executor()))
+        assert peak[0] <= min(workers, 4)
+
+    assert len(pools) == 1
+    executor = parallel._executor()
+    assert executor._max_workers == 4
+    executor.shutdown()
+
+
+def test_simplify_vw_removes_smallest_areas_first():
+    """Visvalingam-Whyatt drops low effective-area vertices and keeps endpoints."""
+    import numpy as np
+    import shapely
+
+    from src.shared.vector.visvalingam import simplify_vw
+
+    line = shapely.LineString(
+        [(0, 0), (1, 0.1), (2, -0.1), (3, 5), (4, 6), (5, 7), (6, 8.1), (7, 9), (8, 9), (9, 9)]
+    )
+    (result,) = simplify_vw(np.array([line]), 0.5)
+
+    assert result.equals(shapely.LineString([(0, 0), (2, -0.1), (3, 5), (7, 9), (9, 9)]))
+
+
+def test_simplify_vw_lockstep_matches_heap(monkeypatch):
+    """Lockstep and heap elimination give identical results on mixed geometries."""
+    import numpy as np
+    import shapely
+
+    from src.shared.vector import visvalingam
+
+    rng = np.random.default_rng(2)
+    # Noisy circles: 50 rings of 64 vertices each
+    angles = np.linspace(0, 2 * np.pi, 64, endpoint=False)
+    radii = 3.0 + rng.normal(0, 0.05, (50, 64))
+    centers = rng.uniform(0, 100, (50, 1, 2))
+    rings = centers + np.stack([radii * np.cos(angles), radii * np.sin(angles)], axis=-1)
+    jittered = shapely.polygons(rings)
+    geoms = np.concatenate(
+        [
+            jittered,
+            [
+                shapely.multipolygons(jittered[:2]),
+                shapely.Point(1, 1),
+                None,
+                shapely.box(0, 0, 10, 10).difference(shapely.box(2, 2, 3, 3)),
+                shapely.LineString(np.column_stack([np.arange(3000.0), rng.normal(0, 1, 3000)])),
+            ],
+        ]
+    )
+
+    lockstep = visvalingam.simplify_vw(geoms, 0.3, preserve_topology=False)
+    monkeypatch.setattr(visvalingam, "LOCKSTEP_MAX_COORDS", 0)
+    heap = visvalingam.simplify_vw(geoms, 0.3, preserve_topology=False)
+
+    present = ~shapely.is_missing(geoms)
+    assert shapely.equals_exact(lockstep[present], heap[present]).all()
+    assert shapely.get_type_id(lockstep).tolist() == shapely.get_type_id(geoms).tolist()
+    assert shapely.get_num_coordinates(lockstep).sum() < shapely.get_num_coordinates(geoms).sum()
+    assert lockstep[-4] is geoms[-4]
+
+
+def test_simplify_coverage_keeps_shared_edges(test_data_dir: Path):
+    """Coverage simplification keeps neighbouring polygons gap-free."""
+    import geopandas as gpd
+    import numpy as np
+    import pyogrio
+    import shapely
+
+    from src.shared.vector.simplify import simplify
+
+    # Two squares sharing a wiggly edge along x=10
+    rng = np.random.default_rng(3)
+    edge = np.column_stack([10 + rng.normal(0, 0.2, 41), np.linspace(0, 10, 41)])
+    left = shapely.Polygon([(0, 0), *edge, (0, 10)])
+    right = shapely.Polygon([(20, 0), (20, 10), *edge[::-1]])
+    src = test_data_dir / "coverage.gpkg"
+    gpd.GeoDataFrame({"name": ["left", "right"]}, geometry=[left, right], crs="EPSG:3857").to_file(
+        src
+    )
+
+    output = test_data_dir / "coverage_simplified.gpkg"
+    result = simplify(str(src), output, tolerance=1.0, method="coverage")
+
+    written = pyogrio.read_dataframe(output)
+    geoms = written.geometry.to_numpy()
+    assert result["feature_count"] == 2
+    assert written["name"].tolist() == ["left", "right"]
+    assert shapely.coverage_is_valid(geoms)
+    assert shapely.get_num_coordinates(geoms).sum() < 2 * len(edge)
+    assert shapely.union_all(geoms).area == pytest.approx(left.area + right.area, rel=1e-2)
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{"preserve_topology": False}, {"workers": 4}, {"chunk_size": 100}, {"chunk_size": 4096}],
+)
+def test_simplify_coverage_rejects_per_geometry_options(options: dict):
+    from pydantic import ValidationError
+
+    from src.models.vector.simplify import Params as SimplifyParams
+
+    SimplifyParams(tolerance=1.0, method="coverage")
+    with pytest.raises(ValidationError, match="does not support"):
+        SimplifyParams(tolerance=1.0, method="coverage", **options)
+
+
+def test_union_partitioned_matches_union_all():
+    """The partitioned cascade unions to the same geometry as a single union_all."""
+    import numpy as np
+    import shapely
+
+    from src.shared.vector.parallel import union_partitioned
+
+    rng = np.random.default_rng(11)
+    points = shapely.points(rng.uniform(0, 100, (500, 2)))
+    geoms = shapely.buffer(points, rng.uniform(0.5, 3, 500))
+
+    expected = shapely.union_all(geoms)
+    result = union_partitioned(geoms, workers=4, chunk_size=16)
+
+    assert result.area == pytest.approx(expected.area, rel=1e-9)
+    assert shapely.symmetric_difference(result, expected).area == pytest.approx(0, abs=1e-6)
+    assert union_partitioned(np.array([None, shapely.Polygon()])).is_empty
+
+
+def test_vector_buffer_dissolve_merges_overlaps(test_data_dir: Path):
+    """Dissolved buffers write one feature per merged polygon."""
+    import geopandas as gpd
+    import pyogrio
+    import shapely
+
+    from src.shared.vector.buffer import buffer
+
+    # Two overlapping points and one isolated point
+    src = test_data_dir / "dissolve_points.gpkg"
+    gpd.GeoDataFrame(
+        {"name": ["a", "b", "c"]},
+        geometry=shapely.points([(0, 0), (1, 0), (10, 10)]),
+        crs="EPSG:3857",
+    ).to_file(src)
+
+    output = test_data_dir / "dissolve_buffers.gpkg"
+    result = buffer(str(src), output, distance=1.0, dissolve=True, chunk_size=1)
+
+    written = pyogrio.read_dataframe(output)
+    assert result["dissolved"] is True
+    assert result["feature_count"] == 2
+    assert len(written) == 2
+    assert written.crs.to_epsg() == 3857
+    assert written.geometry.area.sum() < 3 * shapely.Point(0, 0).buffer(1.0).area
+
+
+def test_vector_results_do_not_reread_output(
+    tiny_vector_geojson: Path, test_data_dir: Path, monkeypatch
+):
+    """Bounds and geometry type are accumulated while writing, not read back."""
+    import pyogrio
+
+    from src.shared.vector.buffer import buffer
+    from src.shared.vector.stream import stream_vector
+
+    output = test_data_dir / "inflight_bounds.gpkg"
+    streamed = stream_vector(str(tiny_vector_geojson), output, lambda geoms: geoms, batch_size=1)
+    expected = pyogrio.read_info(output)
+
+    assert streamed.batches == expected["features"]
+    assert streamed.geometry_type == expected["geometry_type"]
+    assert streamed.bounds == pytest.approx(list(expected["total_bounds"]))
+
+    read_info = pyogrio.read_info
+    opened: list[str] = []
+
+    def spy(path, *args, **kwargs):
+        opened.append(str(path))
+        return read_info(path, *args, **kwargs)
+
+    monkeypatch.setattr(pyogrio, "read_info", spy)
+    buffered = test_data_dir / "inflight_buffer.gpkg"
+    result = buffer(str(tiny_vector_geojson), buffered, distance=0.1)
+
+    assert str(buffered) not in opened
+    assert result["bounds"] == pytest.approx(list(read_info(buffered)["total_bounds"]))